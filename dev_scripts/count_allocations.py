@@ -0,0 +1,54 @@
+"""Count `Unit` and `Point` allocations while rendering the vtest.
+
+Run from the repository root:
+
+    python dev_scripts/count_allocations.py
+
+The vtest document is built without showing it, then the counts cover
+one render of the document.
+"""
+
+import os
+import runpy
+import sys
+import time
+from collections import Counter
+
+# Make `neoscore` importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from neoscore.core import neoscore
+from neoscore.utils.point import Point
+from neoscore.utils.units import Unit
+
+counts = Counter()
+
+
+def counting_unit_init(self, *args, **kwargs):
+    counts["Unit"] += 1
+    original_unit_init(self, *args, **kwargs)
+
+
+def counting_point_new(cls, *args, **kwargs):
+    counts["Point"] += 1
+    return original_point_new(cls, *args, **kwargs)
+
+
+original_unit_init = Unit.__init__
+original_point_new = Point.__new__
+
+neoscore.show = lambda *args, **kwargs: None
+sys.argv = ["vtest.py"]
+runpy.run_path("vtests/vtest.py")
+
+Unit.__init__ = counting_unit_init
+Point.__new__ = counting_point_new
+start = time.perf_counter()
+neoscore.document._render()
+elapsed = time.perf_counter() - start
+Unit.__init__ = original_unit_init
+Point.__new__ = original_point_new
+
+for name, count in sorted(counts.items()):
+    print(f"{name}: {count}")
+print(f"Render time (including counting overhead): {elapsed * 1000:.1f} ms")
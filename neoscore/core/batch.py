@@ -0,0 +1,174 @@
+"""Render many documents in parallel worker processes.
+
+Each worker process sets up a headless `neoscore` instance once and
+then renders job after job, resetting the global document in between.
+Registered fonts and render caches stay warm across the jobs a worker
+runs.
+
+Since workers are started with the `spawn` method, a job's `build`
+callable must be picklable (typically a module-level function or a
+`functools.partial` of one), and scripts calling `render_batch` should
+guard their entry point with `if __name__ == "__main__":`.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import traceback
+from dataclasses import dataclass
+from time import time
+from typing import Callable, Iterable, Optional
+
+from neoscore.core import neoscore
+from neoscore.core.paper import A4, Paper
+from neoscore.interface.pdf_merging import merge_pdfs
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """A document to be built and exported by `render_batch`."""
+
+    build: Callable[[], None]
+    """A function which populates the global document.
+
+    This is called with no arguments after `neoscore.document` has been
+    replaced with a new empty document.
+    """
+
+    output_path: str
+    """The path to export the document to.
+
+    Paths ending in `.pdf` export every page as a PDF. Paths with a
+    supported image extension export the first page as an image.
+    """
+
+    paper: Paper = A4
+    """The paper to use in the document."""
+
+    dpi: int = 600
+    """The resolution of image exports. This has no effect on PDFs."""
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """The outcome of a `BatchJob`."""
+
+    output_path: str
+
+    seconds: float
+    """The time spent building and exporting the document."""
+
+    error: Optional[str] = None
+    """The formatted traceback if the job failed, otherwise `None`."""
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+def render_batch(
+    jobs: Iterable[BatchJob], processes: Optional[int] = None
+) -> list[BatchResult]:
+    """Build and export documents in a pool of worker processes.
+
+    A failing job does not stop the batch; its traceback is reported
+    in its result instead.
+
+    Args:
+        jobs: The documents to render.
+        processes: The number of worker processes to use.
+            Defaults to `os.cpu_count()`.
+
+    Returns: The result of each job, in the order the jobs were given.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    processes = min(processes or os.cpu_count() or 1, len(jobs))
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes, initializer=_init_worker) as pool:
+        return pool.map(_run_job, jobs, chunksize=1)
+
+
+def render_pdf_in_parallel(job: BatchJob, processes: Optional[int] = None):
+    """Export a single large PDF by rendering its pages in parallel.
+
+    Every worker process builds the full document, then renders one
+    contiguous range of its pages to a partial PDF. The partial files
+    are then concatenated into `job.output_path`.
+
+    Since each worker builds the document independently, `job.build`
+    must be deterministic; for instance, any randomness should be
+    seeded.
+
+    Args:
+        job: The document to render. Its `output_path` must be a PDF path.
+        processes: The number of worker processes, each rendering one
+            range of pages. Defaults to `os.cpu_count()`.
+    """
+    processes = processes or os.cpu_count() or 1
+    shard_dir = tempfile.mkdtemp()
+    try:
+        shards = [
+            _PdfShard(job, i, processes, os.path.join(shard_dir, f"{i}.pdf"))
+            for i in range(processes)
+        ]
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(processes, initializer=_init_worker) as pool:
+            shard_paths = pool.map(_render_pdf_shard, shards, chunksize=1)
+        merge_pdfs([path for path in shard_paths if path], job.output_path)
+    finally:
+        shutil.rmtree(shard_dir, ignore_errors=True)
+
+
+@dataclass(frozen=True)
+class _PdfShard:
+    job: BatchJob
+    index: int
+    count: int
+    path: str
+
+
+def _shard_bounds(page_count: int, index: int, count: int) -> tuple[int, int]:
+    """Find the page range of one of `count` near-equal contiguous shards."""
+    return (page_count * index) // count, (page_count * (index + 1)) // count
+
+
+def _init_worker():
+    neoscore.setup(headless=True)
+
+
+def _run_job(job: BatchJob) -> BatchResult:
+    start_time = time()
+    try:
+        neoscore.reset_document(job.paper)
+        job.build()
+        _export(job)
+    except Exception:
+        return BatchResult(job.output_path, time() - start_time, traceback.format_exc())
+    return BatchResult(job.output_path, time() - start_time)
+
+
+def _render_pdf_shard(shard: _PdfShard) -> Optional[str]:
+    neoscore.reset_document(shard.job.paper)
+    shard.job.build()
+    document = neoscore.document
+    document._render()
+    page_indices = [page.page_index for page in document.pages]
+    start, stop = _shard_bounds(len(page_indices), shard.index, shard.count)
+    if start == stop:
+        return None
+    neoscore._app_interface.render_pdf(page_indices[start:stop], shard.path)
+    return shard.path
+
+
+def _export(job: BatchJob):
+    if os.path.splitext(job.output_path)[1].lower() == ".pdf":
+        neoscore.render_pdf(job.output_path)
+    else:
+        neoscore.render_image(
+            neoscore.document.paper_bounding_rect(0), job.output_path, job.dpi
+        )
@@ -91,6 +91,7 @@ class Chordrest(ObjectGroup, StaffObject):
     @rest.setter
     def rest(self, value):
         self._rest = value
+        self._mark_dirty()
 
     @property
     def accidentals(self):
@@ -133,6 +134,7 @@ class Chordrest(ObjectGroup, StaffObject):
     @duration.setter
     def duration(self, value):
         self._duration = value
+        self._mark_dirty()
 
     @property
     def ledger_line_positions(self) -> list[Unit]:
@@ -277,6 +279,7 @@ class Chordrest(ObjectGroup, StaffObject):
     @stem_direction.setter
     def stem_direction(self, value):
         self._stem_direction_override = value
+        self._mark_dirty()
 
     @property
     def stem_height(self):
@@ -293,16 +296,29 @@ class Chordrest(ObjectGroup, StaffObject):
 
     ######## PRIVATE METHODS ########
 
+    def _pre_render_hook(self):
+        super()._pre_render_hook()
+        # Aux objects are laid out from the noteheads, so any change
+        # inside the chordrest re-renders all of it.
+        if not self._dirty and self._has_dirty_descendant():
+            self._mark_dirty()
+
     def _render(self):
-        if self.accidentals:
-            # If accidentals exist, this has already been rendered, so
-            # reset everything first. This is a huge hack...
-            for note in self.noteheads:
-                note.x = self.staff.unit(0)
-            self._accidentals.clear()
-            self._ledgers.clear()
-            self._stem = None
+        # Aux objects are regenerated on every render, so reset
+        # anything left over from a previous one first.
+        for note in self.noteheads:
+            note.x = self.staff.unit(0)
+        for aux_object in [*self._accidentals, *self._ledgers, *self._dots]:
+            aux_object.remove()
+        self._accidentals.clear()
+        self._ledgers.clear()
+        self._dots.clear()
+        if self._flag:
+            self._flag.remove()
             self._flag = None
+        if self._stem:
+            self._stem.remove()
+            self._stem = None
         if self.noteheads:
             # Chord-specific aux objects
             self._position_noteheads_horizontally()
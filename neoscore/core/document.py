@@ -1,6 +1,7 @@
 from collections.abc import Callable
 
 from neoscore import constants
+from neoscore.core.mapping import position_cache
 from neoscore.core.page_supplier import PageSupplier
 from neoscore.core.paper import Paper
 from neoscore.utils.point import Point
@@ -83,14 +84,22 @@ class Document:
                 func(grob)
 
     def _render(self):
-        """Render all items in the document.
+        """Render all items in the document which have changed.
+
+        Only dirty subtrees are re-rendered; objects which have not
+        changed since the previous render keep their existing
+        interfaces and scene items.
+
+        Object positions are memoized for the duration of the render
+        (see `mapping.position_cache`).
 
         Returns: None
         """
-        self._run_on_all_grobs(lambda g: g._pre_render_hook())
-        for page in self.pages:
-            page._render()
-        self._run_on_all_grobs(lambda g: g._post_render_hook())
+        with position_cache():
+            self._run_on_all_grobs(lambda g: g._pre_render_hook())
+            for page in self.pages:
+                page._render_incremental()
+            self._run_on_all_grobs(lambda g: g._post_render_hook())
 
     ######## PUBLIC METHODS ########
 
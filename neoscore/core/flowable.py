@@ -1,3 +1,5 @@
+from bisect import bisect_right
+
 from neoscore.core import neoscore
 from neoscore.core.invisible_object import InvisibleObject
 from neoscore.core.layout_controller import LayoutController
@@ -51,7 +53,7 @@ class Flowable(InvisibleObject):
         self._height = height
         self._y_padding = y_padding
         self._break_threshold = break_threshold
-        self._layout_controllers = self._generate_layout_controllers()
+        self.layout_controllers = self._generate_layout_controllers()
 
     ######## PUBLIC PROPERTIES ########
 
@@ -96,12 +98,27 @@ class Flowable(InvisibleObject):
 
     @property
     def layout_controllers(self) -> list[LayoutController]:
-        """Controllers affecting flowable layout"""
+        """Controllers affecting flowable layout
+
+        These must be sorted by ascending `flowable_x`. Line lookups
+        are indexed when this is set, so changes to layout should be
+        made by assigning a new list rather than mutating this one.
+        """
         return self._layout_controllers
 
     @layout_controllers.setter
     def layout_controllers(self, value: list[LayoutController]):
         self._layout_controllers = value
+        # Index line start positions for `last_break_index_at`
+        self._line_start_xs = [
+            controller.flowable_x.base_value for controller in value
+        ]
+        if value:
+            last_line = value[-1]
+            self._line_end_x = (last_line.flowable_x + last_line.length).base_value
+        else:
+            self._line_end_x = 0
+        self._mark_dirty()
 
     def _generate_layout_controllers(self) -> list[NewLine]:
         """Generate automatic layout controllers.
@@ -166,7 +183,12 @@ class Flowable(InvisibleObject):
         """
         line = self.last_break_at(local_point.x)
         line_canvas_pos = canvas_pos_of(line)
-        return line_canvas_pos + Point(local_point.x - line.flowable_x, local_point.y)
+        line_x = line_canvas_pos.x
+        line_y = line_canvas_pos.y
+        # Add in base units, creating units only for the result
+        x = line_x.base_value + (local_point.x.base_value - line.flowable_x.base_value)
+        y = line_y.base_value + local_point.y.base_value
+        return Point(type(line_x).from_base_value(x), type(line_y).from_base_value(y))
 
     def dist_to_line_start(self, flowable_x: Unit) -> Unit:
         """Find the distance of an x-pos to the left edge of its laid-out line.
@@ -174,8 +196,7 @@ class Flowable(InvisibleObject):
         Args:
             flowable_x: An x-axis location in the virtual flowable space.
         """
-        line_start = self.last_break_at(flowable_x)
-        return flowable_x - line_start.flowable_x
+        return type(flowable_x).from_base_value(self.line_offsets_at(flowable_x)[1])
 
     def dist_to_line_end(self, flowable_x: Unit) -> Unit:
         """Find the distance of an x-pos to the right edge of its laid-out line.
@@ -183,13 +204,30 @@ class Flowable(InvisibleObject):
         Args:
             flowable_x: An x-axis location in the virtual flowable space.
         """
-        return self.dist_to_line_start(flowable_x) - neoscore.document.paper.live_width
+        return type(flowable_x).from_base_value(self.line_offsets_at(flowable_x)[2])
+
+    def line_offsets_at(self, flowable_x: Unit) -> tuple[int, float, float]:
+        """Find the line containing an x-pos and the x-pos's offsets from its edges.
+
+        This combines `last_break_index_at`, `dist_to_line_start`, and
+        `dist_to_line_end` without creating units, for use while rendering.
+
+        Args:
+            flowable_x: An x-axis location in the virtual flowable space.
+
+        Returns: The index of the line in `layout_controllers`, and the
+            distances from its left and right edges to `flowable_x`, in
+            base units.
+        """
+        line_index = self.last_break_index_at(flowable_x)
+        line_start_x = self.layout_controllers[line_index].flowable_x
+        dist_to_start = flowable_x.base_value - line_start_x.base_value
+        dist_to_end = dist_to_start - neoscore.document.paper.live_width.base_value
+        return line_index, dist_to_start, dist_to_end
 
     def last_break_at(self, flowable_x: Unit) -> NewLine:
         """Find the last `NewLine` that occurred before a given local flowable_x-pos
 
-        The result of this function will be accurate within `Unit(1)`
-
         Args:
             flowable_x: An x-axis location in the virtual flowable space.
         """
@@ -198,21 +236,16 @@ class Flowable(InvisibleObject):
     def last_break_index_at(self, flowable_x: Unit) -> int:
         """Like `last_break_at`, but returns an index.
 
-        The result of this function will be accurate within `Unit(1)`
-
         Args:
             flowable_x: An x-axis location in the virtual flowable space.
         """
         # Note that this assumes that all layout controllers are line
         # breaks, and will not work if/when other types are added
-        remaining_x = flowable_x
-        for i, controller in enumerate(self.layout_controllers):
-            remaining_x -= controller.length
-            # Allow error of Unit(1) to compensate for repeated subtraction
-            # rounding errors.
-            if remaining_x.base_value < -1:
-                return i
-        else:
+        x = flowable_x.base_value
+        if x >= self._line_end_x:
             raise OutOfBoundsError(
                 "flowable_x={} lies outside of this Flowable".format(flowable_x)
             )
+        # Positions before the flowable start are treated as being in
+        # the first line.
+        return max(bisect_right(self._line_start_xs, x) - 1, 0)
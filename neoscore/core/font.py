@@ -34,7 +34,7 @@ class Font:
         self._size = size if isinstance(size, Unit) else GraphicUnit(size)
         self._weight = weight
         self._italic = italic
-        self._interface = FontInterface(
+        self._interface = FontInterface.shared(
             self.family_name, self.size, self.weight, self.italic
         )
 
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 from abc import ABC
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING, Optional, Type
 
-from neoscore.core import neoscore
+from neoscore.core import mapping, neoscore
 from neoscore.core.brush import DEFAULT_BRUSH, Brush, SimpleBrushDef, brush_from_simple_def
 from neoscore.core.mapping import canvas_pos_of, descendant_pos, first_ancestor_with_attr
 from neoscore.core.pen import DEFAULT_PEN, Pen, SimplePenDef, pen_from_simple_def
+from neoscore.interface.brush_interface import BrushInterface
 from neoscore.interface.graphic_object_interface import GraphicObjectInterface
+from neoscore.interface.pen_interface import PenInterface
 from neoscore.utils.point import Point, PointDef
 from neoscore.utils.units import ZERO, Unit
 
@@ -39,8 +41,23 @@ class GraphicObject(ABC):
     To place objects directly in the scene on pages other than the first,
     simply set the parent to the desired page, accessed through the
     global document with `neoscore.document.pages[n]`
+
+    Rendering is incremental. Objects are created dirty, and setting
+    any of `pos`, `parent`, `pen`, or `brush` marks the object and all
+    its descendants dirty again. Modifying an object's pen or brush in
+    place is treated the same way. Each render pass only re-renders
+    dirty subtrees; all other objects keep their existing interfaces.
+
+    Subclasses which frequently search their subtree by type may set
+    `_indexes_descendants` to `True`. Such objects keep an index of
+    their descendants by exact class, updated as objects are attached
+    to and detached from the subtree, so that typed descendant searches
+    only visit matching objects. Results are still given in the same
+    order as `descendants`.
     """
 
+    _indexes_descendants: bool = False
+
     def __init__(
         self,
         pos: PointDef,
@@ -60,13 +77,24 @@ class GraphicObject(ABC):
             brush: The brush to draw outlines with.
             parent: The parent object or None
         """
+        self._dirty = True
+        self._rendered_pen_interface: Optional[PenInterface] = None
+        self._rendered_brush_interface: Optional[BrushInterface] = None
+        self._children: list[GraphicObject] = []
+        self._interfaces = []
+        self._previous_interfaces = []
+        self._descendant_index: Optional[dict[type, list[GraphicObject]]] = (
+            {} if self._indexes_descendants else None
+        )
+        # Types whose index entries may be out of tree order
+        self._unordered_index_types: Optional[set[type]] = (
+            set() if self._indexes_descendants else None
+        )
         self.pos = pos
         self._length = length
         self.pen = pen
         self.brush = brush
-        self._children: list[GraphicObject] = []
         self.parent = parent
-        self._interfaces = []
 
     ######## PUBLIC PROPERTIES ########
 
@@ -93,6 +121,8 @@ class GraphicObject(ABC):
     @pos.setter
     def pos(self, value: PointDef):
         self._pos = Point.from_def(value)
+        mapping.invalidate_position_cache()
+        self._mark_dirty()
 
     @property
     def x(self) -> Unit:
@@ -131,6 +161,7 @@ class GraphicObject(ABC):
             self._pen = pen_from_simple_def(value)
         else:
             self._pen = Pen.from_existing(DEFAULT_PEN)
+        self._mark_dirty()
 
     @property
     def brush(self) -> Brush:
@@ -155,6 +186,7 @@ class GraphicObject(ABC):
                 raise TypeError
         else:
             self._brush = Brush.from_existing(DEFAULT_BRUSH)
+        self._mark_dirty()
 
     @property
     def parent(self) -> Parent:
@@ -173,11 +205,14 @@ class GraphicObject(ABC):
             and isinstance(self._parent, GraphicObject)
         ):
             self._parent._unregister_child(self)
+            self._parent._mark_dirty()
         if value is None:
             value = neoscore.document.pages[0]
         self._parent = value
         if isinstance(self._parent, GraphicObject):
             self._parent._register_child(self)
+        mapping.invalidate_position_cache()
+        self._mark_dirty()
 
     @property
     def children(self) -> list[GraphicObject]:
@@ -187,21 +222,24 @@ class GraphicObject(ABC):
     @children.setter
     def children(self, value: list[GraphicObject]):
         self._children = value
+        for indexer in self._descendant_indexers():
+            indexer._rebuild_descendant_index()
 
     @property
     def descendants(self) -> Iterator[GraphicObject]:
         """All of the objects in the children subtree.
 
-        This recursively searches all of the object's children
-        (and their children, etc.) and provides an iterator over them.
+        This searches all of the object's children (and their children,
+        etc.) in depth-first pre-order and provides an iterator over them.
 
-        The current implementation performs a simple recursive DFS over
-        the tree, and has the potential to be rather slow.
+        The search uses an explicit stack, so arbitrarily deep trees
+        are supported.
         """
-        for child in self.children:
-            for subchild in child.children:
-                yield subchild
-            yield child
+        stack = list(reversed(self.children))
+        while stack:
+            descendant = stack.pop()
+            yield descendant
+            stack.extend(reversed(descendant.children))
 
     @property
     def flowable(self) -> Optional[Flowable]:
@@ -220,6 +258,13 @@ class GraphicObject(ABC):
 
         Yields: GraphicObject
         """
+        if self._descendant_index is not None:
+            yield from self._merge_indexed(
+                self._indexed_descendants(cls)
+                for cls in list(self._descendant_index)
+                if issubclass(cls, graphic_object_class)
+            )
+            return
         for descendant in self.descendants:
             if isinstance(descendant, graphic_object_class):
                 yield descendant
@@ -232,6 +277,9 @@ class GraphicObject(ABC):
 
         Yields: GraphicObject
         """
+        if self._descendant_index is not None:
+            yield from self._indexed_descendants(graphic_object_class)
+            return
         for descendant in self.descendants:
             if type(descendant) == graphic_object_class:
                 yield descendant
@@ -241,8 +289,28 @@ class GraphicObject(ABC):
 
         This is useful for searching descendants for duck-typing matches.
 
+        On objects which index their descendants, classes defining the
+        attribute (for instance as a property) are matched wholesale;
+        only instances of other classes are checked individually.
+
         Yields: GraphicObject
         """
+        if self._descendant_index is not None:
+            matches = []
+            for cls, descendants in list(self._descendant_index.items()):
+                if hasattr(cls, attribute):
+                    matches.append(self._indexed_descendants(cls))
+                    continue
+                found = [
+                    descendant
+                    for descendant in descendants
+                    if hasattr(descendant, attribute)
+                ]
+                if found and cls in self._unordered_index_types:
+                    found.sort(key=self._tree_order_key)
+                matches.append(found)
+            yield from self._merge_indexed(matches)
+            return
         for descendant in self.descendants:
             if hasattr(descendant, attribute):
                 yield descendant
@@ -250,7 +318,12 @@ class GraphicObject(ABC):
     def remove(self):
         """Remove this object from the document."""
         if self.parent:
-            self.parent.children.remove(self)
+            self._remove_interfaces()
+            if isinstance(self.parent, GraphicObject):
+                self.parent._unregister_child(self)
+                self.parent._mark_dirty()
+            else:
+                self.parent.children.remove(self)
 
     ######## PRIVATE METHODS ########
 
@@ -283,6 +356,127 @@ class GraphicObject(ABC):
         for child in self.children:
             child._render()
 
+    def _render_incremental(self):
+        """Re-render every dirty subtree in this object's tree.
+
+        If this object is dirty, or its pen or brush was modified in
+        place since it was last rendered, the whole subtree is rendered
+        again. Interfaces from the previous render are set aside first
+        so the new ones can take over their Qt objects (see
+        `_render_interface`); any left unclaimed afterward are removed
+        from the scene. Otherwise, the search continues into its
+        children.
+
+        Returns: None
+        """
+        if self._dirty or self._pen_or_brush_changed():
+            self._stash_interfaces()
+            self._render()
+            self._remove_stashed_interfaces()
+            self._mark_clean()
+        else:
+            for child in self.children:
+                child._render_incremental()
+
+    def _mark_dirty(self):
+        """Mark this object and all its descendants as needing re-rendering.
+
+        Since dirty objects always re-render their entire subtree,
+        every descendant of a dirty object is dirty as well, so this
+        can stop early when it finds the object is already dirty.
+
+        Returns: None
+        """
+        if self._dirty:
+            return
+        self._dirty = True
+        for child in self.children:
+            child._mark_dirty()
+
+    def _mark_clean(self):
+        """Mark this object and all its descendants as freshly rendered.
+
+        Returns: None
+        """
+        self._dirty = False
+        self._rendered_pen_interface = self._pen.interface
+        self._rendered_brush_interface = self._brush.interface
+        for child in self.children:
+            child._mark_clean()
+
+    def _pen_or_brush_changed(self) -> bool:
+        """Whether this object's pen or brush changed since it was rendered.
+
+        Pens and brushes regenerate their interfaces whenever they are
+        modified, so in-place changes like `obj.pen.thickness = Mm(1)`
+        are found by checking the interfaces' identity.
+        """
+        return (
+            self._pen.interface is not self._rendered_pen_interface
+            or self._brush.interface is not self._rendered_brush_interface
+        )
+
+    def _has_dirty_descendant(self) -> bool:
+        """Whether any object in this object's subtree is dirty."""
+        return any(
+            child._dirty or child._has_dirty_descendant() for child in self.children
+        )
+
+    def _render_interface(self, interface: GraphicObjectInterface):
+        """Render an interface for a slice of this object and store it.
+
+        Slices are matched to the previous render's interfaces by
+        their order in `self.interfaces`. If the slice existed before,
+        its Qt object is updated in place rather than recreated,
+        allowing Qt to keep its cached rendering of the item.
+
+        Returns: None
+        """
+        slice_index = len(self._interfaces)
+        if slice_index < len(self._previous_interfaces):
+            interface.render(self._previous_interfaces[slice_index])
+        else:
+            interface.render()
+        self._interfaces.append(interface)
+
+    def _stash_interfaces(self):
+        """Set aside the interfaces of this object and all its descendants.
+
+        The stashed interfaces are reused by `_render_interface` and
+        cleaned up by `_remove_stashed_interfaces`.
+
+        Returns: None
+        """
+        self._previous_interfaces = self._interfaces
+        self._interfaces = []
+        for child in self.children:
+            child._stash_interfaces()
+
+    def _remove_stashed_interfaces(self):
+        """Remove stashed interfaces whose Qt objects were not reused.
+
+        Returns: None
+        """
+        for interface in self._previous_interfaces:
+            interface.remove()
+        self._previous_interfaces = []
+        for child in self.children:
+            child._remove_stashed_interfaces()
+
+    def _remove_interfaces(self):
+        """Remove the interfaces of this object and all its descendants.
+
+        Any scene items created by the interfaces are removed too.
+
+        Returns: None
+        """
+        for interface in self._interfaces + self._previous_interfaces:
+            interface.remove()
+        self._interfaces.clear()
+        self._previous_interfaces = []
+        for child in self.children:
+            child._remove_interfaces()
+
     def _register_child(self, child: GraphicObject):
         """Add an object to `self.children`.
 
@@ -292,6 +486,8 @@ class GraphicObject(ABC):
         Returns: None
         """
         self.children.append(child)
+        for indexer in self._descendant_indexers():
+            indexer._index_subtree(child)
 
     def _unregister_child(self, child: GraphicObject):
         """Remove an object from `self.children`.
@@ -302,6 +498,104 @@ class GraphicObject(ABC):
         Returns: None
         """
         self.children.remove(child)
+        for indexer in self._descendant_indexers():
+            indexer._unindex_subtree(child)
+
+    def _descendant_indexers(self) -> list[GraphicObject]:
+        """Find `self` and any ancestors which index their descendants."""
+        indexers = []
+        current = self
+        while isinstance(current, GraphicObject):
+            if current._descendant_index is not None:
+                indexers.append(current)
+            current = current.parent if hasattr(current, "_parent") else None
+        return indexers
+
+    def _index_subtree(self, root: GraphicObject):
+        """Add `root` and all its descendants to the descendant index.
+
+        Entries are appended, which keeps them in tree order when the
+        subtree is the last one in this object's tree. Otherwise the
+        types already present in the index are flagged to be sorted
+        when next searched (see `_indexed_descendants`).
+        """
+        index = self._descendant_index
+        at_end = self._is_last_in_tree(root)
+        for obj in (root, *root.descendants):
+            entries = index.setdefault(type(obj), [])
+            if entries and not at_end:
+                self._unordered_index_types.add(type(obj))
+            entries.append(obj)
+
+    def _unindex_subtree(self, root: GraphicObject):
+        """Remove `root` and all its descendants from the descendant index."""
+        index = self._descendant_index
+        for obj in (root, *root.descendants):
+            entries = index.get(type(obj))
+            if entries is None:
+                continue
+            try:
+                entries.remove(obj)
+            except ValueError:
+                continue
+            if not entries:
+                del index[type(obj)]
+                self._unordered_index_types.discard(type(obj))
+
+    def _rebuild_descendant_index(self):
+        """Rebuild the descendant index from scratch."""
+        index = {}
+        for descendant in self.descendants:
+            index.setdefault(type(descendant), []).append(descendant)
+        self._descendant_index = index
+        self._unordered_index_types.clear()
+
+    def _indexed_descendants(self, cls: type) -> list[GraphicObject]:
+        """Get a copy of the index entries of a class, in tree order."""
+        entries = self._descendant_index.get(cls)
+        if entries is None:
+            return []
+        if cls in self._unordered_index_types:
+            entries.sort(key=self._tree_order_key)
+            self._unordered_index_types.discard(cls)
+        return list(entries)
+
+    def _merge_indexed(
+        self, entry_lists: Iterable[list[GraphicObject]]
+    ) -> list[GraphicObject]:
+        """Merge lists of indexed descendants, each in tree order."""
+        nonempty = [entries for entries in entry_lists if entries]
+        if len(nonempty) == 1:
+            return nonempty[0]
+        return sorted(
+            (entry for entries in nonempty for entry in entries),
+            key=self._tree_order_key,
+        )
+
+    def _tree_order_key(self, descendant: GraphicObject) -> list[int]:
+        """Find a sort key giving a descendant's place in `descendants`.
+
+        This is the list of child indexes leading from this object to
+        the descendant.
+        """
+        key = []
+        current = descendant
+        while current is not self:
+            parent = current.parent
+            key.append(parent.children.index(current))
+            current = parent
+        key.reverse()
+        return key
+
+    def _is_last_in_tree(self, descendant: GraphicObject) -> bool:
+        """Whether a descendant's subtree comes last in `descendants`."""
+        current = descendant
+        while current is not self:
+            parent = current.parent
+            if parent.children[-1] is not current:
+                return False
+            current = parent
+        return True
 
     def _render_in_flowable(self):
         """Render the object to the scene, dispatching partial rendering calls
@@ -309,59 +603,78 @@ class GraphicObject(ABC):
 
         Returns: None
         """
+        # Line geometry is worked out in plain base unit floats, and only
+        # `Unit`s passed to the rendering methods are created. Comparisons
+        # use the same tolerance as `Unit`'s. Each created unit has the
+        # type the equivalent `Unit` arithmetic would give it.
+        flowable = self.flowable
         # Calculate position within flowable
-        pos_in_flowable = descendant_pos(self, self.flowable)
-
-        remaining_x = self.length + self.flowable.dist_to_line_end(pos_in_flowable.x)
-        if remaining_x < ZERO:
+        pos_in_flowable = descendant_pos(self, flowable)
+        local_x = pos_in_flowable.x
+        local_x_type = type(local_x)
+        length = self.length
+        length_type = type(length)
+        layout_controllers = flowable.layout_controllers
+        first_line_i, dist_to_line_start, dist_to_line_end = flowable.line_offsets_at(
+            local_x
+        )
+        remaining_x = length.base_value + dist_to_line_end
+        if remaining_x < Unit._CMP_NEG_EPSILON:
             self._render_complete(
                 canvas_pos_of(self),
-                self.flowable.dist_to_line_start(pos_in_flowable.x),
-                pos_in_flowable.x,
+                local_x_type.from_base_value(dist_to_line_start),
+                local_x,
             )
             return
 
         # Render before break
-        first_line_i = self.flowable.last_break_index_at(pos_in_flowable.x)
-        current_line = self.flowable.layout_controllers[first_line_i]
+        current_line = layout_controllers[first_line_i]
         render_start_pos = canvas_pos_of(self)
-        first_line_length = self.flowable.dist_to_line_end(pos_in_flowable.x) * -1
+        start_x = render_start_pos.x
         render_end_pos = Point(
-            render_start_pos.x + first_line_length, render_start_pos.y
+            type(start_x).from_base_value(start_x.base_value - dist_to_line_end),
+            render_start_pos.y,
         )
         self._render_before_break(
-            pos_in_flowable.x,
+            local_x,
             render_start_pos,
             render_end_pos,
-            self.flowable.dist_to_line_start(pos_in_flowable.x),
+            local_x_type.from_base_value(dist_to_line_start),
         )
 
         # Iterate through remaining length
-        for current_line_i in range(
-            first_line_i + 1, len(self.flowable.layout_controllers)
-        ):
-            current_line = self.flowable.layout_controllers[current_line_i]
-            if remaining_x > current_line.length:
+        for current_line_i in range(first_line_i + 1, len(layout_controllers)):
+            current_line = layout_controllers[current_line_i]
+            line_length = current_line.length
+            if remaining_x - line_length.base_value > Unit._CMP_POS_EPSILON:
                 # Render spanning continuation
                 line_pos = canvas_pos_of(current_line)
                 render_start_pos = Point(line_pos.x, line_pos.y + pos_in_flowable.y)
                 render_end_pos = Point(
-                    render_start_pos.x + current_line.length, render_start_pos.y
+                    render_start_pos.x + line_length, render_start_pos.y
                 )
                 self._render_spanning_continuation(
-                    self.length - remaining_x, render_start_pos, render_end_pos
+                    length_type.from_base_value(length.base_value - remaining_x),
+                    render_start_pos,
+                    render_end_pos,
                 )
-                remaining_x -= current_line.length
+                remaining_x -= line_length.base_value
             else:
                 break
 
         # Render end
-        render_start_pos = self.flowable.map_to_canvas(
+        render_start_pos = flowable.map_to_canvas(
             Point(current_line.flowable_x, pos_in_flowable.y)
         )
-        render_end_pos = Point(render_start_pos.x + remaining_x, render_start_pos.y)
+        start_x = render_start_pos.x
+        render_end_pos = Point(
+            type(start_x).from_base_value(start_x.base_value + remaining_x),
+            render_start_pos.y,
+        )
         self._render_after_break(
-            self.length - remaining_x, render_start_pos, render_end_pos
+            length_type.from_base_value(length.base_value - remaining_x),
+            render_start_pos,
+            render_end_pos,
         )
 
     def _render_complete(
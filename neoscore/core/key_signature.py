@@ -1,7 +1,7 @@
 from typing import Union
 
 from neoscore.core.accidental import Accidental
-from neoscore.core.mapping import map_between
+from neoscore.core.mapping import map_between_x
 from neoscore.core.music_text import MusicText
 from neoscore.core.object_group import ObjectGroup
 from neoscore.core.staff import Staff
@@ -155,9 +155,6 @@ class _KeySignatureAccidental(MusicText, StaffObject):
     def length(self):
         return self._length
 
-    def _padded_clef_width(self, clef):
-        return clef.bounding_rect.width + self.staff.unit(0.5)
-
     def _render_occurrence(self, pos: Point, local_start_x: Unit, shift_for_clef: bool):
         """Render one appearance of one key signature accidental.
 
@@ -169,8 +166,8 @@ class _KeySignatureAccidental(MusicText, StaffObject):
         work.
 
         """
-        staff_pos_in_flowable = map_between(self.flowable, self.staff)
-        pos_x_in_staff = local_start_x - staff_pos_in_flowable.x
+        staff_x_in_flowable = map_between_x(self.flowable, self.staff)
+        pos_x_in_staff = local_start_x - staff_x_in_flowable
         clef = self.staff.active_clef_at(pos_x_in_staff)
         if clef is None:
             return
@@ -178,11 +175,19 @@ class _KeySignatureAccidental(MusicText, StaffObject):
         pos_tuple = _KeySignatureAccidental.positions[self.accidental_type][clef_type][
             self.pitch_letter
         ]
-        visual_pos_x = self.staff.unit(pos_tuple[0]) + pos.x
-        visual_pos_y = self.staff.unit(pos_tuple[1]) + pos.y
+        # Position in base unit floats, creating units only for the result
+        unit = self.staff.unit
+        rate = unit.CONVERSION_RATE
+        visual_pos_x = (pos_tuple[0] * rate) + pos.x.base_value
+        visual_pos_y = (pos_tuple[1] * rate) + pos.y.base_value
         if shift_for_clef:
-            visual_pos_x += self._padded_clef_width(clef)
-        self._render_slice(Point(visual_pos_x, visual_pos_y))
+            visual_pos_x += clef.bounding_rect.width.base_value + (0.5 * rate)
+        self._render_slice(
+            Point(
+                unit.from_base_value(visual_pos_x),
+                unit.from_base_value(visual_pos_y),
+            )
+        )
 
     def _render_complete(self, pos, dist_to_line_start=None, local_start_x=None):
         self._render_occurrence(pos, local_start_x, False)
@@ -1,8 +1,19 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Iterator, Optional, Protocol, Type, Union, cast
-
-from neoscore.utils.point import ORIGIN, Point
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Type,
+    Union,
+    cast,
+)
+
+from neoscore.utils.point import ORIGIN, Point, PointAccumulator
 from neoscore.utils.units import Unit
 
 if TYPE_CHECKING:
@@ -22,6 +33,116 @@ class Positioned(Protocol):
         ...
 
 
+class _CachedPosition(NamedTuple):
+    generation: int
+    """The cache generation this entry was computed in"""
+
+    flowable: Optional[Positioned]
+    """The object's nearest `Flowable` ancestor, if any"""
+
+    pos: PointAccumulator
+    """The object's position relative to `flowable`, or the document if None"""
+
+    root: Parent
+    """The root of the object's tree, typically the global document"""
+
+    root_pos: PointAccumulator
+    """The object's logical position relative to `root`"""
+
+
+_cache_generation = 0
+"""The current position cache generation, or 0 if caching is disabled."""
+
+_last_cache_generation = 0
+
+
+@contextmanager
+def position_cache():
+    """Memoize object positions for the duration of a block.
+
+    Within this block, each object's position relative to its nearest
+    `Flowable` (or the document root) and its logical position relative
+    to the document root are remembered, each computed from its
+    parent's memoized positions in constant time. Since objects are
+    rendered top-down, this makes `canvas_pos_of` O(1) per object
+    during a render pass, and reduces `map_between` to a subtraction
+    of two memoized positions.
+
+    The cache is invalidated whenever any object's position or parent
+    changes (see `invalidate_position_cache`), and is discarded when
+    the block exits.
+
+    This is used by `Document._render`.
+    """
+    global _cache_generation
+    previous_generation = _cache_generation
+    _start_new_cache_generation()
+    try:
+        yield
+    finally:
+        _cache_generation = previous_generation
+
+
+def invalidate_position_cache():
+    """Discard all memoized positions, if a `position_cache` is active.
+
+    This must be called whenever an object's position or parent changes.
+    """
+    if _cache_generation:
+        _start_new_cache_generation()
+
+
+def _start_new_cache_generation():
+    global _cache_generation
+    global _last_cache_generation
+    _last_cache_generation += 1
+    _cache_generation = _last_cache_generation
+
+
+def _cached_position(obj: Positioned) -> _CachedPosition:
+    """Get the memoized position of an object, computing it if needed.
+
+    This should only be called while a `position_cache` is active.
+
+    Positions are kept as `PointAccumulator`s, which must not be
+    modified once stored, so units are only created for positions
+    which are actually read.
+    """
+    entry = getattr(obj, "_cached_position", None)
+    if entry is not None and entry.generation == _cache_generation:
+        return entry
+    parent = obj.parent
+    if not hasattr(parent, "parent"):
+        # Parent is the document root
+        pos = PointAccumulator(obj.pos)
+        entry = _CachedPosition(_cache_generation, None, pos, parent, pos)
+    else:
+        parent_entry = _cached_position(parent)
+        root_pos = parent_entry.root_pos.copy()
+        root_pos.add(obj.pos)
+        if hasattr(parent, "map_to_canvas"):
+            # Parent appears to be a flowable
+            entry = _CachedPosition(
+                _cache_generation,
+                parent,
+                PointAccumulator(obj.pos),
+                parent_entry.root,
+                root_pos,
+            )
+        else:
+            pos = parent_entry.pos.copy()
+            pos.add(obj.pos)
+            entry = _CachedPosition(
+                _cache_generation,
+                parent_entry.flowable,
+                pos,
+                parent_entry.root,
+                root_pos,
+            )
+    cast(Any, obj)._cached_position = entry
+    return entry
+
+
 def ancestors(obj: Positioned) -> Iterator[Positioned]:
     """All ancestors of this object.
 
@@ -61,20 +182,26 @@ def map_between(src: Positioned, dst: Positioned) -> Point:
         return dst.pos
     if src.parent == dst:
         return -src.pos
+    if _cache_generation and hasattr(src, "parent") and hasattr(dst, "parent"):
+        src_entry = _cached_position(src)
+        dst_entry = _cached_position(dst)
+        if src_entry.root is not dst_entry.root:
+            raise ValueError(f"{src} and {dst} have no common ancestor")
+        return dst_entry.root_pos.difference(src_entry.root_pos)
     # Start by collecting all ancestor using IDs because they're hashable
     src_ancestor_ids = set(id(grob) for grob in ancestors(src))
-    relative_dst_pos = dst.pos
+    relative_dst_pos = PointAccumulator(dst.pos)
     for dst_ancestor in ancestors(dst):
         if hasattr(dst_ancestor, "parent"):
-            relative_dst_pos += dst_ancestor.pos
+            relative_dst_pos.add(dst_ancestor.pos)
         if id(dst_ancestor) in src_ancestor_ids:
             # Now find relative_src_pos and return relative_dst_pos - relative_src_pos
-            relative_src_pos = src.pos
+            relative_src_pos = PointAccumulator(src.pos)
             for src_ancestor in ancestors(src):
                 if hasattr(src_ancestor, "parent"):
-                    relative_src_pos += src_ancestor.pos
+                    relative_src_pos.add(src_ancestor.pos)
                 if src_ancestor == dst_ancestor:
-                    return relative_dst_pos - relative_src_pos
+                    return relative_dst_pos.difference(relative_src_pos)
             # Since we've already determined there is a common
             # ancestor, this should never happen
             assert False, "Unreachable"
@@ -92,11 +219,15 @@ def descendant_pos(descendant: Positioned, ancestor: Positioned) -> Point:
     Raises:
         ValueError: If `ancestor` is not an ancestor of `descendant`
     """
-    pos = descendant.pos
+    if _cache_generation:
+        entry = _cached_position(descendant)
+        if entry.flowable is ancestor:
+            return entry.pos.to_point()
+    pos = PointAccumulator(descendant.pos)
     for parent in ancestors(descendant):
         if parent == ancestor:
-            return pos
-        pos += parent.pos
+            return pos.to_point()
+        pos.add(parent.pos)
     raise ValueError(f"{ancestor} is not an ancestor of {descendant}")
 
 
@@ -109,10 +240,11 @@ def descendant_pos_x(descendant: Positioned, ancestor: Positioned) -> Unit:
         ValueError: If `ancestor` is not an ancestor of `descendant`
     """
     pos_x = descendant.pos.x
+    base_x = pos_x.base_value
     for parent in ancestors(descendant):
         if parent == ancestor:
-            return pos_x
-        pos_x += parent.pos.x
+            return type(pos_x).from_base_value(base_x)
+        base_x += parent.pos.x.base_value
     raise ValueError(f"{ancestor} is not an ancestor of {descendant}")
 
 
@@ -124,16 +256,21 @@ def canvas_pos_of(grob: Positioned) -> Point:
 
     Returns: The object's paged position relative to the document.
     """
-    pos = ORIGIN
+    if _cache_generation and hasattr(grob, "parent"):
+        entry = _cached_position(grob)
+        if entry.flowable is not None:
+            return cast(Any, entry.flowable).map_to_canvas(entry.pos.to_point())
+        return entry.pos.to_point()
+    pos = PointAccumulator(ORIGIN)
     current = grob
     while hasattr(current, "parent"):
-        pos += current.pos
+        pos.add(current.pos)
         current = current.parent
         if hasattr(current, "map_to_canvas"):
             # Parent appears to be a flowable,
             # so let it decide where the point goes.
-            return cast(Any, current).map_to_canvas(pos)
-    return pos
+            return cast(Any, current).map_to_canvas(pos.to_point())
+    return pos.to_point()
 
 
 # this doesn't really belong here...
@@ -47,8 +47,6 @@ class MusicChar:
     @property
     def bounding_rect(self):
         """Rect: The glyph bounding box."""
-        x = self.glyph_info["glyphBBox"]["bBoxSW"][0]
-        y = self.glyph_info["glyphBBox"]["bBoxNE"][1]
-        w = self.glyph_info["glyphBBox"]["bBoxNE"][0] - x
-        h = (self.glyph_info["glyphBBox"]["bBoxSW"][1] - y) * -1
-        return Rect(x, y, w, h)
+        x, y, w, h = self.font.glyph_bounds(self.glyph_name, self.alternate_number)
+        unit = self.font.unit
+        return Rect(unit(x), unit(y), unit(w), unit(h))
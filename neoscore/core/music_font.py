@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import copy
-from typing import Dict, Optional, Type
+from typing import Any, Dict, Optional, Type
 
 from neoscore.core import neoscore
 from neoscore.core.font import Font
@@ -11,7 +10,7 @@ from neoscore.utils.exceptions import (
     MusicFontMetadataNotFoundError,
 )
 from neoscore.utils.platforms import PlatformType, current_platform
-from neoscore.utils.units import Unit, convert_all_to_unit
+from neoscore.utils.units import Unit
 
 # TODO LOW make a nice __repr__
 
@@ -38,11 +37,13 @@ class MusicFont(Font):
             self.metadata = neoscore.registered_music_fonts[family_name]
         except KeyError:
             raise MusicFontMetadataNotFoundError
-        self._engraving_defaults = copy.deepcopy(self.metadata["engravingDefaults"])
+        # engraving_defaults is small, so eagerly converting it to self.unit is ok
+        self._engraving_defaults = _copy_to_unit(
+            self.metadata["engravingDefaults"], unit
+        )
         self._em_size = self.unit(self.__magic_em_scale)
+        self._glyph_table = _glyph_table(family_name, self.metadata)
         self._glyph_info_cache = {}
-        # engraving_defaults is small, so eagerly converting it to self.unit is ok
-        convert_all_to_unit(self._engraving_defaults, self.unit)
         super().__init__(family_name, self._em_size, 1, False)
 
     ######## PUBLIC PROPERTIES ########
@@ -78,10 +79,35 @@ class MusicFont(Font):
 
     ######## PUBLIC METHODS ########
 
+    @classmethod
+    def shared(cls, family_name: str, unit: Type[Unit]) -> MusicFont:
+        """Get a `MusicFont` shared by all users of a family and unit size.
+
+        Creating a `MusicFont` sets up its Qt font and metadata, and
+        each font keeps its own glyph info cache, so objects like
+        staves of equal size should use this instead of constructing
+        their own fonts. Units are matched by size, so the shared font's
+        `unit` may be a different but equivalent type than `unit`.
+
+        Args:
+            family_name: The font name
+            unit: A sizing unit, where `unit(1)` is the distance
+                between two staff lines.
+        """
+        key = (family_name, unit.CONVERSION_RATE)
+        font = _SHARED_FONTS.get(key)
+        # Replace fonts created before their family was registered again
+        if font is None or font.metadata is not neoscore.registered_music_fonts.get(
+            family_name
+        ):
+            font = cls(family_name, unit)
+            _SHARED_FONTS[key] = font
+        return font
+
     def modified(
-        self, family_name: Optional[str] = None, unit: Optiona[Type[Unit]] = None
+        self, family_name: Optional[str] = None, unit: Optional[Type[Unit]] = None
     ) -> MusicFont:
-        return MusicFont(
+        return MusicFont.shared(
             family_name if family_name is not None else self.family_name,
             unit if unit is not None else self.unit,
         )
@@ -89,33 +115,95 @@ class MusicFont(Font):
     def glyph_info(
         self, glyph_name: str, alternate_number: Optional[int] = None
     ) -> Dict:
+        """Collect and return all known metadata about a glyph.
+
+        Numeric values are converted to `self.unit`.
+
+        Args:
+            glyph_name (str): The canonical name of the glyph
+            alternate_number (int or None): A glyph alternate number
+
+        Returns:
+            dict: A collection of all known metadata about the glyph
+
+        Raises:
+            MusicFontGlyphNotFoundError: If the requested glyph
+                could not be found in the font.
+        """
         key = (glyph_name, alternate_number)
         cached_result = self._glyph_info_cache.get(key, None)
         if cached_result:
             return cached_result
-        computed_result = self._glyph_info(glyph_name, alternate_number)
+        computed_result = _copy_to_unit(
+            self._glyph_table.info(glyph_name, alternate_number), self.unit
+        )
         self._glyph_info_cache[key] = computed_result
         return computed_result
 
-    ######## PRIVATE METHODS ########
-
-    def _glyph_info(
+    def glyph_bounds(
         self, glyph_name: str, alternate_number: Optional[int] = None
-    ) -> Dict:
-        """Collect and return all known metadata about a glyph.
+    ) -> tuple[float, float, float, float]:
+        """Find the bounding box of a glyph as plain numbers.
 
-        Args:
-            glyph_name (str): The canonical name of the glyph
-            alternate_number (int or None): A glyph alternate number
+        This is a faster alternative to reading `"glyphBBox"` from
+        `glyph_info` where many glyphs are measured at once.
 
-        Returns:
-            None: If the glyph is not available in the font
-            dict: A collection of all known metadata about the glyph
+        Returns: The `(x, y, width, height)` of the glyph bounding box
+            in multiples of `self.unit`.
 
         Raises:
             MusicFontGlyphNotFoundError: If the requested glyph
                 could not be found in the font.
+            KeyError: If the font has no bounding box for the glyph.
+        """
+        return self._glyph_table.bounds(glyph_name, alternate_number)
+
+
+class _GlyphTable:
+
+    """Unit-independent glyph metadata for a music font family.
+
+    One table is shared by every `MusicFont` of a family, so glyph
+    metadata is only looked up once no matter how many fonts (typically
+    one per `Staff`) use it. Values are in SMuFL staff spaces, and each
+    font converts them to its own unit.
+    """
+
+    def __init__(self, metadata: Dict):
+        self.metadata = metadata
+        self._infos: dict[tuple[str, Optional[int]], Dict] = {}
+        self._bounds: dict[
+            tuple[str, Optional[int]], tuple[float, float, float, float]
+        ] = {}
+        self._set_alternatives: Optional[dict[str, Dict]] = None
+
+    def info(self, glyph_name: str, alternate_number: Optional[int]) -> Dict:
+        """Get the metadata for a glyph, computing it on first request.
+
+        The result shares data with the font metadata and must not be modified.
         """
+        key = (glyph_name, alternate_number)
+        info = self._infos.get(key)
+        if info is None:
+            info = self._build_info(glyph_name, alternate_number)
+            self._infos[key] = info
+        return info
+
+    def bounds(
+        self, glyph_name: str, alternate_number: Optional[int]
+    ) -> tuple[float, float, float, float]:
+        """Get the `(x, y, width, height)` bounding box of a glyph."""
+        key = (glyph_name, alternate_number)
+        bounds = self._bounds.get(key)
+        if bounds is None:
+            bbox = self.info(glyph_name, alternate_number)["glyphBBox"]
+            x = bbox["bBoxSW"][0]
+            y = bbox["bBoxNE"][1]
+            bounds = (x, y, bbox["bBoxNE"][0] - x, (bbox["bBoxSW"][1] - y) * -1)
+            self._bounds[key] = bounds
+        return bounds
+
+    def _build_info(self, glyph_name: str, alternate_number: Optional[int]) -> Dict:
         info = {}
         if alternate_number:
             try:
@@ -162,19 +250,57 @@ class MusicFont(Font):
             ]
         except KeyError:
             pass
-        for set_key in self.metadata["sets"].keys():
-            for glyph in self.metadata["sets"][set_key]["glyphs"]:
-                if glyph["alternateFor"] == real_name:
-                    info["setAlternatives"] = {}
-                    info["setAlternatives"][set_key] = {}
-                    info["setAlternatives"][set_key]["description"] = self.metadata[
-                        "sets"
-                    ][set_key]["description"]
-                    info["setAlternatives"][set_key]["name"] = glyph["name"]
-                    info["setAlternatives"][set_key]["codepoint"] = glyph["codepoint"]
+        set_alternatives = self._set_alternatives_index().get(real_name)
+        if set_alternatives:
+            info["setAlternatives"] = set_alternatives
         if not info:
             raise MusicFontGlyphNotFoundError
         info["is_optional"] = real_name in self.metadata["optionalGlyphs"]
         info["canonicalName"] = real_name
-        convert_all_to_unit(info, self.unit)
         return info
+
+    def _set_alternatives_index(self) -> dict[str, Dict]:
+        """Map glyph names to the `"setAlternatives"` info for them.
+
+        Where several sets have alternates for a glyph, only the last is kept.
+        """
+        if self._set_alternatives is None:
+            index = {}
+            for set_key, glyph_set in self.metadata["sets"].items():
+                for glyph in glyph_set["glyphs"]:
+                    index[glyph["alternateFor"]] = {
+                        set_key: {
+                            "description": glyph_set["description"],
+                            "name": glyph["name"],
+                            "codepoint": glyph["codepoint"],
+                        }
+                    }
+            self._set_alternatives = index
+        return self._set_alternatives
+
+
+def _copy_to_unit(value: Any, unit: Type[Unit]) -> Any:
+    """Deep copy a metadata value, converting numbers like `convert_all_to_unit`."""
+    if isinstance(value, (int, float, Unit)):
+        return unit(value)
+    if isinstance(value, dict):
+        return {key: _copy_to_unit(item, unit) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return type(value)(_copy_to_unit(item, unit) for item in value)
+    return value
+
+
+_SHARED_FONTS: dict[tuple[str, float], MusicFont] = {}
+"""Fonts given by `MusicFont.shared`, by family name and unit size"""
+
+_GLYPH_TABLES: dict[str, _GlyphTable] = {}
+"""Glyph tables for music font families, by family name"""
+
+
+def _glyph_table(family_name: str, metadata: Dict) -> _GlyphTable:
+    table = _GLYPH_TABLES.get(family_name)
+    # Rebuild the table if the font was registered again
+    if table is None or table.metadata is not metadata:
+        table = _GlyphTable(metadata)
+        _GLYPH_TABLES[family_name] = table
+    return table
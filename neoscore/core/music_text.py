@@ -5,9 +5,10 @@ from neoscore.core.music_char import MusicChar
 from neoscore.core.music_font import MusicFont
 from neoscore.core.staff_object import StaffObject
 from neoscore.core.text import Text
+from neoscore.utils.lru_cache import LruCache
 from neoscore.utils.point import PointDef
 from neoscore.utils.rect import Rect
-from neoscore.utils.units import ZERO, Unit
+from neoscore.utils.units import Unit
 
 if TYPE_CHECKING:
     from neoscore.core.mapping import Parent
@@ -23,7 +24,9 @@ class _CachedTextGeometry(NamedTuple):
     bounding_rect: Rect
 
 
-_GEOMETRY_CACHE: dict[_CachedTextGeometryKey, _CachedTextGeometry] = {}
+_GEOMETRY_CACHE: LruCache[_CachedTextGeometryKey, _CachedTextGeometry] = LruCache(
+    max_entries=10_000
+)
 
 
 class MusicText(Text):
@@ -68,6 +71,21 @@ class MusicText(Text):
 
     ######## PUBLIC PROPERTIES ########
 
+    @property
+    def text(self) -> str:
+        """The text to be drawn.
+
+        This may be set with any value accepted by the `text`
+        argument of `MusicText.__init__`.
+        """
+        return self._text
+
+    @text.setter
+    def text(self, value: Any):
+        self.music_chars = MusicText._resolve_music_chars(value, self.font)
+        self._text = "".join(char.codepoint for char in self.music_chars)
+        self._mark_dirty()
+
     @property
     def length(self) -> Unit:
         """The breakable width of the object.
@@ -86,7 +104,7 @@ class MusicText(Text):
         if cached_result:
             return cached_result.bounding_rect
         bounding_rect = self._char_list_bounding_rect(self.music_chars)
-        _GEOMETRY_CACHE[key] = _CachedTextGeometry(bounding_rect)
+        _GEOMETRY_CACHE.put(key, _CachedTextGeometry(bounding_rect))
         return bounding_rect
 
     ######## PRIVATE METHODS ########
@@ -112,20 +130,26 @@ class MusicText(Text):
             raise ValueError(
                 "Cannot find the bounding rect of an empty character sequence."
             )
-        x = music_chars[0].glyph_info["glyphBBox"]["bBoxSW"][0]
-        y = music_chars[0].glyph_info["glyphBBox"]["bBoxNE"][1]
-        w = ZERO
-        h = ZERO
+        first_char = music_chars[0]
+        x, y, _, _ = first_char.font.glyph_bounds(
+            first_char.glyph_name, first_char.alternate_number
+        )
+        # Sizes are summed in base units since chars may have different fonts
+        w = 0
+        h = 0
         for char in music_chars:
-            char_x = char.glyph_info["glyphBBox"]["bBoxSW"][0]
-            char_y = char.glyph_info["glyphBBox"]["bBoxNE"][1]
-            w += char.glyph_info["glyphBBox"]["bBoxNE"][0] - char_x
-            h += (char.glyph_info["glyphBBox"]["bBoxSW"][1] - char_y) * -1
+            _, _, char_w, char_h = char.font.glyph_bounds(
+                char.glyph_name, char.alternate_number
+            )
+            conversion_rate = char.font.unit.CONVERSION_RATE
+            w += char_w * conversion_rate
+            h += char_h * conversion_rate
+        unit = first_char.font.unit
         return Rect(
-            x * self.scale,
-            y * self.scale,
-            w * self.scale,
-            h * self.scale,
+            unit(x * self.scale),
+            unit(y * self.scale),
+            Unit(w * self.scale),
+            Unit(h * self.scale),
         )
 
     @staticmethod
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import json
 import os
+from bisect import bisect_right
 from time import time
-from typing import TYPE_CHECKING, Callable, Optional
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
 from warnings import warn
 
 from neoscore import constants
@@ -11,9 +12,14 @@ from neoscore.core.font import Font
 from neoscore.core.paper import A4, Paper
 from neoscore.interface import images
 from neoscore.interface.app_interface import AppInterface
+from neoscore.interface.graphic_object_interface import GraphicObjectInterface
+from neoscore.interface.pdf_export import PdfWriter
+from neoscore.interface.svg_export import SvgWriter
 from neoscore.utils import file_system
 from neoscore.utils.color import Color, ColorDef, color_from_def
 from neoscore.utils.exceptions import InvalidImageFormatError
+from neoscore.utils.json_cache import load_json
+from neoscore.utils.lru_cache import CacheStats, LruCache
 from neoscore.utils.rect import RectDef, rect_from_def
 
 if TYPE_CHECKING:
@@ -40,7 +46,7 @@ _display_background_color = "#dddddd"
 _display_paper_color = "#ffffff"
 
 
-def setup(initial_paper: Paper = A4):
+def setup(initial_paper: Paper = A4, headless: bool = False):
     """Initialize the application and set up the global state.
 
     This initializes the global `Document` and a back-end
@@ -48,10 +54,14 @@ def setup(initial_paper: Paper = A4):
 
     This should be called once at the beginning of every script using `neoscore`;
     calling this multiple times in one script will cause unexpected behavior.
+    To start over with a new document, use `reset_document()` instead.
 
     Args:
         initial_paper (Paper): The paper to use in the document.
             If `None`, this defaults to `constants.DEFAULT_PAPER_TYPE`
+        headless (bool): Whether to skip creating the preview window.
+            This speeds up startup for scripts which only export
+            documents, but prevents `show()` from being used.
 
     Returns: None
     """
@@ -62,13 +72,38 @@ def setup(initial_paper: Paper = A4):
     from neoscore.core.document import Document
 
     document = Document(initial_paper)
-    _app_interface = AppInterface(document, _repl_refresh_func)
+    _app_interface = AppInterface(document, _repl_refresh_func, headless)
     _register_default_fonts()
     default_font = Font(
         constants.DEFAULT_TEXT_FONT_NAME, constants.DEFAULT_TEXT_FONT_SIZE, 1, False
     )
 
 
+def reset_document(paper: Optional[Paper] = None):
+    """Discard the current document and start a new empty one.
+
+    This is a cheap alternative to calling `setup()` again. The
+    application, registered fonts, and render caches are all kept,
+    so long-lived processes can render many scores one after another.
+
+    Objects belonging to the old document must not be used afterward.
+
+    Args:
+        paper: The paper to use in the new document.
+            If `None`, the current document's paper is used.
+    """
+    global document
+    global _app_interface
+    # Document is imported here to work around cyclic import problems
+    from neoscore.core.document import Document
+
+    if paper is None:
+        paper = document.paper
+    _app_interface._clear_scene()
+    document = Document(paper)
+    _app_interface.document = document
+
+
 def register_font(font_file_path: str) -> list[str]:
     """Register a font file with the application.
 
@@ -111,8 +146,7 @@ def register_music_font(font_file_path: str, metadata_path: str):
     global registered_music_fonts
     family_names = register_font(font_file_path)
     try:
-        with open(metadata_path, "r") as metadata_file:
-            metadata = json.load(metadata_file)
+        metadata = load_json(metadata_path)
     except FileNotFoundError:
         raise FileNotFoundError(
             "Music font metadata file {} could not be found".format(metadata_path)
@@ -152,35 +186,59 @@ def show(refresh_func: Optional[RefreshFunc] = None):
     """
     global document
     global _app_interface
-    _app_interface._clear_scene()
     document._render()
     if refresh_func:
         set_refresh_func(refresh_func)
     _app_interface.show()
 
 
-def _clear_interfaces():
+def render_pdf(path: str, reuse_glyph_outlines: bool = False):
+    """Render the score as a pdf.
+
+    Args:
+        path (str): The output score path.
+            If a relative path is provided, it will be
+            relative to the current working directory.
+        reuse_glyph_outlines: Whether to store each distinct text outline
+            once and draw every occurrence of it by reference, instead of
+            drawing through Qt's PDF backend. This makes scores with many
+            repeated glyphs much smaller and faster to write. As with
+            `render_svg`, non-solid brush patterns are drawn as solid fills.
+    """
     global document
     global _app_interface
-    _app_interface._clear_scene()
-    for page in document.pages:
-        for obj in page.descendants:
-            obj.interfaces.clear()
+    document._render()
+    if not reuse_glyph_outlines:
+        _app_interface.render_pdf((page.page_index for page in document.pages), path)
+        return
+    with open(path, "wb") as pdf_file:
+        writer = PdfWriter(pdf_file)
+        for page_index, interfaces in enumerate(_interfaces_by_page()):
+            writer.begin_page(document.paper_bounding_rect(page_index))
+            writer.write_all(interfaces)
+            writer.end_page()
+        writer.close()
 
 
-def render_pdf(path: str):
-    """Render the score as a pdf.
+def render_svg(path: str, page: int = 0):
+    """Render a page of the score as an SVG image.
+
+    Text is written as outlines, with each distinct string stored once
+    and reused wherever it appears on the page. Only solid brush
+    patterns are supported; other patterns are drawn as solid fills.
 
     Args:
-        path (str): The output score path.
+        path: The output image path.
             If a relative path is provided, it will be
             relative to the current working directory.
+        page: The index of the page to render.
     """
     global document
-    global _app_interface
-    _clear_interfaces()
     document._render()
-    _app_interface.render_pdf((page.page_index for page in document.pages), path)
+    with open(path, "w", encoding="utf-8") as svg_file:
+        writer = SvgWriter(svg_file, document.paper_bounding_rect(page))
+        writer.write_all(_interfaces_by_page()[page])
+        writer.close()
 
 
 def render_image(
@@ -229,12 +287,156 @@ def render_image(
     global document
     global _app_interface
 
-    _clear_interfaces()
+    quality = _validate_image_quality(quality)
+    _validate_image_path(image_path)
+    rect = rect_from_def(rect)
+    bg_color = _resolve_image_bg_color(bg_color)
+    dpm = int(images.dpi_to_dpm(dpi))
+
+    document._render()
+
+    _app_interface.render_image(rect, image_path, dpm, quality, bg_color, autocrop)
+
+
+def render_images(
+    pages: Optional[Iterable[int]] = None,
+    path_template: str = "page_{}.png",
+    dpi: int = 600,
+    quality: int = -1,
+    bg_color: Optional[ColorDef] = None,
+    autocrop: bool = False,
+    parallel: bool = True,
+) -> list[str]:
+    """Render pages of the document to separate images.
+
+    The document is rendered once, after which each page's paper
+    area is exported to its own image. This is much faster than
+    calling `render_image` once per page.
+
+    Args:
+        pages: The indices of the pages to render.
+            Defaults to every page in the document.
+        path_template: A format string for the output paths, which is
+            formatted with each page index. See `render_image` for the
+            supported image formats.
+        dpi: The pixels per inch of the rendered images.
+        quality: The quality of the output images for compressed
+            image formats. See `render_image` for details.
+        bg_color: The background color for the images.
+            Defaults to solid white.
+        autocrop: Whether or not to crop the output images to tightly
+            fit the contents of each page.
+        parallel: Whether to encode and save images on background threads
+            while the following pages are rasterized.
+
+    Returns: The paths of the rendered images, in page order.
+
+    Raises:
+        FileNotFoundError: If a formatted path does not point to a valid
+            location for a new file.
+        InvalidImageFormatError: If a formatted path does not have a
+            supported image format file extension.
+        ImageExportError: If low level Qt image export fails for
+            unknown reasons.
+    """
+    global document
+    global _app_interface
+
+    quality = _validate_image_quality(quality)
+    # Check the template before the potentially slow document render
+    _validate_image_path(path_template.format(0))
+    bg_color = _resolve_image_bg_color(bg_color)
+    dpm = int(images.dpi_to_dpm(dpi))
+
+    document._render()
 
+    if pages is None:
+        pages = range(len(document.pages))
+    targets = []
+    for page_index in pages:
+        image_path = path_template.format(page_index)
+        _validate_image_path(image_path)
+        targets.append((document.paper_bounding_rect(page_index), image_path))
+    _app_interface.render_images(targets, dpm, quality, bg_color, autocrop, parallel)
+    return [image_path for _, image_path in targets]
+
+
+def cache_stats() -> dict[str, CacheStats]:
+    """Get usage statistics for neoscore's internal caches.
+
+    The caches are:
+        * `"text_paths"`: Outline paths of rendered text, by text and font.
+        * `"music_text_geometry"`: Bounding rects of `MusicText` objects.
+
+    Returns: A map from cache names to snapshots of their statistics.
+    """
+    return {name: cache.stats() for name, cache in _caches().items()}
+
+
+def configure_cache(
+    name: str, max_entries: Optional[int] = None, max_cost: Optional[int] = None
+):
+    """Change the bounds of one of neoscore's internal caches.
+
+    When a cache grows beyond its bounds, its least recently used
+    entries are discarded. Tighter bounds save memory in long-running
+    processes rendering many different texts, at the cost of
+    recomputing evicted entries.
+
+    Args:
+        name: The name of the cache. See `cache_stats` for the options.
+        max_entries: The maximum number of entries to keep.
+            Use `None` for no limit.
+        max_cost: The maximum approximate size of the entries to keep,
+            in bytes. Use `None` for no limit. The `"music_text_geometry"`
+            cache does not track entry sizes, so this has no effect on it.
+
+    Raises:
+        KeyError: If there is no cache with the given name.
+    """
+    _caches()[name].configure(max_entries, max_cost)
+
+
+def _caches() -> dict[str, LruCache]:
+    from neoscore.core import music_text
+    from neoscore.interface import text_interface
+
+    return {
+        "text_paths": text_interface._PATH_CACHE,
+        "music_text_geometry": music_text._GEOMETRY_CACHE,
+    }
+
+
+def _interfaces_by_page() -> list[list[GraphicObjectInterface]]:
+    """Collect the rendered interfaces positioned on each page.
+
+    Flowable contents can be laid out on any page, so interfaces are
+    sorted into pages by position rather than by parentage.
+    """
+    page_count = len(document.pages)
+    page_lefts = [
+        document.paper_bounding_rect(i).x.base_value for i in range(page_count)
+    ]
+    paper_width = document.paper.width.base_value
+    pages = [[] for _ in range(page_count)]
+    for page in document.pages:
+        for obj in page.descendants:
+            for interface in obj.interfaces:
+                x = interface.pos.x.base_value
+                page_index = bisect_right(page_lefts, x) - 1
+                if page_index >= 0 and x <= page_lefts[page_index] + paper_width:
+                    pages[page_index].append(interface)
+    return pages
+
+
+def _validate_image_quality(quality: int) -> int:
     if not ((0 <= quality <= 100) or quality == -1):
         warn("render_image quality {} invalid; using default.".format(quality))
-        quality = -1
+        return -1
+    return quality
 
+
+def _validate_image_path(image_path: str):
     if not file_system.is_valid_file_path(image_path):
         raise FileNotFoundError("Invalid image_path: " + image_path)
 
@@ -243,21 +445,15 @@ def render_image(
             "image_path {} is not in a supported format.".format(image_path)
         )
 
-    rect = rect_from_def(rect)
-    if bg_color is None:
-        bg_color = Color(255, 255, 255, 255)
-    else:
-        bg_color = color_from_def(bg_color)
-    dpm = int(images.dpi_to_dpm(dpi))
-
-    document._render()
 
-    _app_interface.render_image(rect, image_path, dpm, quality, bg_color, autocrop)
+def _resolve_image_bg_color(bg_color: Optional[ColorDef]) -> Color:
+    if bg_color is None:
+        return Color(255, 255, 255, 255)
+    return color_from_def(bg_color)
 
 
 def _repl_refresh_func(_: float) -> float:
     """Default refresh func to be used in REPL mode"""
-    _clear_interfaces()
     document._render()
     return constants.DEFAULT_REPL_FRAME_REFRESH_TIME_S
 
@@ -266,12 +462,11 @@ def set_refresh_func(refresh_func: RefreshFunc):
     global _app_interface
     global document
 
-    # Wrap the user-provided refresh function with code that clears
-    # the scene and re-renders it, then returns the requested delay
+    # Wrap the user-provided refresh function with code that
+    # re-renders whatever it changed, then returns the requested delay
     # before the next frame, calculated to automatically compensate
     # for refresh time.
     def wrapped_refresh_func(frame_time: float) -> float:
-        _clear_interfaces()
         refresh_func(frame_time)
         document._render()
         elapsed_time = time() - frame_time
@@ -76,6 +76,7 @@ class Notehead(MusicText, StaffObject):
     @pitch.setter
     def pitch(self, value):
         self._pitch = value
+        self._mark_dirty()
 
     @property
     def duration(self):
@@ -85,6 +86,7 @@ class Notehead(MusicText, StaffObject):
     @duration.setter
     def duration(self, value):
         self._duration = value
+        self._mark_dirty()
 
     @property
     def staff_pos(self):
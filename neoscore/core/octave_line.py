@@ -175,8 +175,7 @@ class _OctaveLineText(MusicText, StaffObject):
             self.text,
             self.font._interface,
         )
-        interface.render()
-        self.interfaces.append(interface)
+        self._render_interface(interface)
 
     def _render_after_break(self, local_start_x: Unit, start: Point, stop: Point):
         interface = TextInterface(
@@ -186,8 +185,7 @@ class _OctaveLineText(MusicText, StaffObject):
             self.parenthesized_text,
             self.font._interface,
         )
-        interface.render()
-        self.interfaces.append(interface)
+        self._render_interface(interface)
 
     def _render_spanning_continuation(
         self, local_start_x: Unit, start: Point, stop: Point
@@ -199,5 +197,4 @@ class _OctaveLineText(MusicText, StaffObject):
             self.parenthesized_text,
             self.font._interface,
         )
-        interface.render()
-        self.interfaces.append(interface)
+        self._render_interface(interface)
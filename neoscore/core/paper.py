@@ -32,6 +32,22 @@ class Paper:
         )
         super().__setattr__("interface", PaperInterface(self.width, self.height))
 
+    def __reduce__(self):
+        # Derived fields (including the Qt-backed interface) can't be
+        # pickled, so rebuild them from the paper geometry.
+        return (
+            Paper,
+            (
+                self.width,
+                self.height,
+                self.margin_top,
+                self.margin_right,
+                self.margin_bottom,
+                self.margin_left,
+                self.gutter,
+            ),
+        )
+
     ######## PUBLIC METHODS ########
 
     def make_rotation(self):
@@ -199,6 +199,19 @@ class Path(GraphicObject):
             self.elements.append(MoveTo(Point(Unit(0), Unit(0)), self))
         self.elements.append(CurveTo(c1, c2, Point(end_x, end_y), end_parent or self))
 
+    def _pre_render_hook(self):
+        # Elements anchored to other objects can be moved without
+        # touching this path, so re-render if any of them changed.
+        if not self._dirty and any(
+            element._dirty
+            or (
+                isinstance(element, CurveTo)
+                and (element.control_1._dirty or element.control_2._dirty)
+            )
+            for element in self.elements
+        ):
+            self._mark_dirty()
+
     def _relative_element_pos(self, element: Parent) -> Point:
         return map_between(self, element)
 
@@ -248,8 +261,7 @@ class Path(GraphicObject):
             clip_start_x,
             clip_width,
         )
-        slice_interface.render()
-        self.interfaces.append(slice_interface)
+        self._render_interface(slice_interface)
 
     def _render_complete(
         self,
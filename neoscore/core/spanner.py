@@ -6,6 +6,7 @@ from neoscore.utils.point import Point
 from neoscore.utils.units import Unit
 
 if TYPE_CHECKING:
+    from neoscore.core.graphic_object import GraphicObject
     from neoscore.core.mapping import Parent
 
 
@@ -50,6 +51,7 @@ class Spanner:
     @end_x.setter
     def end_x(self, value: Unit):
         self._end_x = value
+        cast("GraphicObject", self)._mark_dirty()
 
     @property
     def end_y(self) -> Unit:
@@ -69,6 +71,7 @@ class Spanner:
     @end_parent.setter
     def end_parent(self, value: Parent):
         self._end_parent = value
+        cast("GraphicObject", self)._mark_dirty()
 
     @property
     def spanner_x_length(self) -> Unit:
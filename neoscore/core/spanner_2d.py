@@ -9,6 +9,7 @@ from neoscore.utils.point import Point
 from neoscore.utils.units import Unit
 
 if TYPE_CHECKING:
+    from neoscore.core.graphic_object import GraphicObject
     from neoscore.core.mapping import Parent
 
 
@@ -24,6 +25,7 @@ class Spanner2D(Spanner):
     @end_y.setter
     def end_y(self, value: Unit):
         self._end_y = value
+        cast("GraphicObject", self)._mark_dirty()
 
     @property
     def end_pos(self):
@@ -36,6 +38,7 @@ class Spanner2D(Spanner):
     def end_pos(self, value: Point):
         self._end_x = value.x
         self._end_y = value.y
+        cast("GraphicObject", self)._mark_dirty()
 
     @property
     def spanner_2d_length(self) -> Unit:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from typing import TYPE_CHECKING, Optional, Type, cast
 
 from neoscore import constants
@@ -26,6 +27,10 @@ class Staff(Path):
     # without importing the type, risking cyclic imports.
     _neoscore_staff_type_marker = True
 
+    # Staves search their contents by type (clefs, octave lines, etc.)
+    # during layout, so keep a typed index of descendants.
+    _indexes_descendants = True
+
     def __init__(
         self,
         pos: PointDef,
@@ -45,19 +50,31 @@ class Staff(Path):
                 If not set, this will default to `constants.DEFAULT_STAFF_UNIT`
             line_count (int): The number of lines in the staff.
             music_font (MusicFont): The font to be used in all
-                MusicTextObjects unless otherwise specified.
+                MusicTextObjects unless otherwise specified. If not set,
+                a font shared with other staves of the same size is used.
             default_time_signature_duration (tuple or None): The duration tuple
                 of the initial time signature. If none, (4, 4) will be used.
             pen: The pen used to draw the staff lines. If none, a default solid
                 black line is used.
         """
+        # Layout caches, only populated during rendering
+        self._caching_layout = False
+        self._x_positions_by_type: dict[type, tuple[list[float], list[Unit]]] = {}
+        self._octave_line_spans_cache: Optional[
+            tuple[list[float], list[float], list[tuple[float, int, Transposition]]]
+        ] = None
+        # Types searched with `distance_to_next_of_type`, and the
+        # layout summary (see `_layout_summary`) from the last render
+        self._next_of_type_queries: set[type] = set()
+        self._rendered_layout: Optional[tuple] = None
         super().__init__(pos, parent=flowable, pen=pen)
         self._line_count = line_count
         self._unit = self._make_unit_class(
             staff_unit if staff_unit else constants.DEFAULT_STAFF_UNIT
         )
         if music_font is None:
-            self.music_font = MusicFont(constants.DEFAULT_MUSIC_FONT_NAME, self.unit)
+            music_font = MusicFont.shared(constants.DEFAULT_MUSIC_FONT_NAME, self.unit)
+        self.music_font = music_font
         self._length = length
         # Construct the staff path
         for i in range(self.line_count):
@@ -130,19 +147,29 @@ class Staff(Path):
         such as `KeySignature`s, or `Clef`s.
         """
         start_x = map_between_x(self, cast(Positioned, staff_object))
-        all_others_of_class = (
-            item
-            for item in self.descendants_of_exact_class(type(staff_object))
-            if item != staff_object
-        )
-        closest_x = Unit(float("inf"))
-        for item in all_others_of_class:
-            relative_x = map_between_x(self, item)
-            if start_x < relative_x < closest_x:
-                closest_x = relative_x
-        if closest_x == Unit(float("inf")):
+        self._next_of_type_queries.add(type(staff_object))
+        if not self._caching_layout:
+            all_others_of_class = (
+                item
+                for item in self.descendants_of_exact_class(type(staff_object))
+                if item != staff_object
+            )
+            closest_x = Unit(float("inf"))
+            for item in all_others_of_class:
+                relative_x = map_between_x(self, item)
+                if start_x < relative_x < closest_x:
+                    closest_x = relative_x
+            if closest_x == Unit(float("inf")):
+                return self.length - start_x
+            return closest_x - start_x
+        # During rendering, search the cached sorted positions instead.
+        # Like `Unit` comparisons, only positions more than
+        # `Unit._CMP_POS_EPSILON` after `start_x` are considered.
+        base_xs, xs = self._x_positions_of_type(type(staff_object))
+        next_index = bisect_right(base_xs, start_x.base_value + Unit._CMP_POS_EPSILON)
+        if next_index == len(xs):
             return self.length - start_x
-        return closest_x - start_x
+        return xs[next_index] - start_x
 
     def clefs(self) -> list[tuple[Unit, Clef]]:
         """All the clefs in this staff, ordered by their relative x pos."""
@@ -161,11 +188,18 @@ class Staff(Path):
 
     def active_transposition_at(self, pos_x: Unit) -> Optional[Transposition]:
         """Return the active transposition at a given x position, if any."""
-        for item in self.descendants_of_class_or_subclass(OctaveLine):
-            line_pos = map_between_x(self, item)
-            if line_pos <= pos_x <= line_pos + item.length:
-                return item.transposition
-        return None
+        starts, max_ends, spans = self._octave_line_spans()
+        x = pos_x.base_value
+        match = None
+        # Walk back from the last line starting at or before `x`,
+        # stopping once no earlier line can reach it.
+        for i in range(bisect_right(starts, x) - 1, -1, -1):
+            if max_ends[i] < x:
+                break
+            end, order, transposition = spans[i]
+            if end >= x and (match is None or order < match[0]):
+                match = (order, transposition)
+        return match[1] if match else None
 
     def middle_c_at(self, pos_x: Unit) -> Unit:
         """Find the y-axis staff position of middle-c at a given point.
@@ -236,8 +270,103 @@ class Staff(Path):
         result.sort(key=lambda tup: tup[0])
         return result
 
+    def _x_positions_of_type(self, object_type: type) -> tuple[list[float], list[Unit]]:
+        """Find the sorted x positions of all descendants of an exact type.
+
+        Returns a tuple of the positions' base values, for bisecting, and
+        the positions themselves. This is only used during rendering, and
+        the result is cached per type until the subtree changes or the
+        render completes.
+        """
+        cached = self._x_positions_by_type.get(object_type)
+        if cached is not None:
+            return cached
+        xs = sorted(
+            (
+                map_between_x(self, item)
+                for item in self.descendants_of_exact_class(object_type)
+            ),
+            key=lambda x: x.base_value,
+        )
+        result = ([x.base_value for x in xs], xs)
+        self._x_positions_by_type[object_type] = result
+        return result
+
+    def _octave_line_spans(
+        self,
+    ) -> tuple[list[float], list[float], list[tuple[float, int, Transposition]]]:
+        """Find the x spans of all octave lines in the staff, sorted by start.
+
+        Returns a tuple of the spans' start positions, the running maximum
+        of their end positions, and `(end, order, transposition)` tuples,
+        where `order` is the line's position in descendant order. All
+        positions are given as base values. During rendering the result
+        is cached until the subtree changes or the render completes.
+        """
+        if self._octave_line_spans_cache is not None:
+            return self._octave_line_spans_cache
+        spans = []
+        for order, item in enumerate(self.descendants_of_class_or_subclass(OctaveLine)):
+            start = map_between_x(self, item).base_value
+            end = start + item.length.base_value
+            spans.append((start, end, order, item.transposition))
+        spans.sort(key=lambda span: span[0])
+        max_ends = []
+        max_end = float("-inf")
+        for span in spans:
+            max_end = max(max_end, span[1])
+            max_ends.append(max_end)
+        result = (
+            [span[0] for span in spans],
+            max_ends,
+            [span[1:] for span in spans],
+        )
+        if self._caching_layout:
+            self._octave_line_spans_cache = result
+        return result
+
+    def _index_subtree(self, root):
+        super()._index_subtree(root)
+        self._clear_layout_caches()
+
+    def _unindex_subtree(self, root):
+        super()._unindex_subtree(root)
+        self._clear_layout_caches()
+
+    def _layout_summary(self) -> tuple:
+        """Summarize the staff layout which staff objects depend on.
+
+        This covers the clefs and their positions, the octave line
+        spans, and the positions of every type searched with
+        `distance_to_next_of_type`.
+        """
+        return (
+            [(x.base_value, clef) for x, clef in self._clef_x_positions],
+            self._octave_line_spans(),
+            {
+                object_type: self._x_positions_of_type(object_type)[0]
+                for object_type in self._next_of_type_queries
+            },
+        )
+
     def _pre_render_hook(self):
+        super()._pre_render_hook()
         self._clef_x_positions = self._compute_clef_x_positions()
+        self._clear_layout_caches()
+        self._caching_layout = True
+        # Staff objects depend on the positions of clefs, octave lines,
+        # etc., so when those change the whole staff is re-rendered.
+        # Other changes only re-render the changed objects.
+        layout = self._layout_summary()
+        if layout != self._rendered_layout:
+            self._mark_dirty()
+            self._rendered_layout = layout
 
     def _post_render_hook(self):
         self._clef_x_positions = None
+        self._caching_layout = False
+        self._clear_layout_caches()
+
+    def _clear_layout_caches(self):
+        self._x_positions_by_type = {}
+        self._octave_line_spans_cache = None
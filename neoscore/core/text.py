@@ -54,6 +54,11 @@ class Text(GraphicObject):
         """str: The text to be drawn"""
         return self._text
 
+    @text.setter
+    def text(self, value):
+        self._text = value
+        self._mark_dirty()
+
     @property
     def font(self):
         """Font: The text font"""
@@ -62,6 +67,7 @@ class Text(GraphicObject):
     @font.setter
     def font(self, value):
         self._font = value
+        self._mark_dirty()
 
     @property
     def baseline_y(self):
@@ -76,6 +82,7 @@ class Text(GraphicObject):
     @scale.setter
     def scale(self, value):
         self._scale = value
+        self._mark_dirty()
 
     ######## PRIVATE PROPERTIES ########
 
@@ -111,8 +118,7 @@ class Text(GraphicObject):
             clip_start_x,
             clip_width,
         )
-        slice_interface.render()
-        self.interfaces.append(slice_interface)
+        self._render_interface(slice_interface)
 
     def _render_complete(
         self,
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Callable
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Optional
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtPrintSupport import QPrinter
@@ -26,19 +28,47 @@ class AppInterface:
     This holds much of the global state for interacting with the API,
     and must be created (and `create_document()` must be called) before
     working with the API.
+
+    In headless mode no window or view is created, and unless another
+    platform is requested through `QT_QPA_PLATFORM`, Qt uses its
+    offscreen platform plugin. Headless interfaces can export documents
+    but cannot show them.
     """
 
     _QT_FONT_ERROR_CODE = -1
 
+    _IMAGE_STRIP_MAX_PIXELS = 4_000_000
+    """The pixel count above which PNG exports are rendered in strips."""
+
+    _MAX_PENDING_SAVES = 3
+    """The most images `render_images` saves in the background at once."""
+
+    _MAX_PENDING_SAVE_BYTES = 256 * 1024 * 1024
+    """The approximate memory `render_images` may hold in unsaved images.
+
+    The image being rasterized counts toward this, but a single image
+    is always allowed regardless of its size.
+    """
+
     def __init__(
-        self, document: Document, repl_refresh_func: Callable[[float], [float]]
+        self,
+        document: Document,
+        repl_refresh_func: Callable[[float], [float]],
+        headless: bool = False,
     ):
         self.document = document
-        self.app = QtWidgets.QApplication([])
-        self.main_window = MainWindow()
+        self.headless = headless
+        if headless:
+            self.app = QtWidgets.QApplication(self._headless_qt_args())
+            self.main_window = None
+            self.view = None
+        else:
+            self.app = QtWidgets.QApplication([])
+            self.main_window = MainWindow()
+            self.view = self.main_window.graphicsView
         self.scene = QtWidgets.QGraphicsScene()
-        self.view = self.main_window.graphicsView
-        self.view.setScene(self.scene)
+        if self.view is not None:
+            self.view.setScene(self.scene)
         self.registered_music_fonts = {}
         self.font_database = QtGui.QFontDatabase()
         self.repl_refresh_func = repl_refresh_func
@@ -46,10 +76,16 @@ class AppInterface:
     ######## PUBLIC METHODS ########
 
     def set_refresh_func(self, refresh_func: Callable[[float], float]):
+        self._require_window()
         self.main_window.refresh_func = refresh_func
 
     def show(self):
-        """Open a window showing a preview of the document."""
+        """Open a window showing a preview of the document.
+
+        Raises:
+            RuntimeError: If the interface is headless.
+        """
+        self._require_window()
         self._optimize_for_interactive_view()
         self.main_window.show()
         if running_in_ipython_gui_repl():
@@ -85,12 +121,13 @@ class AppInterface:
             target_rect_unscaled.width() * ratio,
             target_rect_unscaled.height() * ratio,
         )
-        for page_number in pages:
+        for i, page_number in enumerate(pages):
+            if i > 0:
+                printer.newPage()
             source_rect = rect_to_qt_rect_f(
                 self.document.paper_bounding_rect(page_number)
             )
             self.scene.render(painter, target=target_rect_scaled, source=source_rect)
-            printer.newPage()
         painter.end()
 
     def render_image(
@@ -122,37 +159,93 @@ class AppInterface:
                 cropped such that all 4 edges have at least one pixel not of
                 `bg_color`.
 
+        Large PNG exports without autocropping are rendered in horizontal
+        strips. Each strip is encoded on a background thread while the
+        next one is rendered, so memory use stays bounded regardless of
+        resolution.
+
         Raises:
             ImageExportError: If Qt image export fails for unknown reasons.
         """
-        scale = dpm / Meter(1).base_value
-        pix_width = int(rect.width.base_value * scale)
-        pix_height = int(rect.height.base_value * scale)
+        self.render_images([(rect, image_path)], dpm, quality, bg_color, autocrop)
 
-        q_image = QtGui.QImage(pix_width, pix_height, QtGui.QImage.Format_ARGB32)
-        q_image.setDotsPerMeterX(dpm)
-        q_image.setDotsPerMeterY(dpm)
-        q_color = color_to_q_color(bg_color)
-        q_image.fill(q_color)
-
-        painter = QtGui.QPainter()
-        painter.begin(q_image)
-
-        target_rect = QtCore.QRectF(q_image.rect())
-        source_rect = rect_to_qt_rect_f(rect)
+    def render_images(
+        self,
+        targets: list[tuple[Rect, str]],
+        dpm: int,
+        quality: int,
+        bg_color: Color,
+        autocrop: bool,
+        parallel: bool = False,
+    ):
+        """Render several sections of self.scene to images.
 
-        self.scene.render(painter, target=target_rect, source=source_rect)
-        painter.end()
+        It is assumed that all input arguments are valid.
 
-        if autocrop:
-            q_image = images.autocrop(q_image, q_color)
+        Images are rasterized one at a time on the calling thread, since
+        the scene is not thread-safe. If `parallel` is true, finished
+        images are encoded and saved on a thread pool while the following
+        ones are rasterized. The number and total size of images waiting
+        to be saved are bounded by `_MAX_PENDING_SAVES` and
+        `_MAX_PENDING_SAVE_BYTES`.
 
-        success = q_image.save(image_path, quality=quality)
+        Args:
+            targets: `(rect, image_path)` pairs of the parts of the document
+                to render, in document coordinates, and their output paths.
+                See `render_image` for details.
+            dpm: The pixels per meter of the rendered images.
+            quality: The quality of the output images for compressed
+                image formats. See `render_image` for details.
+            bg_color: The background color for the images.
+            autocrop: Whether or not to crop the output images to tightly
+                fit the contents of their frames.
+            parallel: Whether to save images on background threads.
 
-        if not success:
-            raise ImageExportError(
-                "Unknown error occurred when exporting image to " + image_path
-            )
+        Raises:
+            ImageExportError: If Qt image export fails for unknown reasons.
+        """
+        q_color = color_to_q_color(bg_color)
+        max_pending = self._MAX_PENDING_SAVES if parallel else 0
+        # Pending saves and the byte sizes of their images
+        pending: deque[tuple[Future, int]] = deque()
+        pending_bytes = 0
+        with ThreadPoolExecutor(max_workers=max(max_pending, 1)) as saver:
+            for rect, image_path in targets:
+                scale = dpm / Meter(1).base_value
+                pix_width = int(rect.width.base_value * scale)
+                pix_height = int(rect.height.base_value * scale)
+                if (
+                    not autocrop
+                    and os.path.splitext(image_path)[1].lower() == ".png"
+                    and pix_width * pix_height > self._IMAGE_STRIP_MAX_PIXELS
+                ):
+                    self._render_png_in_strips(
+                        rect, image_path, pix_width, pix_height, dpm, quality, q_color
+                    )
+                    continue
+                if not max_pending:
+                    q_image = self._rasterize(rect, pix_width, pix_height, dpm, q_color)
+                    self._save_image(q_image, image_path, quality, q_color, autocrop)
+                    continue
+                # ARGB32 images use 4 bytes per pixel
+                image_bytes = pix_width * pix_height * 4
+                # Wait for saves before rasterizing, so the new image
+                # counts toward the memory bound.
+                while pending and (
+                    len(pending) >= max_pending
+                    or pending_bytes + image_bytes > self._MAX_PENDING_SAVE_BYTES
+                ):
+                    future, future_bytes = pending.popleft()
+                    future.result()
+                    pending_bytes -= future_bytes
+                q_image = self._rasterize(rect, pix_width, pix_height, dpm, q_color)
+                future = saver.submit(
+                    self._save_image, q_image, image_path, quality, q_color, autocrop
+                )
+                pending.append((future, image_bytes))
+                pending_bytes += image_bytes
+            while pending:
+                pending.popleft()[0].result()
 
     def destroy(self):
         """Destroy the window and all global interface-level data."""
@@ -184,6 +277,17 @@ class AppInterface:
 
     ######## PRIVATE METHODS ########
 
+    @staticmethod
+    def _headless_qt_args() -> list[str]:
+        """Get the `QApplication` arguments to use in headless mode."""
+        if os.environ.get("QT_QPA_PLATFORM"):
+            return []
+        return ["neoscore", "-platform", "offscreen"]
+
+    def _require_window(self):
+        if self.headless:
+            raise RuntimeError("Cannot show a window in headless mode.")
+
     def _remove_all_loaded_fonts(self):
         """Remove all fonts registered with `register_font()`.
 
@@ -194,9 +298,123 @@ class AppInterface:
             raise RuntimeError("Failed to remove application fonts.")
 
     def _clear_scene(self):
-        """Clear the QT Scene. This should be called before each render."""
+        """Clear the QT Scene.
+
+        Since renders are incremental, this discards all Qt objects
+        without updating the interfaces which created them.
+        """
         self.scene.clear()
 
+    def _rasterize(
+        self,
+        rect: Rect,
+        pix_width: int,
+        pix_height: int,
+        dpm: int,
+        q_color: QtGui.QColor,
+    ) -> QtGui.QImage:
+        q_image = QtGui.QImage(pix_width, pix_height, QtGui.QImage.Format_ARGB32)
+        q_image.setDotsPerMeterX(dpm)
+        q_image.setDotsPerMeterY(dpm)
+        q_image.fill(q_color)
+
+        painter = QtGui.QPainter()
+        painter.begin(q_image)
+
+        target_rect = QtCore.QRectF(q_image.rect())
+        source_rect = rect_to_qt_rect_f(rect)
+
+        self.scene.render(painter, target=target_rect, source=source_rect)
+        painter.end()
+        return q_image
+
+    @staticmethod
+    def _save_image(
+        q_image: QtGui.QImage,
+        image_path: str,
+        quality: int,
+        q_color: QtGui.QColor,
+        autocrop: bool,
+    ):
+        if autocrop:
+            q_image = images.autocrop(q_image, q_color)
+
+        success = q_image.save(image_path, quality=quality)
+
+        if not success:
+            raise ImageExportError(
+                "Unknown error occurred when exporting image to " + image_path
+            )
+
+    def _render_png_in_strips(
+        self,
+        rect: Rect,
+        image_path: str,
+        pix_width: int,
+        pix_height: int,
+        dpm: int,
+        quality: int,
+        q_color: QtGui.QColor,
+    ):
+        """Render a section of self.scene to a PNG one strip at a time.
+
+        Strips are rendered on the calling thread, since the scene is not
+        thread-safe, while finished strips are converted and compressed
+        on a background thread. At most two strips are held at once.
+
+        The strip transforms reproduce the whole-image transform exactly,
+        so the output is identical to rendering the image in one pass.
+        """
+        source_rect = rect_to_qt_rect_f(rect)
+        # `QGraphicsScene.render` keeps the aspect ratio of the source
+        ratio = min(pix_width / source_rect.width(), pix_height / source_rect.height())
+        strip_height = max(1, self._IMAGE_STRIP_MAX_PIXELS // pix_width)
+        # PNG compression levels follow Qt's mapping from quality
+        compression = -1 if quality == -1 else (100 - quality) * 9 // 91
+        try:
+            output_file = open(image_path, "wb")
+        except OSError as e:
+            raise ImageExportError(
+                "Unknown error occurred when exporting image to " + image_path
+            ) from e
+        with output_file, ThreadPoolExecutor(max_workers=1) as encoder:
+            writer = images.PngStreamWriter(
+                output_file, pix_width, pix_height, dpm, compression
+            )
+            pending: Optional[Future] = None
+            for strip_top in range(0, pix_height, strip_height):
+                height = min(strip_height, pix_height - strip_top)
+                q_image = QtGui.QImage(pix_width, height, QtGui.QImage.Format_ARGB32)
+                q_image.fill(q_color)
+                painter = QtGui.QPainter()
+                painter.begin(q_image)
+                # Shifting the painter and the target rect by the same
+                # integer keeps the scene transform bit-identical to the
+                # whole-image transform.
+                painter.translate(0, -strip_top)
+                self.scene.render(
+                    painter,
+                    target=QtCore.QRectF(0, strip_top, pix_width, height),
+                    source=QtCore.QRectF(
+                        source_rect.x(),
+                        source_rect.y() + (strip_top / ratio),
+                        source_rect.width(),
+                        height / ratio,
+                    ),
+                )
+                painter.end()
+                if pending:
+                    pending.result()
+                pending = encoder.submit(self._encode_png_strip, writer, q_image)
+            if pending:
+                pending.result()
+            writer.close()
+
+    @staticmethod
+    def _encode_png_strip(writer: images.PngStreamWriter, q_image: QtGui.QImage):
+        rgba_image = q_image.convertToFormat(QtGui.QImage.Format_RGBA8888)
+        writer.write_rows(rgba_image.constBits().asstring(rgba_image.sizeInBytes()))
+
     def _optimize_for_interactive_view(self):
         QtGui.QPixmapCache.setCacheLimit(constants.QT_PIXMAP_CACHE_LIMIT_KB)
         self.view.setViewportUpdateMode(3)  # NoViewportUpdate
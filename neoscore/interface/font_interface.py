@@ -1,3 +1,6 @@
+from __future__ import annotations
+
+import weakref
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -5,9 +8,13 @@ from PyQt5 import QtGui
 
 from neoscore.core import neoscore
 from neoscore.interface.qt.converters import qt_rect_to_rect
+from neoscore.utils.lru_cache import LruCache
 from neoscore.utils.rect import Rect
 from neoscore.utils.units import GraphicUnit, Unit
 
+_BOUNDING_RECT_CACHE_SIZE = 1000
+"""The number of `bounding_rect_of` results kept by each `FontInterface`"""
+
 
 @dataclass(frozen=True)
 class FontInterface:
@@ -43,6 +50,35 @@ class FontInterface:
 
     _qt_font_info_object: QtGui.QFontInfo = field(init=False)
     _qt_font_metrics_object: QtGui.QFontMetricsF = field(init=False)
+    _bounding_rect_cache: LruCache[str, Rect] = field(
+        init=False, compare=False, repr=False
+    )
+
+    @classmethod
+    def shared(
+        cls, family_name: str, size: Unit, weight: Optional[int], italic: bool
+    ) -> FontInterface:
+        """Get an interface shared by all fonts with the same properties.
+
+        Sharing interfaces avoids creating new Qt font objects for
+        every equivalent font, and lets fonts share measurements.
+        Interfaces are only shared within one `neoscore.setup()`.
+        """
+        global _shared_app_interface
+        app_interface = neoscore._app_interface
+        if (
+            _shared_app_interface is None
+            or _shared_app_interface() is not app_interface
+        ):
+            # Qt font objects must not outlive the application they belong to
+            _SHARED_INTERFACES.clear()
+            _shared_app_interface = weakref.ref(app_interface)
+        key = (family_name, size.base_value, weight, italic)
+        interface = _SHARED_INTERFACES.get(key)
+        if interface is None:
+            interface = cls(family_name, size, weight, italic)
+            _SHARED_INTERFACES[key] = interface
+        return interface
 
     def __post_init__(self):
         super().__setattr__(
@@ -59,10 +95,14 @@ class FontInterface:
         )
         self.qt_object.setPointSizeF(self.size.base_value)
         super().__setattr__("_qt_font_info_object", QtGui.QFontInfo(self.qt_object))
-        super().__setattr__(
-            "_qt_font_metrics_object",
-            QtGui.QFontMetricsF(self.qt_object, neoscore._app_interface.view),
-        )
+        view = neoscore._app_interface.view
+        if view is None:
+            # Headless mode; the default metrics match the primary screen,
+            # just as the view's would.
+            qt_font_metrics_object = QtGui.QFontMetricsF(self.qt_object)
+        else:
+            qt_font_metrics_object = QtGui.QFontMetricsF(self.qt_object, view)
+        super().__setattr__("_qt_font_metrics_object", qt_font_metrics_object)
         super().__setattr__(
             "ascent", GraphicUnit(self._qt_font_metrics_object.ascent())
         )
@@ -73,7 +113,25 @@ class FontInterface:
         super().__setattr__(
             "x_height", GraphicUnit(self._qt_font_metrics_object.xHeight())
         )
+        super().__setattr__(
+            "_bounding_rect_cache", LruCache(max_entries=_BOUNDING_RECT_CACHE_SIZE)
+        )
 
     def bounding_rect_of(self, text: str) -> Rect:
-        """Calculate the tight bounding rectangle around a string in this font."""
-        return qt_rect_to_rect(self._qt_font_metrics_object.tightBoundingRect(text))
+        """Calculate the tight bounding rectangle around a string in this font.
+
+        Results are cached, so repeated measurements of the same
+        string don't call into Qt.
+        """
+        rect = self._bounding_rect_cache.get(text)
+        if rect is None:
+            rect = qt_rect_to_rect(self._qt_font_metrics_object.tightBoundingRect(text))
+            self._bounding_rect_cache.put(text, rect)
+        return rect
+
+
+_SHARED_INTERFACES: dict[tuple[str, float, Optional[int], bool], FontInterface] = {}
+"""Interfaces given by `FontInterface.shared`, by their properties"""
+
+_shared_app_interface: Optional[weakref.ref] = None
+"""The app interface `_SHARED_INTERFACES` were created with"""
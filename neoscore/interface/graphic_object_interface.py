@@ -1,5 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
 
+from PyQt5.QtWidgets import QGraphicsItem
+
+from neoscore.core import neoscore
 from neoscore.interface.brush_interface import BrushInterface
 from neoscore.interface.pen_interface import PenInterface
 from neoscore.utils.point import Point
@@ -25,11 +29,59 @@ class GraphicObjectInterface:
 
     brush: BrushInterface
 
-    def render(self):
+    qt_object: Optional[QGraphicsItem] = field(
+        init=False, default=None, compare=False, repr=False
+    )
+    """The Qt object added to the scene by `render()`, if any."""
+
+    def render(self, previous: Optional["GraphicObjectInterface"] = None):
         """Render the object to the scene.
 
-        This is typically done by constructing a QGraphicsItem
-        subclass and adding it to the scene with
-        `neoscore._app_interface.scene.addItem(qt_object)`.
+        This constructs the object's QGraphicsItem with
+        `_create_qt_object()`, stores it in `qt_object`, and adds it to
+        the scene.
+
+        Args:
+            previous: An interface of the same type which rendered the
+                same object slice in an earlier render. If given, its Qt
+                object is taken over and updated in place with
+                `_update_qt_object()` instead of creating a new one.
+        """
+        if (
+            previous is not None
+            and type(previous) == type(self)
+            and previous.qt_object is not None
+        ):
+            qt_object = previous.qt_object
+            object.__setattr__(previous, "qt_object", None)
+            self._update_qt_object(qt_object, previous)
+        else:
+            if previous is not None:
+                previous.remove()
+            qt_object = self._create_qt_object()
+            neoscore._app_interface.scene.addItem(qt_object)
+        super().__setattr__("qt_object", qt_object)
+
+    def remove(self):
+        """Remove the object from the scene if it has been rendered."""
+        if self.qt_object is None:
+            return
+        scene = self.qt_object.scene()
+        if scene is not None:
+            scene.removeItem(self.qt_object)
+        super().__setattr__("qt_object", None)
+
+    def _create_qt_object(self) -> QGraphicsItem:
+        """Create and return this interface's underlying Qt object"""
+        raise NotImplementedError
+
+    def _update_qt_object(
+        self, qt_object: QGraphicsItem, previous: "GraphicObjectInterface"
+    ):
+        """Update a Qt object created by a previous interface to match this one.
+
+        Implementations should only touch properties which differ from
+        `previous`, since changing item geometry or appearance discards
+        Qt's cached rendering of the item.
         """
         raise NotImplementedError
@@ -1,3 +1,7 @@
+import struct
+import zlib
+from typing import BinaryIO
+
 from PyQt5.QtGui import QBitmap, QRegion
 
 from neoscore.utils.units import Inch, Mm
@@ -47,3 +51,61 @@ def autocrop(q_image, q_color):
     mask = q_image.createMaskFromColor(q_color.rgb(), _QT_MASK_IN_COLOR)
     crop_rect = QRegion(QBitmap.fromImage(mask)).boundingRect()
     return q_image.copy(crop_rect)
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_RGBA_COLOR_TYPE = 6
+_PNG_PHYS_UNIT_METER = 1
+_PNG_NO_FILTER = b"\x00"
+
+
+class PngStreamWriter:
+    """An incremental encoder for 8-bit RGBA PNG images.
+
+    Rows are compressed and written as they are given, so images can
+    be encoded without ever holding all their pixels in memory.
+    """
+
+    def __init__(
+        self, file: BinaryIO, width: int, height: int, dpm: int, compression: int = -1
+    ):
+        """
+        Args:
+            file: A binary file to write the image to.
+            width: The image width in pixels.
+            height: The image height in pixels.
+            dpm: The pixels per meter of the image.
+            compression: A zlib compression level from `0` to `9`,
+                or `-1` for the default level.
+        """
+        self._file = file
+        self._row_length = width * 4
+        self._compressor = zlib.compressobj(compression)
+        file.write(_PNG_SIGNATURE)
+        self._write_chunk(
+            b"IHDR",
+            struct.pack(">IIBBBBB", width, height, 8, _PNG_RGBA_COLOR_TYPE, 0, 0, 0),
+        )
+        self._write_chunk(b"pHYs", struct.pack(">IIB", dpm, dpm, _PNG_PHYS_UNIT_METER))
+
+    def write_rows(self, rgba_data: bytes):
+        """Write rows of unpadded, non-premultiplied RGBA pixel data."""
+        row_length = self._row_length
+        filtered = b"".join(
+            _PNG_NO_FILTER + rgba_data[start : start + row_length]
+            for start in range(0, len(rgba_data), row_length)
+        )
+        compressed = self._compressor.compress(filtered)
+        if compressed:
+            self._write_chunk(b"IDAT", compressed)
+
+    def close(self):
+        """Finish the image. This does not close the underlying file."""
+        self._write_chunk(b"IDAT", self._compressor.flush())
+        self._write_chunk(b"IEND", b"")
+
+    def _write_chunk(self, chunk_type: bytes, data: bytes):
+        self._file.write(struct.pack(">I", len(data)))
+        self._file.write(chunk_type)
+        self._file.write(data)
+        self._file.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(chunk_type))))
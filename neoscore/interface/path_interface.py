@@ -1,9 +1,10 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
 from typing import NamedTuple, Optional, Union
 
 from PyQt5.QtGui import QPainterPath
 
-from neoscore.core import neoscore
 from neoscore.interface.graphic_object_interface import GraphicObjectInterface
 from neoscore.interface.qt.converters import point_to_qt_point_f
 from neoscore.interface.qt.q_clipping_path import QClippingPath
@@ -74,14 +75,6 @@ class PathInterface(GraphicObjectInterface):
                 raise TypeError("Unknown ResolvedPathElement type")
         return path
 
-    def render(self):
-        """Render the line to the scene.
-
-        Returns: None
-        """
-        qt_object = self._create_qt_object()
-        neoscore._app_interface.scene.addItem(qt_object)
-
     ######## PRIVATE METHODS ########
 
     def _create_qt_object(self):
@@ -96,3 +89,29 @@ class PathInterface(GraphicObjectInterface):
         qt_object.setPen(self.pen.qt_object)  # No pen
         qt_object.update_geometry()
         return qt_object
+
+    def _update_qt_object(self, qt_object: QClippingPath, previous: PathInterface):
+        if self.pos != previous.pos:
+            qt_object.setPos(point_to_qt_point_f(self.pos))
+        if self.brush != previous.brush:
+            qt_object.setBrush(self.brush.qt_object)
+        geometry_changed = False
+        if self.pen != previous.pen:
+            qt_object.setPen(self.pen.qt_object)
+            geometry_changed = True
+        if self.elements != previous.elements:
+            qt_object.setPath(PathInterface.create_qt_path(self.elements))
+            geometry_changed = True
+        if (
+            self.clip_start_x != previous.clip_start_x
+            or self.clip_width != previous.clip_width
+        ):
+            qt_object.clip_start_x = (
+                self.clip_start_x.base_value if self.clip_start_x is not None else None
+            )
+            qt_object.clip_width = (
+                self.clip_width.base_value if self.clip_width is not None else None
+            )
+            geometry_changed = True
+        if geometry_changed:
+            qt_object.update_geometry()
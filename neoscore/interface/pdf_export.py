@@ -0,0 +1,336 @@
+"""A PDF writer streaming resolved graphic interfaces directly to a file.
+
+Unlike rendering through `QPrinter`, which writes the full outline of
+every text item it draws, this writer stores each distinct text outline
+once as a form XObject and draws every occurrence by reference. Scores
+repeat a small set of glyphs (noteheads, accidentals, rests...) many
+times, so this makes large scores much smaller and faster to write.
+
+Brushes with non-solid patterns are written as solid fills.
+"""
+
+from __future__ import annotations
+
+import zlib
+from typing import BinaryIO, Iterable, Optional
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QPainterPath
+
+from neoscore import constants
+from neoscore.core.brush_pattern import BrushPattern
+from neoscore.core.pen_cap_style import PenCapStyle
+from neoscore.core.pen_join_style import PenJoinStyle
+from neoscore.core.pen_pattern import PenPattern
+from neoscore.interface.brush_interface import BrushInterface
+from neoscore.interface.graphic_object_interface import GraphicObjectInterface
+from neoscore.interface.path_interface import PathInterface
+from neoscore.interface.pen_interface import PenInterface
+from neoscore.interface.text_interface import TextInterface
+from neoscore.interface.vector_export_common import (
+    DASH_PATTERNS,
+    clip_geometry,
+    format_number,
+    path_segments,
+    text_outline_key,
+)
+from neoscore.utils.color import Color
+from neoscore.utils.rect import Rect
+
+# Document units are printed at `PRINT_DPI`; PDF points are 1/72 inch
+_POINT_RATIO = 72 / constants.PRINT_DPI
+
+_CATALOG_ID = 1
+_PAGES_ID = 2
+_RESOURCES_ID = 3
+
+_CAP_STYLES = {
+    PenCapStyle.FLAT: 0,
+    PenCapStyle.ROUND: 1,
+    PenCapStyle.SQUARE: 2,
+}
+
+_JOIN_STYLES = {
+    PenJoinStyle.MITER: 0,
+    PenJoinStyle.ROUND: 1,
+    PenJoinStyle.BEVEL: 2,
+}
+
+# Qt's default miter limit
+_MITER_LIMIT = 2
+
+
+class PdfWriter:
+    """A writer streaming resolved graphic interfaces to a PDF document.
+
+    Pages are written one at a time with `begin_page`, `write`, and
+    `end_page`. Form XObjects for text outlines are written the first
+    time each outline is drawn, and the resources shared by all pages
+    are written by `close`.
+    """
+
+    def __init__(self, file: BinaryIO):
+        """
+        Args:
+            file: A binary file to write the document to.
+        """
+        self._file = file
+        self._offset = 0
+        self._object_offsets: dict[int, int] = {}
+        self._next_id = _RESOURCES_ID + 1
+        self._page_ids: list[int] = []
+        self._form_ids: dict[tuple[tuple, str], int] = {}
+        self._graphics_states: dict[tuple[int, int], str] = {}
+        self._content: Optional[list[str]] = None
+        self._page_rect: Optional[Rect] = None
+        self._write_bytes(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def begin_page(self, rect: Rect):
+        """Start a new page showing part of the canvas.
+
+        Args:
+            rect: The part of the canvas to show, in document coordinates.
+                This also gives the size of the page.
+        """
+        self._page_rect = rect
+        # Scale document units to points, flip the y axis, and move
+        # the rect's corner to the page origin.
+        offset_x = format_number(-rect.x.base_value * _POINT_RATIO)
+        offset_y = format_number(
+            (rect.y.base_value + rect.height.base_value) * _POINT_RATIO
+        )
+        ratio = format_number(_POINT_RATIO)
+        self._content = [f"{ratio} 0 0 -{ratio} {offset_x} {offset_y} cm"]
+
+    def write(self, interface: GraphicObjectInterface):
+        """Draw an interface on the current page.
+
+        Interfaces of types without PDF support are skipped.
+        """
+        if isinstance(interface, PathInterface):
+            self._write_path(interface)
+        elif isinstance(interface, TextInterface):
+            self._write_text(interface)
+
+    def write_all(self, interfaces: Iterable[GraphicObjectInterface]):
+        for interface in interfaces:
+            self.write(interface)
+
+    def end_page(self):
+        """Finish the current page."""
+        content_id = self._write_stream("\n".join(self._content), {})
+        page_id = self._reserve_id()
+        rect = self._page_rect
+        self._write_object(
+            page_id,
+            f"<< /Type /Page /Parent {_PAGES_ID} 0 R"
+            f" /MediaBox [0 0 {format_number(rect.width.base_value * _POINT_RATIO)}"
+            f" {format_number(rect.height.base_value * _POINT_RATIO)}]"
+            f" /Resources {_RESOURCES_ID} 0 R /Contents {content_id} 0 R >>",
+        )
+        self._page_ids.append(page_id)
+        self._content = None
+        self._page_rect = None
+
+    def close(self):
+        """Finish the document. This does not close the underlying file."""
+        forms = "".join(
+            f" /F{form_id} {form_id} 0 R" for form_id in self._form_ids.values()
+        )
+        graphics_states = "".join(
+            f" /{name} << /CA {format_number(stroke / 255)}"
+            f" /ca {format_number(fill / 255)} >>"
+            for (stroke, fill), name in self._graphics_states.items()
+        )
+        self._write_object(
+            _RESOURCES_ID,
+            f"<< /XObject <<{forms} >> /ExtGState <<{graphics_states} >> >>",
+        )
+        kids = " ".join(f"{page_id} 0 R" for page_id in self._page_ids)
+        self._write_object(
+            _PAGES_ID,
+            f"<< /Type /Pages /Kids [{kids}] /Count {len(self._page_ids)} >>",
+        )
+        self._write_object(_CATALOG_ID, f"<< /Type /Catalog /Pages {_PAGES_ID} 0 R >>")
+        xref_offset = self._offset
+        object_count = self._next_id
+        lines = [f"xref\n0 {object_count}\n0000000000 65535 f \n"]
+        for obj_id in range(1, object_count):
+            lines.append(f"{self._object_offsets[obj_id]:010d} 00000 n \n")
+        lines.append(
+            f"trailer\n<< /Size {object_count} /Root {_CATALOG_ID} 0 R >>\n"
+            f"startxref\n{xref_offset}\n%%EOF\n"
+        )
+        self._write_bytes("".join(lines).encode("ascii"))
+
+    ######## PRIVATE METHODS ########
+
+    def _write_path(self, interface: PathInterface):
+        qt_path = PathInterface.create_qt_path(interface.elements)
+        paint_operator = _paint_operator(interface.pen, interface.brush, qt_path)
+        self._write_placed(
+            interface, qt_path, f"{_path_operators(qt_path)}\n{paint_operator}", 1
+        )
+
+    def _write_text(self, interface: TextInterface):
+        outline = interface.outline()
+        qt_path, scale = outline.path, outline.scale
+        paint_operator = _paint_operator(interface.pen, interface.brush, qt_path)
+        key = (text_outline_key(interface, outline), paint_operator)
+        form_id = self._form_ids.get(key)
+        if form_id is None:
+            form_id = self._write_form(qt_path, paint_operator)
+            self._form_ids[key] = form_id
+        self._write_placed(interface, qt_path, f"/F{form_id} Do", scale)
+
+    def _write_form(self, qt_path: QPainterPath, paint_operator: str) -> int:
+        """Write a form XObject drawing a path, returning its object ID.
+
+        Forms are named in the page resources by their ID prefixed with `F`.
+        """
+        bounds = qt_path.boundingRect()
+        # Forms are clipped to their bounding box, so leave plenty of
+        # room for strokes, whose width depends on each occurrence.
+        padding = max(bounds.width(), bounds.height())
+        bounding_box = " ".join(
+            format_number(value)
+            for value in (
+                bounds.left() - padding,
+                bounds.top() - padding,
+                bounds.right() + padding,
+                bounds.bottom() + padding,
+            )
+        )
+        return self._write_stream(
+            f"{_path_operators(qt_path)}\n{paint_operator}",
+            {"Type": "/XObject", "Subtype": "/Form", "BBox": f"[{bounding_box}]"},
+        )
+
+    def _write_placed(
+        self,
+        interface: PathInterface | TextInterface,
+        qt_path: QPainterPath,
+        drawing: str,
+        scale: float,
+    ):
+        """Draw operators positioned, scaled, and clipped like the Qt item."""
+        content = self._content
+        content.append("q")
+        content.extend(_pen_operators(interface.pen))
+        content.extend(_brush_operators(interface.brush))
+        stroke_alpha = (
+            interface.pen.color.alpha
+            if interface.pen.pattern != PenPattern.NO_PEN
+            else 255
+        )
+        fill_alpha = (
+            interface.brush.color.alpha
+            if interface.brush.pattern != BrushPattern.NO_BRUSH
+            else 255
+        )
+        if stroke_alpha != 255 or fill_alpha != 255:
+            content.append(f"/{self._graphics_state(stroke_alpha, fill_alpha)} gs")
+        pos_x = format_number(interface.pos.x.base_value)
+        pos_y = format_number(interface.pos.y.base_value)
+        content.append(f"1 0 0 1 {pos_x} {pos_y} cm")
+        if scale != 1:
+            content.append(f"{format_number(scale)} 0 0 {format_number(scale)} 0 0 cm")
+        clip = clip_geometry(interface, qt_path)
+        if clip is not None:
+            offset, clip_rect = clip
+            if offset:
+                content.append(f"1 0 0 1 {format_number(offset)} 0 cm")
+            rect = (clip_rect.x(), clip_rect.y(), clip_rect.width(), clip_rect.height())
+            content.append(" ".join(format_number(value) for value in rect) + " re W n")
+        content.append(drawing)
+        content.append("Q")
+
+    def _graphics_state(self, stroke_alpha: int, fill_alpha: int) -> str:
+        """Get the resource name of a graphics state setting opacity."""
+        key = (stroke_alpha, fill_alpha)
+        name = self._graphics_states.get(key)
+        if name is None:
+            name = f"G{len(self._graphics_states)}"
+            self._graphics_states[key] = name
+        return name
+
+    def _reserve_id(self) -> int:
+        obj_id = self._next_id
+        self._next_id += 1
+        return obj_id
+
+    def _write_bytes(self, data: bytes):
+        self._file.write(data)
+        self._offset += len(data)
+
+    def _write_object(self, obj_id: int, body: str):
+        self._object_offsets[obj_id] = self._offset
+        self._write_bytes(f"{obj_id} 0 obj\n{body}\nendobj\n".encode("ascii"))
+
+    def _write_stream(self, content: str, entries: dict[str, str]) -> int:
+        """Write a compressed stream object, returning its object ID."""
+        obj_id = self._reserve_id()
+        data = zlib.compress(content.encode("ascii"))
+        dictionary = "".join(f" /{key} {value}" for key, value in entries.items())
+        self._object_offsets[obj_id] = self._offset
+        self._write_bytes(
+            f"{obj_id} 0 obj\n<<{dictionary} /Filter /FlateDecode"
+            f" /Length {len(data)} >>\nstream\n".encode("ascii")
+        )
+        self._write_bytes(data)
+        self._write_bytes(b"\nendstream\nendobj\n")
+        return obj_id
+
+
+def _color_components(color: Color) -> str:
+    return " ".join(
+        format_number(channel / 255) for channel in (color.red, color.green, color.blue)
+    )
+
+
+def _pen_operators(pen: PenInterface) -> list[str]:
+    if pen.pattern == PenPattern.NO_PEN:
+        return []
+    # Qt prints cosmetic pens one device pixel wide, which is one
+    # document unit at `PRINT_DPI`.
+    width = pen.thickness.base_value or 1
+    operators = [
+        f"{_color_components(pen.color)} RG",
+        f"{format_number(width)} w",
+        f"{_CAP_STYLES[pen.cap_style]} J",
+        f"{_JOIN_STYLES[pen.join_style]} j",
+        f"{_MITER_LIMIT} M",
+    ]
+    dashes = DASH_PATTERNS.get(pen.pattern)
+    if dashes:
+        dash_array = " ".join(format_number(dash * width) for dash in dashes)
+        operators.append(f"[{dash_array}] 0 d")
+    return operators
+
+
+def _brush_operators(brush: BrushInterface) -> list[str]:
+    if brush.pattern == BrushPattern.NO_BRUSH:
+        return []
+    return [f"{_color_components(brush.color)} rg"]
+
+
+def _paint_operator(
+    pen: PenInterface, brush: BrushInterface, qt_path: QPainterPath
+) -> str:
+    stroke = pen.pattern != PenPattern.NO_PEN
+    fill = brush.pattern != BrushPattern.NO_BRUSH
+    if not fill:
+        return "S" if stroke else "n"
+    operator = "B" if stroke else "f"
+    if qt_path.fillRule() == Qt.FillRule.OddEvenFill:
+        operator += "*"
+    return operator
+
+
+def _path_operators(qt_path: QPainterPath) -> str:
+    # PDF path operators are the lowercase segment types
+    return "\n".join(
+        " ".join(format_number(value) for value in coordinates)
+        + f" {segment_type.lower()}"
+        for segment_type, coordinates in path_segments(qt_path)
+    )
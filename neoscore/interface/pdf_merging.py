@@ -0,0 +1,157 @@
+"""Concatenation of PDF files written by Qt.
+
+Qt's PDF writer produces a simple file structure: a classic
+cross-reference table, no object streams, and a flat page tree whose
+kids are all page objects. This module merges such files by copying
+their objects into one file, renumbering object references along the
+way. It does not support PDFs from other sources.
+"""
+
+import re
+
+_STARTXREF_RE = re.compile(rb"startxref\s+(\d+)")
+_XREF_SUBSECTION_RE = re.compile(rb"(\d+) (\d+)\s*\n")
+_XREF_ENTRY_RE = re.compile(rb"(\d{10}) (\d{5}) ([nf])")
+_OBJECT_HEADER_RE = re.compile(rb"(\d+) 0 obj")
+_STREAM_START_RE = re.compile(rb">>\s*stream\r?\n")
+_REFERENCE_RE = re.compile(rb"\b(\d+) 0 R\b")
+_TRAILER_ROOT_RE = re.compile(rb"/Root (\d+) 0 R")
+_TRAILER_INFO_RE = re.compile(rb"/Info (\d+) 0 R")
+_PAGES_REF_RE = re.compile(rb"/Pages (\d+) 0 R")
+_KIDS_RE = re.compile(rb"/Kids\s*\[([^\]]*)\]")
+_COUNT_RE = re.compile(rb"/Count \d+")
+
+_CATALOG_ID = 1
+_PAGES_ID = 2
+
+
+class _QtPdf:
+    """The objects of a parsed Qt PDF file."""
+
+    def __init__(self, data: bytes):
+        startxref = _STARTXREF_RE.findall(data)
+        if not startxref or not data.startswith(b"xref", int(startxref[-1])):
+            raise ValueError("Only PDFs with a cross-reference table are supported")
+        xref_offset = int(startxref[-1])
+        trailer_offset = data.index(b"trailer", xref_offset)
+        offsets = self._parse_xref(data[xref_offset + 4 : trailer_offset])
+        trailer = data[trailer_offset:]
+        self.root_id = int(_TRAILER_ROOT_RE.search(trailer).group(1))
+        info_match = _TRAILER_INFO_RE.search(trailer)
+        self.info_id = int(info_match.group(1)) if info_match else None
+        # Each object runs until the next object, or the xref table
+        bounds = sorted(offsets.values()) + [xref_offset]
+        ends = {start: end for start, end in zip(bounds, bounds[1:])}
+        self.objects: dict[int, bytes] = {}
+        for obj_id, offset in offsets.items():
+            body = data[offset : ends[offset]].rstrip()
+            header = _OBJECT_HEADER_RE.match(body)
+            if header is None or int(header.group(1)) != obj_id:
+                raise ValueError(f"Malformed object {obj_id} at offset {offset}")
+            self.objects[obj_id] = body[header.end() :]
+        self.pages_id = int(_PAGES_REF_RE.search(self.objects[self.root_id]).group(1))
+        pages = self.objects[self.pages_id]
+        self.page_ids = [
+            int(ref) for ref in _REFERENCE_RE.findall(_KIDS_RE.search(pages).group(1))
+        ]
+
+    @staticmethod
+    def _parse_xref(table: bytes) -> dict[int, int]:
+        offsets = {}
+        position = 0
+        while True:
+            while position < len(table) and table[position] in b" \r\n":
+                position += 1
+            subsection = _XREF_SUBSECTION_RE.match(table, position)
+            if subsection is None:
+                return offsets
+            first_id = int(subsection.group(1))
+            entries = _XREF_ENTRY_RE.findall(
+                table,
+                subsection.end(),
+                subsection.end() + 20 * int(subsection.group(2)),
+            )
+            for i, (offset, _, kind) in enumerate(entries):
+                if kind == b"n":
+                    offsets[first_id + i] = int(offset)
+            position = subsection.end() + 20 * len(entries)
+
+
+def _renumber(body: bytes, id_map: dict[int, int]) -> bytes:
+    """Rewrite object references in an object body using `id_map`.
+
+    Stream data is left untouched.
+    """
+    stream_start = _STREAM_START_RE.search(body)
+    split = stream_start.start() if stream_start else len(body)
+
+    def replace(match):
+        return b"%d 0 R" % id_map[int(match.group(1))]
+
+    return _REFERENCE_RE.sub(replace, body[:split]) + body[split:]
+
+
+def merge_pdfs(paths: list[str], output_path: str):
+    """Concatenate the pages of Qt-written PDF files into one file.
+
+    The document info (title, creator, etc.) of the first file is kept.
+
+    Args:
+        paths: The PDF files to merge, in page order.
+        output_path: The path of the merged file.
+            If a file already exists there, it will be overwritten.
+
+    Raises:
+        ValueError: If a file does not have the structure Qt produces.
+    """
+    pdfs = []
+    for path in paths:
+        with open(path, "rb") as pdf_file:
+            pdfs.append(_QtPdf(pdf_file.read()))
+    next_id = _PAGES_ID + 1
+    new_objects: list[tuple[int, bytes]] = []
+    page_ids: list[int] = []
+    info_id = None
+    for index, pdf in enumerate(pdfs):
+        skipped = {pdf.root_id, pdf.pages_id}
+        if index > 0 and pdf.info_id is not None:
+            skipped.add(pdf.info_id)
+        id_map = {pdf.pages_id: _PAGES_ID, pdf.root_id: _CATALOG_ID}
+        for obj_id in sorted(pdf.objects):
+            if obj_id not in skipped:
+                id_map[obj_id] = next_id
+                next_id += 1
+        for obj_id in sorted(pdf.objects):
+            if obj_id not in skipped:
+                new_objects.append(
+                    (id_map[obj_id], _renumber(pdf.objects[obj_id], id_map))
+                )
+        page_ids.extend(id_map[page_id] for page_id in pdf.page_ids)
+        if index == 0 and pdf.info_id is not None:
+            info_id = id_map[pdf.info_id]
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    pages = _KIDS_RE.sub(
+        lambda _: b"/Kids [" + kids + b"]", pdfs[0].objects[pdfs[0].pages_id]
+    )
+    pages = _COUNT_RE.sub(b"/Count %d" % len(page_ids), pages)
+    new_objects.append((_CATALOG_ID, b"\n<< /Type /Catalog /Pages 2 0 R >>\nendobj"))
+    new_objects.append((_PAGES_ID, pages))
+    new_objects.sort()
+    output = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for obj_id, body in new_objects:
+        offsets.append(len(output))
+        output += b"%d 0 obj" % obj_id + body + b"\n"
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(new_objects) + 1)
+    for offset in offsets:
+        output += b"%010d 00000 n \n" % offset
+    output += b"trailer\n<<\n/Size %d\n/Root %d 0 R\n" % (
+        len(new_objects) + 1,
+        _CATALOG_ID,
+    )
+    if info_id is not None:
+        output += b"/Info %d 0 R\n" % info_id
+    output += b">>\nstartxref\n%d\n%%%%EOF\n" % xref_offset
+    with open(output_path, "wb") as output_file:
+        output_file.write(output)
@@ -23,6 +23,7 @@ class QClippingPath(QGraphicsPathItem):
         qt_path: QPainterPath,
         clip_start_x: Optional[float],
         clip_width: Optional[float],
+        padding: Optional[float] = None,
     ):
         """
         Args:
@@ -32,10 +33,14 @@ class QClippingPath(QGraphicsPathItem):
                 path clipping region. Use `None` to render from the start.
             clip_width: The width of the path clipping region.
                 Use `None` to render to the end
+            padding: Extra area padding to be added to all sides of the
+                clipping region and bounding rect. Use `None` to pad by
+                the pen width.
         """
         super().__init__(qt_path)
         self.clip_start_x = clip_start_x
         self.clip_width = clip_width
+        self.padding = padding
         self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.update_geometry()
 
@@ -59,17 +64,18 @@ class QClippingPath(QGraphicsPathItem):
     def update_geometry(self):
         self.prepareGeometryChange()
         path_bounding_rect = self.path().boundingRect()
+        padding = self.padding if self.padding is not None else self.pen().width()
         self.clip_rect = QClippingPath.calculate_clipping_area(
             path_bounding_rect,
             self.clip_start_x,
             self.clip_width,
-            self.pen().width(),
+            padding,
         )
         self.bounding_rect = QClippingPath.calculate_bounding_rect(
             path_bounding_rect,
             self.clip_start_x,
             self.clip_width,
-            self.pen().width(),
+            padding,
         )
         if self.clip_start_x is not None:
             self.painter_offset = QtCore.QPointF(
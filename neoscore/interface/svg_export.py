@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from typing import Iterable, TextIO
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QPainterPath
+
+from neoscore import constants
+from neoscore.core.brush_pattern import BrushPattern
+from neoscore.core.pen_cap_style import PenCapStyle
+from neoscore.core.pen_join_style import PenJoinStyle
+from neoscore.core.pen_pattern import PenPattern
+from neoscore.interface.brush_interface import BrushInterface
+from neoscore.interface.graphic_object_interface import GraphicObjectInterface
+from neoscore.interface.path_interface import PathInterface
+from neoscore.interface.pen_interface import PenInterface
+from neoscore.interface.text_interface import TextInterface
+from neoscore.interface.vector_export_common import (
+    DASH_PATTERNS,
+    clip_geometry,
+    format_number,
+    path_segments,
+    text_outline_key,
+)
+from neoscore.utils.color import Color
+from neoscore.utils.rect import Rect
+
+_SVG_NAMESPACE = "http://www.w3.org/2000/svg"
+_XLINK_NAMESPACE = "http://www.w3.org/1999/xlink"
+
+_CAP_STYLES = {
+    PenCapStyle.SQUARE: "square",
+    PenCapStyle.FLAT: "butt",
+    PenCapStyle.ROUND: "round",
+}
+
+_JOIN_STYLES = {
+    PenJoinStyle.BEVEL: "bevel",
+    PenJoinStyle.MITER: "miter",
+    PenJoinStyle.ROUND: "round",
+}
+
+
+class SvgWriter:
+    """A writer streaming resolved graphic interfaces to an SVG document.
+
+    Paths are written directly as `<path>` elements. Text outlines are
+    written once per distinct string and font as `<path>` definitions,
+    and every occurrence is placed with a `<use>` element referring to
+    them, so repeated glyphs like noteheads are only stored once.
+
+    Brushes with non-solid patterns are written as solid fills.
+    """
+
+    def __init__(self, file: TextIO, rect: Rect):
+        """
+        Args:
+            file: A text file to write the document to.
+            rect: The part of the canvas to show, in document coordinates.
+        """
+        self._file = file
+        self._glyph_ids: dict[tuple, str] = {}
+        self._clip_count = 0
+        x, y = rect.x.base_value, rect.y.base_value
+        width, height = rect.width.base_value, rect.height.base_value
+        # Document units are printed at `PRINT_DPI`; SVG points are 1/72 inch
+        point_ratio = 72 / constants.PRINT_DPI
+        view_box = " ".join(format_number(value) for value in (x, y, width, height))
+        file.write(
+            f'<svg xmlns="{_SVG_NAMESPACE}" xmlns:xlink="{_XLINK_NAMESPACE}"'
+            f' width="{format_number(width * point_ratio)}pt"'
+            f' height="{format_number(height * point_ratio)}pt"'
+            f' viewBox="{view_box}">\n'
+        )
+
+    def write(self, interface: GraphicObjectInterface):
+        """Write an interface to the document.
+
+        Interfaces of types without SVG support are skipped.
+        """
+        if isinstance(interface, PathInterface):
+            self._write_path(interface)
+        elif isinstance(interface, TextInterface):
+            self._write_text(interface)
+
+    def write_all(self, interfaces: Iterable[GraphicObjectInterface]):
+        for interface in interfaces:
+            self.write(interface)
+
+    def close(self):
+        """Finish the document. This does not close the underlying file."""
+        self._file.write("</svg>\n")
+
+    ######## PRIVATE METHODS ########
+
+    def _write_path(self, interface: PathInterface):
+        qt_path = PathInterface.create_qt_path(interface.elements)
+        style = _pen_attributes(interface.pen) + _brush_attributes(interface.brush)
+        style += _fill_rule_attribute(qt_path)
+        element = f'<path d="{_path_data(qt_path)}"{style}'
+        self._write_placed(interface, qt_path, element, 1)
+
+    def _write_text(self, interface: TextInterface):
+        outline = interface.outline()
+        qt_path, scale = outline.path, outline.scale
+        key = text_outline_key(interface, outline)
+        glyph_id = self._glyph_ids.get(key)
+        if glyph_id is None:
+            glyph_id = f"g{len(self._glyph_ids)}"
+            self._glyph_ids[key] = glyph_id
+            self._file.write(
+                f'<defs><path id="{glyph_id}" d="{_path_data(qt_path)}"'
+                f"{_fill_rule_attribute(qt_path)}/></defs>\n"
+            )
+        style = _pen_attributes(interface.pen) + _brush_attributes(interface.brush)
+        element = f'<use xlink:href="#{glyph_id}"{style}'
+        self._write_placed(interface, qt_path, element, scale)
+
+    def _write_placed(
+        self,
+        interface: PathInterface | TextInterface,
+        qt_path: QPainterPath,
+        element: str,
+        scale: float,
+    ):
+        """Write an element, positioned, scaled, and clipped like its Qt item.
+
+        `element` should be an unterminated start tag.
+        """
+        transform = f"translate({format_number(interface.pos.x.base_value)}"
+        transform += f" {format_number(interface.pos.y.base_value)})"
+        if scale != 1:
+            transform += f" scale({format_number(scale)})"
+        clip = clip_geometry(interface, qt_path)
+        if clip is None:
+            self._file.write(f'{element} transform="{transform}"/>\n')
+            return
+        offset, clip_rect = clip
+        clip_id = f"c{self._clip_count}"
+        self._clip_count += 1
+        rect_x, rect_y = format_number(clip_rect.x()), format_number(clip_rect.y())
+        rect_width = format_number(clip_rect.width())
+        rect_height = format_number(clip_rect.height())
+        self._file.write(
+            f'<g transform="{transform} translate({format_number(offset)} 0)">'
+            f'<clipPath id="{clip_id}"><rect x="{rect_x}" y="{rect_y}"'
+            f' width="{rect_width}" height="{rect_height}"/></clipPath>'
+            f'{element} clip-path="url(#{clip_id})"/></g>\n'
+        )
+
+
+def _fill_rule_attribute(qt_path: QPainterPath) -> str:
+    if qt_path.fillRule() == Qt.FillRule.OddEvenFill:
+        return ' fill-rule="evenodd"'
+    return ""
+
+
+def _path_data(qt_path: QPainterPath) -> str:
+    # SVG path commands are named like the segment types
+    return "".join(
+        segment_type + " ".join(format_number(value) for value in coordinates)
+        for segment_type, coordinates in path_segments(qt_path)
+    )
+
+
+def _color_attributes(prefix: str, color: Color) -> str:
+    attributes = f' {prefix}="#{color.red:02x}{color.green:02x}{color.blue:02x}"'
+    if color.alpha != 255:
+        attributes += f' {prefix}-opacity="{format_number(color.alpha / 255)}"'
+    return attributes
+
+
+def _pen_attributes(pen: PenInterface) -> str:
+    if pen.pattern == PenPattern.NO_PEN:
+        return ' stroke="none"'
+    attributes = _color_attributes("stroke", pen.color)
+    width = pen.thickness.base_value
+    if width == 0:
+        # Zero-width Qt pens are cosmetic, always 1 pixel wide
+        width = 1
+        attributes += ' vector-effect="non-scaling-stroke"'
+    attributes += f' stroke-width="{format_number(width)}"'
+    attributes += f' stroke-linecap="{_CAP_STYLES[pen.cap_style]}"'
+    attributes += f' stroke-linejoin="{_JOIN_STYLES[pen.join_style]}"'
+    dashes = DASH_PATTERNS.get(pen.pattern)
+    if dashes:
+        dash_array = " ".join(format_number(dash * width) for dash in dashes)
+        attributes += f' stroke-dasharray="{dash_array}"'
+    return attributes
+
+
+def _brush_attributes(brush: BrushInterface) -> str:
+    if brush.pattern == BrushPattern.NO_BRUSH:
+        return ' fill="none"'
+    return _color_attributes("fill", brush.color)
@@ -1,14 +1,16 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
 from typing import NamedTuple, Optional
 
 from PyQt5.QtGui import QFont, QPainterPath
 from PyQt5.QtWidgets import QGraphicsItem
 
-from neoscore.core import neoscore
 from neoscore.interface.font_interface import FontInterface
 from neoscore.interface.graphic_object_interface import GraphicObjectInterface
 from neoscore.interface.qt.converters import point_to_qt_point_f
 from neoscore.interface.qt.q_clipping_path import QClippingPath
+from neoscore.utils.lru_cache import LruCache
 from neoscore.utils.units import Unit
 
 
@@ -24,7 +26,39 @@ class _CachedTextPath(NamedTuple):
     generation_font_size: float
 
 
-_PATH_CACHE: dict[_CachedTextKey, _CachedTextPath] = {}
+class TextOutline(NamedTuple):
+    """The outline path of a text item and the scale to draw it at."""
+
+    path: QPainterPath
+    """The outline, which may be shared with other text items."""
+
+    scale: float
+    """The scale to draw `path` at."""
+
+    generation_font_size: float
+    """The font size `path` was generated at.
+
+    Outlines of the same text, font family, weight, and italicization
+    have equal paths if they were generated at the same size.
+    """
+
+
+# The approximate size of a `QPainterPath` element: two doubles and a type
+_PATH_ELEMENT_BYTES = 24
+
+# Text is filled without a pen, so instead of the pen width, text items
+# pad their clipping area by a fixed amount to keep antialiased glyph
+# edges from being cut off.
+_CLIP_PADDING = 1
+
+
+def _cached_path_bytes(cached_path: _CachedTextPath) -> int:
+    return cached_path.path.elementCount() * _PATH_ELEMENT_BYTES
+
+
+_PATH_CACHE: LruCache[_CachedTextKey, _CachedTextPath] = LruCache(
+    max_entries=10_000, max_cost=32 * 1024 * 1024, cost_func=_cached_path_bytes
+)
 
 """TODO LOW We can actually optimize this even further. We can modify
 q_clipping_path so it explicitly stores paint results in the global
@@ -66,10 +100,11 @@ class TextInterface(GraphicObjectInterface):
 
     ######## PUBLIC METHODS ########
 
-    def render(self):
-        """Render the line to the scene."""
-        qt_object = self._create_qt_object()
-        neoscore._app_interface.scene.addItem(qt_object)
+    def outline(self) -> TextOutline:
+        """Get the (possibly cached) outline of this text."""
+        return TextInterface._resolve_path(self.text, self.font, self.scale)
+
+    ######## PRIVATE METHODS ########
 
     def _create_qt_object(self) -> QGraphicsItem:
         """Create and return this interface's underlying Qt object"""
@@ -77,35 +112,73 @@ class TextInterface(GraphicObjectInterface):
         qt_object.setPos(point_to_qt_point_f(self.pos))
         qt_object.setBrush(self.brush.qt_object)
         qt_object.setPen(self.pen.qt_object)  # No pen
+        qt_object.update_geometry()
         return qt_object
 
-    ######## PRIVATE METHODS ########
+    def _update_qt_object(self, qt_object: QClippingPath, previous: TextInterface):
+        if self.pos != previous.pos:
+            qt_object.setPos(point_to_qt_point_f(self.pos))
+        if self.brush != previous.brush:
+            qt_object.setBrush(self.brush.qt_object)
+        geometry_changed = False
+        if self.pen != previous.pen:
+            qt_object.setPen(self.pen.qt_object)
+            geometry_changed = True
+        if (
+            self.text != previous.text
+            or self.font != previous.font
+            or self.scale != previous.scale
+        ):
+            path, scale, _ = self._resolve_path(self.text, self.font, self.scale)
+            qt_object.setPath(path)
+            qt_object.setScale(scale)
+            geometry_changed = True
+        if (
+            self.clip_start_x != previous.clip_start_x
+            or self.clip_width != previous.clip_width
+        ):
+            qt_object.clip_start_x = (
+                self.clip_start_x.base_value if self.clip_start_x is not None else None
+            )
+            qt_object.clip_width = (
+                self.clip_width.base_value if self.clip_width is not None else None
+            )
+            geometry_changed = True
+        if geometry_changed:
+            qt_object.update_geometry()
 
     def _get_path(
         self, text: str, font: FontInterface, additional_scale: float
     ) -> QClippingPath:
+        path, scale, _ = self._resolve_path(text, font, additional_scale)
+        clipping_path = QClippingPath(
+            path,
+            self.clip_start_x.base_value if self.clip_start_x is not None else None,
+            self.clip_width.base_value if self.clip_width is not None else None,
+            _CLIP_PADDING,
+        )
+        clipping_path.setScale(scale)
+        return clipping_path
+
+    @staticmethod
+    def _resolve_path(
+        text: str, font: FontInterface, additional_scale: float
+    ) -> TextOutline:
+        """Get a (possibly cached) path for some text and the scale to draw it at"""
         qt_font = font.qt_object
         needed_font_size = qt_font.pointSizeF()
         key = _CachedTextKey(text, font.family_name, font.weight, font.italic)
         cached_result = _PATH_CACHE.get(key)
         if cached_result:
             cache_scale = needed_font_size / cached_result.generation_font_size
-            clipping_path = QClippingPath(
+            return TextOutline(
                 cached_result.path,
-                self.clip_start_x.base_value if self.clip_start_x is not None else None,
-                self.clip_width.base_value if self.clip_width is not None else None,
+                cache_scale * additional_scale,
+                cached_result.generation_font_size,
             )
-            clipping_path.setScale(cache_scale * additional_scale)
-            return clipping_path
         path = TextInterface._create_qt_path(text, qt_font)
-        _PATH_CACHE[key] = _CachedTextPath(path, needed_font_size)
-        clipping_path = QClippingPath(
-            path,
-            self.clip_start_x.base_value if self.clip_start_x is not None else None,
-            self.clip_width.base_value if self.clip_width is not None else None,
-        )
-        clipping_path.setScale(additional_scale)
-        return clipping_path
+        _PATH_CACHE.put(key, _CachedTextPath(path, needed_font_size))
+        return TextOutline(path, additional_scale, needed_font_size)
 
     @staticmethod
     def _create_qt_path(text: str, font: QFont) -> QPainterPath:
@@ -0,0 +1,102 @@
+"""Helpers shared by the SVG and PDF writers."""
+
+from __future__ import annotations
+
+from typing import Iterator, Optional
+
+from PyQt5.QtCore import QRectF
+from PyQt5.QtGui import QPainterPath
+
+from neoscore.core.pen_pattern import PenPattern
+from neoscore.interface.path_interface import PathInterface
+from neoscore.interface.qt.q_clipping_path import QClippingPath
+from neoscore.interface.text_interface import TextInterface, TextOutline
+from neoscore.utils.units import Unit
+
+DASH_PATTERNS = {
+    PenPattern.DASH: (4, 2),
+    PenPattern.DOT: (1, 2),
+    PenPattern.DASHDOT: (4, 2, 1, 2),
+    PenPattern.DASHDOTDOT: (4, 2, 1, 2, 1, 2),
+}
+"""Qt's dash patterns, in multiples of the pen width"""
+
+MOVE_TO = "M"
+LINE_TO = "L"
+CURVE_TO = "C"
+
+# `QPainterPath.ElementType` values
+_MOVE_TO_ELEMENT = 0
+_CURVE_TO_ELEMENT = 2
+
+
+def format_number(value: float) -> str:
+    """Format a number compactly, to at most 3 decimal places."""
+    text = f"{value:.3f}".rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+def optional_base_value(unit: Optional[Unit]) -> Optional[float]:
+    return unit.base_value if unit is not None else None
+
+
+def path_segments(qt_path: QPainterPath) -> Iterator[tuple[str, tuple[float, ...]]]:
+    """Iterate through the segments of a path.
+
+    Yields: The type of each segment (`MOVE_TO`, `LINE_TO`, or
+        `CURVE_TO`) and its coordinates. Curves have the coordinates
+        of their two control points and end point.
+    """
+    i = 0
+    element_count = qt_path.elementCount()
+    while i < element_count:
+        element = qt_path.elementAt(i)
+        if element.type == _CURVE_TO_ELEMENT:
+            c2 = qt_path.elementAt(i + 1)
+            end = qt_path.elementAt(i + 2)
+            yield CURVE_TO, (element.x, element.y, c2.x, c2.y, end.x, end.y)
+            i += 3
+            continue
+        segment_type = MOVE_TO if element.type == _MOVE_TO_ELEMENT else LINE_TO
+        yield segment_type, (element.x, element.y)
+        i += 1
+
+
+def clip_geometry(
+    interface: PathInterface | TextInterface, qt_path: QPainterPath
+) -> Optional[tuple[float, QRectF]]:
+    """Find how an item is clipped when drawn by its `QClippingPath`.
+
+    Returns: `None` if the item is not clipped. Otherwise, the x offset
+        the path is drawn at, and the clipping rect, which applies after
+        the offset like in `QClippingPath.paint`.
+    """
+    clip_start_x = optional_base_value(interface.clip_start_x)
+    clip_width = optional_base_value(interface.clip_width)
+    if clip_start_x is None and clip_width is None:
+        return None
+    clip_rect = QClippingPath.calculate_clipping_area(
+        qt_path.boundingRect(),
+        clip_start_x,
+        clip_width,
+        interface.pen.qt_object.width(),
+    )
+    return -clip_start_x if clip_start_x else 0, clip_rect
+
+
+def text_outline_key(interface: TextInterface, outline: TextOutline) -> tuple:
+    """Get a key which is equal for text items with equal outline paths.
+
+    Cached outlines can be evicted and regenerated at another font size,
+    so the key includes the size `outline` was generated at. Otherwise
+    outlines drawn at a scale relative to a newer path would reuse an
+    older one.
+    """
+    font = interface.font
+    return (
+        interface.text,
+        font.family_name,
+        font.weight,
+        font.italic,
+        outline.generation_font_size,
+    )
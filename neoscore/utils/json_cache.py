@@ -0,0 +1,106 @@
+"""Loading of large JSON resource files through a precompiled cache.
+
+Parsing big JSON files like SMuFL metadata takes a noticeable part of
+startup time. The first time a bundled resource file is loaded, its
+parsed contents are written next to it in `marshal` format, which loads
+several times faster. The cache is keyed by the source file's
+modification time and size, so editing the JSON file invalidates it.
+
+Only files in neoscore's own resources directory are cached. Other
+files, like the metadata of user-registered music fonts, are parsed
+directly so nothing is written to user directories.
+
+If the cache file cannot be written (for instance in a read-only
+installation), the JSON file is simply parsed every time.
+"""
+
+import json
+import marshal
+import os
+from typing import Any
+
+from neoscore import constants
+
+CACHE_SUFFIX = ".marshal"
+
+# Only JSON files inside this directory are cached
+_CACHED_DIR = constants.RESOURCES_DIR
+
+# Bump this when the cache file layout changes
+_FORMAT_VERSION = 1
+
+
+def cache_path(path: str) -> str:
+    """Get the path of the precompiled cache for a JSON file."""
+    return path + CACHE_SUFFIX
+
+
+def load_json(path: str) -> Any:
+    """Load a JSON file, using and refreshing its precompiled cache.
+
+    Files outside the bundled resources directory are parsed without
+    any caching.
+
+    Args:
+        path: The path to a JSON file.
+
+    Returns: The parsed JSON contents.
+
+    Raises:
+        FileNotFoundError: If `path` does not exist.
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    if not _is_cached_file(path):
+        with open(path, "r") as json_file:
+            return json.load(json_file)
+    source_stat = os.stat(path)
+    key = (
+        _FORMAT_VERSION,
+        marshal.version,
+        source_stat.st_mtime_ns,
+        source_stat.st_size,
+    )
+    cached = _read_cache(cache_path(path))
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with open(path, "r") as json_file:
+        data = json.load(json_file)
+    _write_cache(cache_path(path), key, data)
+    return data
+
+
+def _is_cached_file(path: str) -> bool:
+    cached_dir = os.path.realpath(_CACHED_DIR)
+    try:
+        common = os.path.commonpath([os.path.realpath(path), cached_dir])
+    except ValueError:
+        # Paths on different drives
+        return False
+    return common == cached_dir
+
+
+def _read_cache(path: str) -> Any:
+    try:
+        with open(path, "rb") as cache_file:
+            # `marshal.loads` is much faster than `marshal.load` on a file
+            cached = marshal.loads(cache_file.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(cached, tuple) or len(cached) != 2:
+        return None
+    return cached
+
+
+def _write_cache(path: str, key: tuple, data: Any):
+    # Write to a temporary file first so concurrent readers
+    # never see a partially written cache.
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "wb") as cache_file:
+            cache_file.write(marshal.dumps((key, data)))
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
@@ -0,0 +1,149 @@
+"""A bounded least-recently-used cache with usage statistics."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """A snapshot of an `LruCache`'s usage."""
+
+    hits: int
+    misses: int
+    evictions: int
+
+    entries: int
+    """The number of entries currently in the cache."""
+
+    cost: int
+    """The total approximate cost (typically bytes) of the current entries."""
+
+    max_entries: Optional[int]
+
+    max_cost: Optional[int]
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups which were hits, or 0 if there were none."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0
+
+
+class LruCache(Generic[K, V]):
+    """A mapping cache which evicts its least recently used entries.
+
+    The cache can be bounded by its entry count, the total cost of its
+    entries, or both. Costs are computed once per entry with the
+    `cost_func` given on creation; without one, every entry costs 0.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_cost: Optional[int] = None,
+        cost_func: Optional[Callable[[V], int]] = None,
+    ):
+        """
+        Args:
+            max_entries: The maximum number of entries to keep.
+                Use `None` for no limit.
+            max_cost: The maximum total cost of entries to keep.
+                Use `None` for no limit.
+            cost_func: A function giving the approximate cost of a value.
+        """
+        self._entries: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._max_entries = max_entries
+        self._max_cost = max_cost
+        self._cost_func = cost_func
+        self._cost = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+
+    def get(self, key: K) -> Optional[V]:
+        """Look up a value, marking it as recently used.
+
+        Returns: The cached value, or `None` if `key` is not cached.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: K, value: V):
+        """Store a value, evicting old entries as needed to stay in bounds.
+
+        A value whose cost alone exceeds `max_cost` is not stored.
+        """
+        cost = self._cost_func(value) if self._cost_func else 0
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._cost -= previous[1]
+        if self._max_cost is not None and cost > self._max_cost:
+            return
+        self._entries[key] = (value, cost)
+        self._cost += cost
+        self._evict()
+
+    def clear(self):
+        """Remove all entries. Statistics are kept."""
+        self._entries.clear()
+        self._cost = 0
+
+    def configure(self, max_entries: Optional[int], max_cost: Optional[int]):
+        """Change the cache bounds, evicting entries as needed.
+
+        Args:
+            max_entries: The maximum number of entries to keep.
+                Use `None` for no limit.
+            max_cost: The maximum total cost of entries to keep.
+                Use `None` for no limit.
+        """
+        self._max_entries = max_entries
+        self._max_cost = max_cost
+        self._evict()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            self._hits,
+            self._misses,
+            self._evictions,
+            len(self._entries),
+            self._cost,
+            self._max_entries,
+            self._max_cost,
+        )
+
+    def reset_stats(self):
+        """Reset the hit, miss, and eviction counters."""
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    ######## PRIVATE METHODS ########
+
+    def _evict(self):
+        entries = self._entries
+        max_entries = self._max_entries
+        max_cost = self._max_cost
+        while (max_entries is not None and len(entries) > max_entries) or (
+            max_cost is not None and self._cost > max_cost
+        ):
+            _, (_, cost) = entries.popitem(last=False)
+            self._cost -= cost
+            self._evictions += 1
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import NamedTuple, Type, Union, cast
+from typing import NamedTuple, Optional, Type, Union, cast
 
 from neoscore.utils.units import ZERO, Unit
 
@@ -60,6 +60,76 @@ class Point(NamedTuple):
         return Point(unit(self.x), unit(self.y))
 
 
+class PointAccumulator:
+    """A mutable sum of `Point`s which creates units only when read.
+
+    Adding `Point`s together allocates a new `Point` and two new units
+    for every addition. This instead keeps a running total in base unit
+    floats, exposed as `x` and `y`, so summing any number of points
+    allocates at most one `Point`.
+
+    The resulting point has the same value and unit types as the
+    equivalent chain of `Point` additions and subtractions, with unit
+    types taken from the starting point.
+    """
+
+    __slots__ = ("x", "y", "_x_type", "_y_type", "_point")
+
+    def __init__(self, start: Point):
+        """
+        Args:
+            start: The initial point of the sum
+        """
+        self.x: float = start.x.base_value
+        self.y: float = start.y.base_value
+        self._x_type = type(start.x)
+        self._y_type = type(start.y)
+        self._point: Optional[Point] = start
+
+    def add(self, point: Point):
+        """Add a point to the sum in place."""
+        self.x += point.x.base_value
+        self.y += point.y.base_value
+        self._point = None
+
+    def sub(self, point: Point):
+        """Subtract a point from the sum in place."""
+        self.x -= point.x.base_value
+        self.y -= point.y.base_value
+        self._point = None
+
+    def copy(self) -> PointAccumulator:
+        """Create an independent copy of this sum."""
+        result = PointAccumulator.__new__(PointAccumulator)
+        result.x = self.x
+        result.y = self.y
+        result._x_type = self._x_type
+        result._y_type = self._y_type
+        result._point = self._point
+        return result
+
+    def to_point(self) -> Point:
+        """Get the sum as a `Point`.
+
+        The point is created at most once between changes to the sum.
+        """
+        point = self._point
+        if point is None:
+            point = Point(
+                self._x_type.from_base_value(self.x),
+                self._y_type.from_base_value(self.y),
+            )
+            self._point = point
+        return point
+
+    def difference(self, other: PointAccumulator) -> Point:
+        """Get this sum minus another as a `Point`."""
+        return Point(
+            self._x_type.from_base_value(self.x - other.x),
+            self._y_type.from_base_value(self.y - other.y),
+        )
+
+
 ORIGIN = Point(ZERO, ZERO)
 
 PointDef = Union[Point, tuple[Unit, Unit]]
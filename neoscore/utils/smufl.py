@@ -1,25 +1,68 @@
 import difflib
-import json
 import os
 
 from neoscore import constants
-
-# Load metadata into dictionaries
+from neoscore.utils.json_cache import load_json
 
 smufl_dir = os.path.join(constants.RESOURCES_DIR, "smufl")
 
-with open(os.path.join(smufl_dir, "classes.json"), "r") as classes_file:
-    classes = json.load(classes_file)
+# The metadata tables are exposed as the module attributes `classes`,
+# `glyph_names`, and `ranges`. They are loaded on first access.
+_TABLE_FILES = {
+    "classes": "classes.json",
+    "glyph_names": "glyphnames.json",
+    "ranges": "ranges.json",
+}
+
+# Reverse lookups from glyph names into `ranges` and `classes`
+_indexes = {}
+
+
+def _load_table(name):
+    table = globals().get(name)
+    if table is None:
+        table = load_json(os.path.join(smufl_dir, _TABLE_FILES[name]))
+        # Later attribute lookups find the table without `__getattr__`
+        globals()[name] = table
+    return table
+
 
-with open(os.path.join(smufl_dir, "glyphnames.json"), "r") as glyphnames_file:
-    glyph_names = json.load(glyphnames_file)
+def _glyph_index(table_name, build):
+    """Get an index derived from a metadata table, building it on first use."""
+    index = _indexes.get(table_name)
+    if index is None:
+        index = build(_load_table(table_name))
+        _indexes[table_name] = index
+    return index
 
-with open(os.path.join(smufl_dir, "ranges.json"), "r") as ranges_file:
-    ranges = json.load(ranges_file)
+
+def _build_range_index(ranges):
+    index = {}
+    for range_name, value in ranges.items():
+        for glyph_name in value["glyphs"]:
+            # Like a search through `ranges`, the first range listing a glyph wins
+            index.setdefault(glyph_name, range_name)
+    return index
+
+
+def _build_classes_index(classes):
+    index = {}
+    for class_name, class_glyphs in classes.items():
+        for glyph_name in class_glyphs:
+            index.setdefault(glyph_name, set()).add(class_name)
+    return {
+        glyph_name: frozenset(class_names) for glyph_name, class_names in index.items()
+    }
+
+
+def __getattr__(name):
+    if name in _TABLE_FILES:
+        return _load_table(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _get_similar_glyph_names(name):
-    return difflib.get_close_matches(name, glyph_names, 5)
+    return difflib.get_close_matches(name, _load_table("glyph_names"), 5)
 
 
 def get_basic_glyph_info(name):
@@ -35,7 +78,7 @@ def get_basic_glyph_info(name):
         KeyError: If no glyph with `name` can be found
     """
     try:
-        return glyph_names[name]
+        return _load_table("glyph_names")[name]
     except KeyError as e:
         similar = " / ".join(_get_similar_glyph_names(name))
         raise KeyError(
@@ -85,11 +128,10 @@ def get_glyph_range_key(name):
     Raises:
         KeyError: If no glyph with `name` can be found in `ranges`
     """
-    for range_name, value in ranges.items():
-        if name in value["glyphs"]:
-            return range_name
-    else:
-        raise KeyError(f'Could not find glyph name "{name}".')
+    try:
+        return _glyph_index("ranges", _build_range_index)[name]
+    except KeyError:
+        raise KeyError(f'Could not find glyph name "{name}".') from None
 
 
 def get_glyph_classes(name):
@@ -99,18 +141,7 @@ def get_glyph_classes(name):
         name (str): The name of the glyph
 
     Returns:
-        set[str]: The classes the glyph belongs in
-
-    Raises:
-        KeyError: If no glyph with `name` can be found in `ranges`
-
-    Warning:
-        This is potentially a slow function. If it starts being used a lot,
-        probably consider building a more efficient data structure around
-        this look-up.
+        set[str]: The classes the glyph belongs in. This is empty if
+            the glyph is not in any class.
     """
-    matches = set()
-    for class_name, class_glyphs in classes.items():
-        if name in class_glyphs:
-            matches.add(class_name)
-    return matches
+    return set(_glyph_index("classes", _build_classes_index).get(name, ()))
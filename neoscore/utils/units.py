@@ -51,6 +51,16 @@ class Unit:
                 self.base_value = value * self.CONVERSION_RATE
                 self._display_value = value
 
+    @classmethod
+    def from_base_value(cls: Type[TUnit], base_value: float) -> TUnit:
+        """Create a unit from a value in base units.
+
+        This skips the conversion done by the constructor, making it the
+        cheapest way to turn the result of arithmetic on base values
+        back into a unit.
+        """
+        return cls(None, _raw_base_value=base_value)
+
     @property
     def display_value(self) -> float:
         """The readable given value in the unit.
@@ -0,0 +1,92 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+from neoscore.core import neoscore
+from neoscore.core.batch import (
+    BatchJob,
+    _run_job,
+    _shard_bounds,
+    render_batch,
+    render_pdf_in_parallel,
+)
+from neoscore.core.paper import LETTER
+from neoscore.core.text import Text
+from neoscore.interface.pdf_merging import _QtPdf
+from neoscore.utils.units import Mm
+
+
+def build_text_score():
+    Text((Mm(10), Mm(10)), "batch")
+
+
+def build_multi_page_score():
+    for i in range(5):
+        Text((Mm(10), Mm(10)), str(i), parent=neoscore.document.pages[i])
+
+
+def build_failing_score():
+    raise ValueError("bad score")
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+
+    def test_jobs_are_picklable(self):
+        job = BatchJob(build_text_score, "out.pdf", LETTER)
+        assert pickle.loads(pickle.dumps(job)) == job
+
+    def test_run_job_resets_document_between_jobs(self):
+        neoscore.setup(headless=True)
+        first_path = os.path.join(self.output_dir, "first.png")
+        second_path = os.path.join(self.output_dir, "second.pdf")
+        first = _run_job(BatchJob(build_text_score, first_path, dpi=72))
+        first_document = neoscore.document
+        second = _run_job(BatchJob(build_text_score, second_path, LETTER))
+        assert first.succeeded and second.succeeded
+        assert neoscore.document is not first_document
+        assert neoscore.document.paper == LETTER
+        assert len(neoscore.document.pages) == 1
+        assert os.path.isfile(first_path)
+        assert os.path.isfile(second_path)
+
+    def test_run_job_reports_errors(self):
+        neoscore.setup(headless=True)
+        result = _run_job(BatchJob(build_failing_score, "unused.pdf"))
+        assert not result.succeeded
+        assert "bad score" in result.error
+
+    def test_render_batch(self):
+        paths = [os.path.join(self.output_dir, f"{i}.pdf") for i in range(3)]
+        jobs = [BatchJob(build_text_score, path) for path in paths]
+        jobs.append(BatchJob(build_failing_score, "unused.pdf"))
+        results = render_batch(jobs, processes=2)
+        assert [result.output_path for result in results] == [
+            job.output_path for job in jobs
+        ]
+        assert [result.succeeded for result in results] == [True, True, True, False]
+        for path in paths:
+            assert os.path.isfile(path)
+        assert all(result.seconds >= 0 for result in results)
+
+    def test_render_batch_with_no_jobs(self):
+        assert render_batch([]) == []
+
+    def test_shard_bounds(self):
+        bounds = [_shard_bounds(10, i, 4) for i in range(4)]
+        assert bounds == [(0, 2), (2, 5), (5, 7), (7, 10)]
+        assert [_shard_bounds(1, i, 3) for i in range(3)] == [(0, 0), (0, 0), (0, 1)]
+
+    def test_render_pdf_in_parallel(self):
+        path = os.path.join(self.output_dir, "parallel.pdf")
+        render_pdf_in_parallel(BatchJob(build_multi_page_score, path), processes=3)
+        with open(path, "rb") as pdf_file:
+            assert len(_QtPdf(pdf_file.read()).page_ids) == 5
+
+    def test_render_pdf_in_parallel_with_more_processes_than_pages(self):
+        path = os.path.join(self.output_dir, "parallel.pdf")
+        render_pdf_in_parallel(BatchJob(build_text_score, path), processes=2)
+        with open(path, "rb") as pdf_file:
+            assert len(_QtPdf(pdf_file.read()).page_ids) == 1
@@ -148,3 +148,21 @@ class TestChordrest(unittest.TestCase):
         pitches = ["c'''", "g"]
         chord = Chordrest(Mm(1), self.staff, pitches, Beat(1, 4))
         assert_almost_equal(chord.stem_height, self.staff.unit(-10.5))
+
+    def test_render_rerenders_chordrest_after_notehead_changes(self):
+        chord = Chordrest(Mm(10), self.staff, ["c'", "g'"], Beat(1, 4))
+        neoscore.document._render()
+        stem = chord.stem
+        next(iter(chord.noteheads)).x = Mm(5)
+        neoscore.document._render()
+        assert chord.stem is not stem
+
+    def test_render_after_notehead_pitch_change_matches_fresh_chord(self):
+        chord = Chordrest(Mm(10), self.staff, ["c'"], Beat(1, 4))
+        neoscore.document._render()
+        next(iter(chord.noteheads)).pitch = Pitch.from_def("cs''''")
+        fresh = Chordrest(Mm(50), self.staff, ["cs''''"], Beat(1, 4))
+        neoscore.document._render()
+        assert len(chord.ledgers) == len(fresh.ledgers) == 5
+        assert len(chord.accidentals) == len(fresh.accidentals) == 1
+        assert chord.stem_direction == fresh.stem_direction
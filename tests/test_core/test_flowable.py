@@ -128,3 +128,38 @@ class TestFlowable(unittest.TestCase):
         test_flowable = Flowable((Mm(10), Mm(0)), Mm(10000), Mm(90), Mm(5))
         with pytest.raises(OutOfBoundsError):
             test_flowable.last_break_at(Mm(10000000))
+
+    def test_last_break_index_at_line_boundaries(self):
+        test_flowable = Flowable((Mm(10), Mm(0)), Mm(500), Mm(90), Mm(5))
+        # Lines start at 0, 150, 310, and 470
+        assert test_flowable.last_break_index_at(Mm(0)) == 0
+        assert test_flowable.last_break_index_at(Mm(149.99)) == 0
+        assert test_flowable.last_break_index_at(Mm(150)) == 1
+        assert test_flowable.last_break_index_at(Mm(310)) == 2
+        assert test_flowable.last_break_index_at(Mm(629)) == 3
+
+    def test_last_break_index_at_before_flowable_start(self):
+        test_flowable = Flowable((Mm(10), Mm(0)), Mm(500), Mm(90), Mm(5))
+        assert test_flowable.last_break_index_at(Mm(-5)) == 0
+
+    def test_setting_layout_controllers_updates_line_lookup(self):
+        test_flowable = Flowable((Mm(10), Mm(0)), Mm(500), Mm(90), Mm(5))
+        test_flowable.layout_controllers = test_flowable.layout_controllers[:2]
+        assert test_flowable.last_break_index_at(Mm(300)) == 1
+        with pytest.raises(OutOfBoundsError):
+            test_flowable.last_break_index_at(Mm(320))
+
+    def test_line_offsets_at(self):
+        test_flowable = Flowable((Mm(10), Mm(0)), Mm(500), Mm(90), Mm(5))
+        line_index, dist_to_start, dist_to_end = test_flowable.line_offsets_at(
+            Mm(200)
+        )
+        assert line_index == 1
+        assert Mm.from_base_value(dist_to_start) == Mm(50)
+        assert Mm.from_base_value(dist_to_end) == Mm(-110)
+
+    def test_dist_to_line_edges(self):
+        test_flowable = Flowable((Mm(10), Mm(0)), Mm(500), Mm(90), Mm(5))
+        assert test_flowable.dist_to_line_start(Mm(200)) == Mm(50)
+        assert test_flowable.dist_to_line_end(Mm(200)) == Mm(-110)
+        assert isinstance(test_flowable.dist_to_line_end(Mm(200)), Mm)
@@ -29,6 +29,11 @@ class TestFont(unittest.TestCase):
         assert test_font.weight is None
         assert test_font.italic is False
 
+    def test_equal_fonts_share_interface(self):
+        test_font = Font("Bravura", 12, 2, False)
+        assert test_font.modified()._interface is test_font._interface
+        assert test_font.modified(size=14)._interface is not test_font._interface
+
     def test_modified(self):
         test_font = Font("Bravura", 12, 2, False)
         modifying_family_name = test_font.modified(size=14, weight=1, italic=True)
@@ -4,6 +4,9 @@ from neoscore.core import neoscore
 from neoscore.core.flowable import Flowable
 from neoscore.core.invisible_object import InvisibleObject
 from neoscore.core.paper import Paper
+from neoscore.core.path import Path
+from neoscore.core.text import Text
+from neoscore.utils.color import Color
 from neoscore.utils.point import Point
 from neoscore.utils.units import Mm, Unit
 
@@ -110,3 +113,176 @@ class TestGraphicObject(unittest.TestCase):
         assert root not in descendants_set
         # Assert descendants content
         assert {child_2} == descendants_set
+
+    def test_descendants_includes_deeply_nested_objects(self):
+        root = InvisibleObject((Unit(0), Unit(0)))
+        parent = root
+        nested = []
+        for i in range(5):
+            parent = InvisibleObject((Unit(0), Unit(0)), parent=parent)
+            nested.append(parent)
+        assert list(root.descendants) == nested
+
+    def test_descendants_is_pre_order(self):
+        root = InvisibleObject((Unit(0), Unit(0)))
+        child_1 = InvisibleObject((Unit(0), Unit(0)), parent=root)
+        subchild_1 = InvisibleObject((Unit(0), Unit(0)), parent=child_1)
+        child_2 = InvisibleObject((Unit(0), Unit(0)), parent=root)
+        assert list(root.descendants) == [child_1, subchild_1, child_2]
+
+    def test_descendant_index_tracks_attached_subtrees(self):
+        class IndexingObject(InvisibleObject):
+            _indexes_descendants = True
+
+        class MockDifferentClass(InvisibleObject):
+            test_attr = 1
+
+        root = IndexingObject((Unit(0), Unit(0)))
+        child = InvisibleObject((Unit(0), Unit(0)), parent=root)
+        deep = MockDifferentClass((Unit(0), Unit(0)), parent=child)
+        detached = InvisibleObject((Unit(0), Unit(0)))
+        detached_child = MockDifferentClass((Unit(0), Unit(0)), parent=detached)
+        assert list(root.descendants_of_exact_class(MockDifferentClass)) == [deep]
+        detached.parent = child
+        assert set(root.descendants_of_exact_class(MockDifferentClass)) == {
+            deep,
+            detached_child,
+        }
+        assert set(root.descendants_of_class_or_subclass(InvisibleObject)) == {
+            child,
+            deep,
+            detached,
+            detached_child,
+        }
+        assert set(root.descendants_with_attribute("test_attr")) == {
+            deep,
+            detached_child,
+        }
+        detached.remove()
+        assert list(root.descendants_of_exact_class(MockDifferentClass)) == [deep]
+        deep.parent = InvisibleObject((Unit(0), Unit(0)))
+        assert list(root.descendants_of_exact_class(MockDifferentClass)) == []
+
+    def test_descendant_index_gives_results_in_tree_order(self):
+        class IndexingObject(InvisibleObject):
+            _indexes_descendants = True
+
+        class MockDifferentClass(InvisibleObject):
+            test_attr = 1
+
+        root = IndexingObject((Unit(0), Unit(0)))
+        child_1 = InvisibleObject((Unit(0), Unit(0)), parent=root)
+        child_2 = MockDifferentClass((Unit(0), Unit(0)), parent=root)
+        # Attached after `child_2`, but comes before it in the tree
+        subchild_1 = MockDifferentClass((Unit(0), Unit(0)), parent=child_1)
+        subchild_2 = InvisibleObject((Unit(0), Unit(0)), parent=child_1)
+        assert list(root.descendants) == [child_1, subchild_1, subchild_2, child_2]
+        assert list(root.descendants_of_exact_class(MockDifferentClass)) == [
+            subchild_1,
+            child_2,
+        ]
+        assert list(root.descendants_of_class_or_subclass(InvisibleObject)) == list(
+            root.descendants
+        )
+        assert list(root.descendants_with_attribute("test_attr")) == [
+            subchild_1,
+            child_2,
+        ]
+
+    def test_descendant_index_checks_instance_attributes(self):
+        class IndexingObject(InvisibleObject):
+            _indexes_descendants = True
+
+        root = IndexingObject((Unit(0), Unit(0)))
+        child_1 = InvisibleObject((Unit(0), Unit(0)), parent=root)
+        child_2 = InvisibleObject((Unit(0), Unit(0)), parent=root)
+        child_2.test_attr = 1
+        assert list(root.descendants_with_attribute("test_attr")) == [child_2]
+
+    def test_new_objects_are_dirty(self):
+        grob = InvisibleObject((Unit(5), Unit(6)))
+        assert grob._dirty
+
+    def test_pos_setter_marks_self_and_descendants_dirty(self):
+        parent = InvisibleObject((Unit(0), Unit(0)))
+        child = InvisibleObject((Unit(0), Unit(0)), parent=parent)
+        subchild = InvisibleObject((Unit(0), Unit(0)), parent=child)
+        parent._mark_clean()
+        assert not subchild._dirty
+        parent.pos = Point(Unit(7), Unit(8))
+        assert parent._dirty
+        assert child._dirty
+        assert subchild._dirty
+
+    def test_pen_and_brush_setters_mark_dirty(self):
+        grob = InvisibleObject((Unit(0), Unit(0)))
+        grob._mark_clean()
+        grob.pen = "#ff0000"
+        assert grob._dirty
+        grob._mark_clean()
+        grob.brush = "#ff0000"
+        assert grob._dirty
+
+    def test_parent_setter_marks_old_parent_and_self_dirty(self):
+        old_parent = InvisibleObject((Unit(0), Unit(0)))
+        new_parent = InvisibleObject((Unit(0), Unit(0)))
+        child = InvisibleObject((Unit(0), Unit(0)), parent=old_parent)
+        for grob in [old_parent, new_parent, child]:
+            grob._mark_clean()
+        child.parent = new_parent
+        assert old_parent._dirty
+        assert not new_parent._dirty
+        assert child._dirty
+
+    def test_render_incremental_marks_subtree_clean(self):
+        root = InvisibleObject((Unit(0), Unit(0)))
+        child = InvisibleObject((Unit(0), Unit(0)), parent=root)
+        root._render_incremental()
+        assert not root._dirty
+        assert not child._dirty
+
+    def test_render_incremental_only_rerenders_dirty_subtrees(self):
+        root = InvisibleObject((Unit(0), Unit(0)))
+        moved = Text((Unit(0), Unit(0)), "moved", parent=root)
+        unchanged = Text((Unit(0), Unit(0)), "unchanged", parent=root)
+        root._render_incremental()
+        moved_interface = moved.interfaces[0]
+        unchanged_interface = unchanged.interfaces[0]
+        moved.x = Unit(10)
+        root._render_incremental()
+        assert moved.interfaces[0] is not moved_interface
+        assert unchanged.interfaces[0] is unchanged_interface
+        assert unchanged_interface.qt_object is not None
+
+    def test_render_incremental_rerenders_after_in_place_pen_and_brush_changes(self):
+        grob = Path.straight_line((Unit(0), Unit(0)), (Unit(5), Unit(5)))
+        unchanged = Path.straight_line((Unit(0), Unit(0)), (Unit(5), Unit(5)))
+        grob._render_incremental()
+        unchanged._render_incremental()
+        unchanged_interface = unchanged.interfaces[0]
+        grob.pen.thickness = Mm(3)
+        grob._render_incremental()
+        unchanged._render_incremental()
+        assert grob.interfaces[0].pen is grob.pen.interface
+        assert unchanged.interfaces[0] is unchanged_interface
+        grob.brush.color = Color("#ff0000")
+        grob._render_incremental()
+        assert grob.interfaces[0].brush is grob.brush.interface
+
+    def test_render_incremental_reuses_qt_objects_of_dirty_slices(self):
+        grob = Text((Unit(0), Unit(0)), "test")
+        grob._render_incremental()
+        qt_object = grob.interfaces[0].qt_object
+        original_x = qt_object.pos().x()
+        grob.x = Unit(10)
+        grob._render_incremental()
+        assert grob.interfaces[0].qt_object is qt_object
+        assert qt_object.pos().x() == original_x + 10
+
+    def test_remove_removes_interfaces(self):
+        grob = Text((Unit(0), Unit(0)), "test")
+        grob._render_incremental()
+        interface = grob.interfaces[0]
+        grob.remove()
+        assert grob.interfaces == []
+        assert interface.qt_object is None
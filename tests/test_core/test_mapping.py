@@ -3,7 +3,12 @@ import unittest
 from neoscore.core import neoscore
 from neoscore.core.flowable import Flowable
 from neoscore.core.invisible_object import InvisibleObject
-from neoscore.core.mapping import canvas_pos_of, map_between
+from neoscore.core.mapping import (
+    canvas_pos_of,
+    descendant_pos,
+    map_between,
+    position_cache,
+)
 from neoscore.core.paper import Paper
 from neoscore.utils.point import Point
 from neoscore.utils.units import Mm, Unit
@@ -61,3 +66,69 @@ class TestMapping(unittest.TestCase):
         page_pos = canvas_pos_of(neoscore.document.pages[2])
         relative_pos = canvas_pos - page_pos
         assert_almost_equal(relative_pos, Point(Mm(5), Mm(6)))
+
+    def test_canvas_pos_of_with_position_cache(self):
+        parent = InvisibleObject((Mm(5), Mm(6)), self.flowable)
+        item = InvisibleObject((Mm(500), Mm(7)), parent)
+        expected = canvas_pos_of(item)
+        with position_cache():
+            assert_almost_equal(canvas_pos_of(item), expected)
+            # Memoized result is reused
+            assert_almost_equal(canvas_pos_of(item), expected)
+
+    def test_position_cache_invalidated_by_pos_change(self):
+        parent = InvisibleObject((Mm(5), Mm(6)), neoscore.document.pages[0])
+        item = InvisibleObject((Mm(1), Mm(2)), parent)
+        with position_cache():
+            original = canvas_pos_of(item)
+            parent.x = Mm(10)
+            assert_almost_equal(canvas_pos_of(item), original + Point(Mm(5), Mm(0)))
+
+    def test_position_cache_invalidated_by_parent_change(self):
+        parent = InvisibleObject((Mm(5), Mm(6)), neoscore.document.pages[0])
+        other_parent = InvisibleObject((Mm(15), Mm(6)), neoscore.document.pages[0])
+        item = InvisibleObject((Mm(1), Mm(2)), parent)
+        with position_cache():
+            original = canvas_pos_of(item)
+            item.parent = other_parent
+            assert_almost_equal(canvas_pos_of(item), original + Point(Mm(10), Mm(0)))
+
+    def test_descendant_pos_of_flowable_with_position_cache(self):
+        parent = InvisibleObject((Mm(5), Mm(6)), self.flowable)
+        item = InvisibleObject((Mm(500), Mm(7)), parent)
+        with position_cache():
+            assert_almost_equal(
+                descendant_pos(item, self.flowable), Point(Mm(505), Mm(13))
+            )
+
+    def test_map_between_with_position_cache(self):
+        source_parent = InvisibleObject((Unit(5), Unit(6)), neoscore.document.pages[1])
+        source = InvisibleObject((Unit(1), Unit(2)), source_parent)
+        destination_parent = InvisibleObject((Unit(3), Unit(4)), self.flowable)
+        destination = InvisibleObject((Unit(99), Unit(90)), destination_parent)
+        expected = map_between(source, destination)
+        with position_cache():
+            assert_almost_equal(map_between(source, destination), expected)
+            assert_almost_equal(map_between(destination, source), -expected)
+
+    def test_map_between_with_position_cache_invalidated_by_pos_change(self):
+        source = InvisibleObject((Unit(5), Unit(6)), neoscore.document.pages[1])
+        destination_parent = InvisibleObject((Unit(3), Unit(4)), self.flowable)
+        destination = InvisibleObject((Unit(99), Unit(90)), destination_parent)
+        with position_cache():
+            original = map_between(source, destination)
+            destination_parent.y = Unit(14)
+            assert_almost_equal(
+                map_between(source, destination), original + Point(Unit(0), Unit(10))
+            )
+
+    def test_descendant_pos_through_many_ancestors(self):
+        root = InvisibleObject((Mm(1), Mm(2)), self.flowable)
+        item = root
+        for _ in range(10):
+            item = InvisibleObject((Unit(1), Mm(1)), item)
+        pos = descendant_pos(item, root)
+        assert_almost_equal(pos, Point(Unit(10), Mm(10)))
+        # Unit types match those of `Point` addition
+        assert type(pos.x) == Unit
+        assert type(pos.y) == Mm
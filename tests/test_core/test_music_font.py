@@ -2,13 +2,18 @@ import unittest
 
 from neoscore.core import neoscore
 from neoscore.core.music_font import MusicFont
-from neoscore.utils.units import Mm, Unit
+from neoscore.utils.exceptions import MusicFontGlyphNotFoundError
+from neoscore.utils.units import Inch, Mm, Unit
 
 
 class EquivalentUnit(Unit):
     pass
 
 
+class EquivalentMm(Mm):
+    pass
+
+
 class TestMusicFont(unittest.TestCase):
     def setUp(self):
         neoscore.setup()
@@ -25,6 +30,21 @@ class TestMusicFont(unittest.TestCase):
         assert modifying_unit.family_name == "Bravura"
         assert modifying_unit.unit == Mm
 
+    def test_shared(self):
+        font = MusicFont.shared("Bravura", Mm)
+        assert MusicFont.shared("Bravura", Mm) is font
+        assert MusicFont.shared("Bravura", EquivalentMm) is font
+        assert MusicFont.shared("Bravura", Unit) is not font
+
+    def test_shared_replaced_after_font_registered_again(self):
+        font = MusicFont.shared("Bravura", Mm)
+        metadata = neoscore.registered_music_fonts["Bravura"]
+        try:
+            neoscore.registered_music_fonts["Bravura"] = dict(metadata)
+            assert MusicFont.shared("Bravura", Mm) is not font
+        finally:
+            neoscore.registered_music_fonts["Bravura"] = metadata
+
     def test__eq__(self):
         font = MusicFont("Bravura", Unit)
         assert font == MusicFont("Bravura", Unit)
@@ -40,3 +60,37 @@ class TestMusicFont(unittest.TestCase):
         # (Can't test case of different family name since only Bravura exists)
         # assert hash(font) != MusicFont("Foo", Unit)
         assert hash(font) != hash(MusicFont("Bravura", Mm))
+
+    def test_glyph_info_converts_to_unit(self):
+        info = MusicFont("Bravura", Mm).glyph_info("noteheadBlack")
+        bbox = neoscore.registered_music_fonts["Bravura"]["glyphBBoxes"][
+            "noteheadBlack"
+        ]
+        assert info["glyphBBox"]["bBoxNE"] == [Mm(n) for n in bbox["bBoxNE"]]
+        assert info["canonicalName"] == "noteheadBlack"
+
+    def test_glyph_info_does_not_modify_metadata(self):
+        MusicFont("Bravura", Mm).glyph_info("noteheadBlack")
+        inch_info = MusicFont("Bravura", Inch).glyph_info("noteheadBlack")
+        bbox = neoscore.registered_music_fonts["Bravura"]["glyphBBoxes"][
+            "noteheadBlack"
+        ]
+        assert not isinstance(bbox["bBoxNE"][0], Unit)
+        assert inch_info["glyphBBox"]["bBoxNE"][0] == Inch(bbox["bBoxNE"][0])
+
+    def test_glyph_table_shared_between_fonts(self):
+        font = MusicFont("Bravura", Unit)
+        assert font._glyph_table is MusicFont("Bravura", Mm)._glyph_table
+
+    def test_glyph_bounds(self):
+        font = MusicFont("Bravura", Mm)
+        bbox = font.glyph_info("noteheadBlack")["glyphBBox"]
+        x, y, w, h = font.glyph_bounds("noteheadBlack")
+        assert Mm(x) == bbox["bBoxSW"][0]
+        assert Mm(y) == bbox["bBoxNE"][1]
+        assert Mm(w) == bbox["bBoxNE"][0] - bbox["bBoxSW"][0]
+        assert Mm(h) == bbox["bBoxNE"][1] - bbox["bBoxSW"][1]
+
+    def test_glyph_bounds_of_missing_glyph(self):
+        with self.assertRaises(MusicFontGlyphNotFoundError):
+            MusicFont("Bravura", Mm).glyph_bounds("nonexistent glyph")
@@ -42,3 +42,11 @@ class TestMusicText(unittest.TestCase):
             (Unit(5), Unit(6)), ["accidentalFlat", ("brace", 1)], self.staff
         )
         assert test_object.text == "\ue260\uF400"
+
+    def test_text_setter_resolves_music_chars(self):
+        test_object = MusicText((Unit(5), Unit(6)), "accidentalFlat", self.staff)
+        test_object._mark_clean()
+        test_object.text = ["accidentalFlat", ("brace", 1)]
+        assert test_object.text == "\ue260\uF400"
+        assert len(test_object.music_chars) == 2
+        assert test_object._dirty
@@ -0,0 +1,125 @@
+import os
+import tempfile
+import unittest
+
+import pytest
+from PyQt5.QtGui import QImage
+
+from neoscore.core import neoscore
+from neoscore.core.paper import A4, LETTER
+from neoscore.core.text import Text
+from neoscore.interface.pdf_merging import _QtPdf
+from neoscore.utils.exceptions import InvalidImageFormatError
+from neoscore.utils.units import Mm
+
+
+class TestNeoscore(unittest.TestCase):
+    def setUp(self):
+        neoscore.setup()
+
+    def test_reset_document_replaces_document(self):
+        old_document = neoscore.document
+        Text((Mm(0), Mm(0)), "test")
+        neoscore.document._render()
+        assert neoscore._app_interface.scene.items()
+        neoscore.reset_document(LETTER)
+        assert neoscore.document is not old_document
+        assert neoscore._app_interface.document is neoscore.document
+        assert neoscore.document.paper == LETTER
+        assert len(neoscore.document.pages) == 0
+        assert not neoscore._app_interface.scene.items()
+
+    def test_reset_document_keeps_paper_by_default(self):
+        neoscore.reset_document()
+        assert neoscore.document.paper == A4
+
+    def test_reset_document_keeps_app_and_fonts(self):
+        app_interface = neoscore._app_interface
+        default_font = neoscore.default_font
+        registered_music_fonts = dict(neoscore.registered_music_fonts)
+        neoscore.reset_document()
+        assert neoscore._app_interface is app_interface
+        assert neoscore.default_font is default_font
+        assert neoscore.registered_music_fonts == registered_music_fonts
+
+    def test_objects_render_after_reset(self):
+        neoscore.reset_document()
+        text = Text((Mm(0), Mm(0)), "test")
+        neoscore.document._render()
+        assert len(text.interfaces) == 1
+        assert text.interfaces[0].qt_object.scene() is neoscore._app_interface.scene
+
+    def test_render_images_renders_every_page(self):
+        Text((Mm(0), Mm(0)), "first")
+        Text((Mm(0), Mm(0)), "second", parent=neoscore.document.pages[1])
+        output_dir = tempfile.mkdtemp()
+        template = os.path.join(output_dir, "page_{}.png")
+        for parallel in [True, False]:
+            paths = neoscore.render_images(
+                path_template=template, dpi=72, parallel=parallel
+            )
+            assert paths == [template.format(0), template.format(1)]
+            single_path = os.path.join(output_dir, "single.png")
+            neoscore.render_image(
+                neoscore.document.paper_bounding_rect(1), single_path, dpi=72
+            )
+            assert QImage(paths[1]) == QImage(single_path)
+
+    def test_render_images_with_page_subset(self):
+        Text((Mm(0), Mm(0)), "second", parent=neoscore.document.pages[1])
+        template = os.path.join(tempfile.mkdtemp(), "page_{}.jpg")
+        paths = neoscore.render_images([1], template, dpi=72)
+        assert paths == [template.format(1)]
+        assert os.path.isfile(paths[0])
+        assert not os.path.isfile(template.format(0))
+
+    def test_render_images_with_invalid_format(self):
+        with pytest.raises(InvalidImageFormatError):
+            neoscore.render_images(path_template="page_{}.invalid")
+
+    def test_render_svg_only_includes_page(self):
+        Text((Mm(0), Mm(0)), "first")
+        Text((Mm(0), Mm(0)), "second", parent=neoscore.document.pages[1])
+        path = os.path.join(tempfile.mkdtemp(), "page.svg")
+        neoscore.render_svg(path, 1)
+        with open(path) as svg_file:
+            contents = svg_file.read()
+        assert contents.count("<use") == 1
+
+    def test_render_pdf_reusing_glyph_outlines(self):
+        Text((Mm(0), Mm(0)), "first")
+        Text((Mm(0), Mm(0)), "second", parent=neoscore.document.pages[1])
+        path = os.path.join(tempfile.mkdtemp(), "score.pdf")
+        neoscore.render_pdf(path, reuse_glyph_outlines=True)
+        with open(path, "rb") as pdf_file:
+            pdf = _QtPdf(pdf_file.read())
+        assert len(pdf.page_ids) == 2
+
+    def test_cache_stats(self):
+        stats = neoscore.cache_stats()
+        assert set(stats) == {"text_paths", "music_text_geometry"}
+        before = stats["text_paths"]
+        Text((Mm(0), Mm(0)), "a string which is not rendered anywhere else")
+        neoscore.document._render()
+        after = neoscore.cache_stats()["text_paths"]
+        assert after.misses == before.misses + 1
+        assert after.cost > 0
+
+    def test_configure_cache(self):
+        old_stats = neoscore.cache_stats()["text_paths"]
+        try:
+            neoscore.configure_cache("text_paths", 1, 1000)
+            Text((Mm(0), Mm(0)), "one")
+            Text((Mm(0), Mm(0)), "two")
+            neoscore.document._render()
+            stats = neoscore.cache_stats()["text_paths"]
+            assert stats.entries <= 1
+            assert stats.max_cost == 1000
+        finally:
+            neoscore.configure_cache(
+                "text_paths", old_stats.max_entries, old_stats.max_cost
+            )
+
+    def test_configure_unknown_cache(self):
+        with pytest.raises(KeyError):
+            neoscore.configure_cache("nonexistent", 1)
@@ -43,3 +43,12 @@ class TestSpanner(unittest.TestCase):
         with pytest.raises(AttributeError):
             spanner = MockSpanner(Point(Unit(20), Unit(5)), None, Unit(30), None)
             spanner.end_pos = ZERO
+
+    def test_end_setters_mark_dirty(self):
+        spanner = MockSpanner(Point(Unit(20), Unit(5)), None, Unit(30), None)
+        spanner._mark_clean()
+        spanner.end_x = Unit(40)
+        assert spanner._dirty
+        spanner._mark_clean()
+        spanner.end_parent = GraphicObject(Point(Unit(10), Unit(10)))
+        assert spanner._dirty
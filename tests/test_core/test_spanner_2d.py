@@ -66,3 +66,14 @@ class TestSpanner2D(unittest.TestCase):
         )
         # math.sqrt(((15-2)**2) + ((17-4)**2))
         assert_almost_equal(spanner.spanner_2d_length, Unit(18.384776310850235))
+
+    def test_end_setters_mark_dirty(self):
+        spanner = MockSpanner2D(
+            Point(Unit(0), Unit(1)), None, Point(Unit(2), Unit(3)), None
+        )
+        spanner._mark_clean()
+        spanner.end_y = Unit(10)
+        assert spanner._dirty
+        spanner._mark_clean()
+        spanner.end_pos = Point(Unit(12), Unit(34))
+        assert spanner._dirty
@@ -5,12 +5,14 @@ import pytest
 from neoscore.core import neoscore
 from neoscore.core.clef import Clef
 from neoscore.core.flowable import Flowable
+from neoscore.core.music_font import MusicFont
+from neoscore.core.notehead import Notehead
 from neoscore.core.octave_line import OctaveLine
 from neoscore.core.paper import Paper
 from neoscore.core.staff import NoClefError, Staff
 from neoscore.models.clef_type import ClefType
 from neoscore.utils.point import Point
-from neoscore.utils.units import Mm
+from neoscore.utils.units import Mm, Unit
 
 from ..helpers import assert_almost_equal
 
@@ -48,6 +50,19 @@ class TestStaff(unittest.TestCase):
             Mm(3),
         )
 
+    def test_staves_of_equal_size_share_music_font(self):
+        staff_1 = Staff((Mm(0), Mm(0)), Mm(100), self.flowable)
+        staff_2 = Staff((Mm(0), Mm(20)), Mm(100), self.flowable)
+        small_staff = Staff((Mm(0), Mm(40)), Mm(100), self.flowable, Mm(2))
+        assert staff_1.music_font is staff_2.music_font
+        assert small_staff.music_font is not staff_1.music_font
+        assert small_staff.music_font.unit(1) == small_staff.unit(1)
+
+    def test_music_font_override(self):
+        font = MusicFont("Bravura", Mm)
+        staff = Staff((Mm(0), Mm(0)), Mm(100), self.flowable, music_font=font)
+        assert staff.music_font is font
+
     def test_distance_to_next_of_type(self):
         staff = Staff((Mm(10), Mm(0)), Mm(100), self.flowable)
         treble = Clef(staff, Mm(11), "treble")
@@ -55,6 +70,60 @@ class TestStaff(unittest.TestCase):
         assert_almost_equal(staff.distance_to_next_of_type(treble), Mm(20))
         assert_almost_equal(staff.distance_to_next_of_type(bass), Mm(100 - 31))
 
+    def test_distance_to_next_of_type_with_unordered_objects(self):
+        staff = Staff((Mm(10), Mm(0)), Mm(100), self.flowable)
+        late = Clef(staff, Mm(50), "treble")
+        early = Clef(staff, Mm(11), "treble")
+        middle = Clef(staff, Mm(31), "bass")
+        assert_almost_equal(staff.distance_to_next_of_type(early), Mm(20))
+        assert_almost_equal(staff.distance_to_next_of_type(middle), Mm(19))
+        assert_almost_equal(staff.distance_to_next_of_type(late), Mm(50))
+
+    def test_distance_to_next_of_type_ignores_coincident_objects(self):
+        staff = Staff((Mm(10), Mm(0)), Mm(100), self.flowable)
+        middle = Clef(staff, Mm(31), "bass")
+        # Within `Unit` comparison tolerance of `middle`
+        Clef(staff, Mm(31) + Unit(0.0005), "bass")
+        Clef(staff, Mm(61), "treble")
+        assert_almost_equal(staff.distance_to_next_of_type(middle), Mm(30))
+        staff._pre_render_hook()
+        assert_almost_equal(staff.distance_to_next_of_type(middle), Mm(30))
+        staff._post_render_hook()
+
+    def test_distance_to_next_of_type_cache_reset_by_new_objects(self):
+        staff = Staff((Mm(10), Mm(0)), Mm(100), self.flowable)
+        treble = Clef(staff, Mm(11), "treble")
+        staff._pre_render_hook()
+        assert_almost_equal(staff.distance_to_next_of_type(treble), Mm(89))
+        Clef(staff, Mm(31), "bass")
+        assert_almost_equal(staff.distance_to_next_of_type(treble), Mm(20))
+        staff._post_render_hook()
+        assert staff._x_positions_by_type == {}
+
+    def test_render_only_rerenders_changed_objects(self):
+        staff = Staff((Mm(0), Mm(0)), Mm(100), self.flowable)
+        Clef(staff, Mm(0), "treble")
+        moved = Notehead(Mm(20), "c'", (1, 4), staff)
+        unchanged = Notehead(Mm(40), "c'", (1, 4), staff)
+        neoscore.document._render()
+        staff_interface = staff.interfaces[0]
+        unchanged_interface = unchanged.interfaces[0]
+        moved.x = Mm(30)
+        neoscore.document._render()
+        assert staff.interfaces[0] is staff_interface
+        assert unchanged.interfaces[0] is unchanged_interface
+        assert not moved._dirty
+
+    def test_render_rerenders_whole_staff_after_clef_moves(self):
+        staff = Staff((Mm(0), Mm(0)), Mm(100), self.flowable)
+        clef = Clef(staff, Mm(0), "treble")
+        notehead = Notehead(Mm(40), "c'", (1, 4), staff)
+        neoscore.document._render()
+        notehead_interface = notehead.interfaces[0]
+        clef.x = Mm(10)
+        neoscore.document._render()
+        assert notehead.interfaces[0] is not notehead_interface
+
     def test_active_clef_at_with_explicit_clefs(self):
         staff = Staff((Mm(0), Mm(0)), Mm(100), self.flowable)
         Clef(staff, Mm(0), "treble")
@@ -76,6 +145,34 @@ class TestStaff(unittest.TestCase):
         assert staff.active_transposition_at(Mm(100)) == octave_line.transposition
         assert staff.active_transposition_at(Mm(101)) is None
 
+    def test_active_transposition_at_with_multiple_octave_lines(self):
+        staff = Staff((Mm(0), Mm(0)), Mm(100), self.flowable)
+        late = OctaveLine((Mm(60), Mm(0)), staff, Mm(20), indication="8vb")
+        early = OctaveLine((Mm(10), Mm(0)), staff, Mm(20), indication="8va")
+        assert staff.active_transposition_at(Mm(5)) is None
+        assert staff.active_transposition_at(Mm(15)) == early.transposition
+        assert staff.active_transposition_at(Mm(45)) is None
+        assert staff.active_transposition_at(Mm(70)) == late.transposition
+        assert staff.active_transposition_at(Mm(85)) is None
+
+    def test_active_transposition_at_with_overlapping_octave_lines(self):
+        staff = Staff((Mm(0), Mm(0)), Mm(100), self.flowable)
+        outer = OctaveLine((Mm(10), Mm(0)), staff, Mm(80), indication="8va")
+        inner = OctaveLine((Mm(30), Mm(0)), staff, Mm(10), indication="15ma")
+        # The first line in descendant order takes precedence
+        assert staff.active_transposition_at(Mm(35)) == outer.transposition
+        assert staff.active_transposition_at(Mm(80)) == outer.transposition
+        assert inner.transposition != outer.transposition
+
+    def test_active_transposition_at_during_render(self):
+        staff = Staff((Mm(0), Mm(0)), Mm(100), self.flowable)
+        staff._pre_render_hook()
+        assert staff.active_transposition_at(Mm(50)) is None
+        octave_line = OctaveLine((Mm(20), Mm(0)), staff, Mm(80), indication="8va")
+        assert staff.active_transposition_at(Mm(50)) == octave_line.transposition
+        staff._post_render_hook()
+        assert staff._octave_line_spans_cache is None
+
     def test_middle_c_at_with_explicit_clefs(self):
         staff = Staff((Mm(0), Mm(0)), Mm(100), self.flowable)
         Clef(staff, Mm(0), "treble")
@@ -25,3 +25,10 @@ class TestText(unittest.TestCase):
         test_object = Text((Unit(5), Unit(6)), "testing")
         assert test_object.font == neoscore.default_font
         assert test_object.parent == neoscore.document.pages[0]
+
+    def test_text_setter(self):
+        test_object = Text((Unit(5), Unit(6)), "testing")
+        test_object._mark_clean()
+        test_object.text = "changed"
+        assert test_object.text == "changed"
+        assert test_object._dirty
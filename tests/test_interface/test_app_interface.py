@@ -0,0 +1,88 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+import pytest
+from PyQt5.QtGui import QImage
+
+from neoscore.core import neoscore
+from neoscore.core.text import Text
+from neoscore.utils.color import Color
+from neoscore.utils.units import Mm
+
+
+class TestAppInterface(unittest.TestCase):
+    def test_headless_mode_creates_no_window(self):
+        neoscore.setup(headless=True)
+        app_interface = neoscore._app_interface
+        assert app_interface.headless
+        assert app_interface.main_window is None
+        assert app_interface.view is None
+        assert app_interface.scene is not None
+
+    def test_show_in_headless_mode_raises(self):
+        neoscore.setup(headless=True)
+        with pytest.raises(RuntimeError):
+            neoscore._app_interface.show()
+
+    def test_png_rendered_in_strips_matches_single_pass(self):
+        neoscore.setup(headless=True)
+        Text((Mm(10), Mm(10)), "strips")
+        neoscore.document._render()
+        output_dir = tempfile.mkdtemp()
+        single_path = os.path.join(output_dir, "single.png")
+        strips_path = os.path.join(output_dir, "strips.png")
+        rect = neoscore.document.paper_bounding_rect(0)
+        render_args = (11811, -1, Color(255, 255, 255), False)
+        neoscore._app_interface.render_image(rect, single_path, *render_args)
+        neoscore._app_interface._IMAGE_STRIP_MAX_PIXELS = 20_000
+        neoscore._app_interface.render_image(rect, strips_path, *render_args)
+        single = QImage(single_path)
+        strips = QImage(strips_path)
+        assert strips.size() == single.size()
+        assert strips.dotsPerMeterX() == single.dotsPerMeterX()
+        assert strips.convertToFormat(single.format()) == single
+
+    def test_render_images_bounds_memory_of_pending_saves(self):
+        neoscore.setup(headless=True)
+        neoscore.document.pages[2]
+        neoscore.document._render()
+        app_interface = neoscore._app_interface
+        # Only one image may be held at a time
+        app_interface._MAX_PENDING_SAVE_BYTES = 1
+        lock = threading.Lock()
+        saving = 0
+        saves_during_rasterization = []
+        save_image = app_interface._save_image
+        rasterize = app_interface._rasterize
+
+        def slow_save_image(*args):
+            nonlocal saving
+            with lock:
+                saving += 1
+            time.sleep(0.05)
+            save_image(*args)
+            with lock:
+                saving -= 1
+
+        def counting_rasterize(*args):
+            saves_during_rasterization.append(saving)
+            return rasterize(*args)
+
+        app_interface._save_image = slow_save_image
+        app_interface._rasterize = counting_rasterize
+        output_dir = tempfile.mkdtemp()
+        targets = [
+            (
+                neoscore.document.paper_bounding_rect(i),
+                os.path.join(output_dir, f"{i}.png"),
+            )
+            for i in range(3)
+        ]
+        app_interface.render_images(
+            targets, 1000, -1, Color(255, 255, 255), False, parallel=True
+        )
+        assert saves_during_rasterization == [0, 0, 0]
+        assert all(os.path.isfile(path) for _, path in targets)
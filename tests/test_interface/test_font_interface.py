@@ -9,6 +9,10 @@ class MockUnit(Unit):
     CONVERSION_RATE = 0.5
 
 
+class MockAppInterface:
+    view = None
+
+
 class TestFontInterface(unittest.TestCase):
     def setUp(self):
         neoscore.setup()
@@ -32,3 +36,36 @@ class TestFontInterface(unittest.TestCase):
     def test_float_point_sizes(self):
         test_font = FontInterface("Bravura", MockUnit(13), 1, False)
         self.assertAlmostEqual(test_font.qt_object.pointSizeF(), 6.5)
+
+    def test_shared(self):
+        test_font = FontInterface.shared("Bravura", MockUnit(12), 1, False)
+        assert FontInterface.shared("Bravura", Unit(6), 1, False) is test_font
+        assert FontInterface.shared("Bravura", MockUnit(12), 1, True) is not test_font
+        assert FontInterface.shared("Bravura", MockUnit(14), 1, False) is not test_font
+
+    def test_shared_not_kept_across_app_interfaces(self):
+        test_font = FontInterface.shared("Bravura", MockUnit(12), 1, False)
+        original_app_interface = neoscore._app_interface
+        try:
+            neoscore._app_interface = MockAppInterface()
+            new_font = FontInterface.shared("Bravura", MockUnit(12), 1, False)
+        finally:
+            neoscore._app_interface = original_app_interface
+        assert new_font is not test_font
+
+    def test_bounding_rect_of_is_cached(self):
+        test_font = FontInterface("Bravura", MockUnit(12), 1, False)
+        rect = test_font.bounding_rect_of("\ue0a4")
+        assert test_font.bounding_rect_of("\ue0a4") is rect
+        assert test_font.bounding_rect_of("\ue0a3") is not rect
+
+
+class TestFontInterfaceHeadless(unittest.TestCase):
+    def setUp(self):
+        neoscore.setup(headless=True)
+
+    def test_metrics_available_without_view(self):
+        test_font = FontInterface("Bravura", MockUnit(12), 1, False)
+        assert test_font.ascent > Unit(0)
+        assert test_font.descent > Unit(0)
+        assert test_font.bounding_rect_of("\ue0a4").width > Unit(0)
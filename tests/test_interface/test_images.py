@@ -0,0 +1,23 @@
+import io
+import unittest
+
+from PyQt5.QtGui import QImage
+
+from neoscore.interface.images import PngStreamWriter
+
+
+class TestPngStreamWriter(unittest.TestCase):
+    def test_round_trip(self):
+        width, height = 3, 4
+        pixels = bytes(range(width * height * 4))
+        output = io.BytesIO()
+        writer = PngStreamWriter(output, width, height, 5000)
+        writer.write_rows(pixels[: width * 4])
+        writer.write_rows(pixels[width * 4 :])
+        writer.close()
+        image = QImage.fromData(output.getvalue(), "PNG")
+        assert image.width() == width
+        assert image.height() == height
+        assert image.dotsPerMeterX() == 5000
+        rgba_image = image.convertToFormat(QImage.Format_RGBA8888)
+        assert rgba_image.constBits().asstring(rgba_image.sizeInBytes()) == pixels
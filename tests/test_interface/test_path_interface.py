@@ -109,3 +109,46 @@ class TestPathInterface(unittest.TestCase):
         assert el_3.y == 6
         assert qt_path.currentPosition().x() == 5
         assert qt_path.currentPosition().y() == 6
+
+    def test_render_adds_qt_object_to_scene(self):
+        test_path = PathInterface(
+            Point(Unit(5), Unit(6)),
+            self.pen,
+            self.brush,
+            [ResolvedLineTo(Unit(10), Unit(12))],
+        )
+        test_path.render()
+        assert test_path.qt_object.scene() == neoscore._app_interface.scene
+
+    def test_render_with_previous_updates_qt_object_in_place(self):
+        previous = PathInterface(
+            Point(Unit(5), Unit(6)),
+            self.pen,
+            self.brush,
+            [ResolvedLineTo(Unit(10), Unit(12))],
+        )
+        previous.render()
+        qt_object = previous.qt_object
+        test_path = PathInterface(
+            Point(Unit(7), Unit(8)),
+            self.pen,
+            self.brush,
+            [ResolvedLineTo(Unit(20), Unit(22))],
+            Unit(1),
+            Unit(2),
+        )
+        test_path.render(previous)
+        assert test_path.qt_object is qt_object
+        assert previous.qt_object is None
+        assert qt_object.pos().x() == 7
+        assert qt_object.path().elementAt(1).x == 20
+        assert qt_object.clip_start_x == 1
+        assert qt_object.clip_width == 2
+
+    def test_remove(self):
+        test_path = PathInterface(Point(Unit(5), Unit(6)), self.pen, self.brush, [])
+        test_path.render()
+        qt_object = test_path.qt_object
+        test_path.remove()
+        assert test_path.qt_object is None
+        assert qt_object.scene() is None
@@ -0,0 +1,150 @@
+import io
+import re
+import unittest
+import zlib
+
+from neoscore.core import neoscore
+from neoscore.core.brush_pattern import BrushPattern
+from neoscore.core.pen import NO_PEN
+from neoscore.core.pen_cap_style import PenCapStyle
+from neoscore.core.pen_join_style import PenJoinStyle
+from neoscore.core.pen_pattern import PenPattern
+from neoscore.interface.brush_interface import BrushInterface
+from neoscore.interface.font_interface import FontInterface
+from neoscore.interface.path_interface import (
+    PathInterface,
+    ResolvedLineTo,
+    ResolvedMoveTo,
+)
+from neoscore.interface.pdf_export import PdfWriter
+from neoscore.interface.pdf_merging import _QtPdf
+from neoscore.interface.pen_interface import PenInterface
+from neoscore.interface.text_interface import TextInterface
+from neoscore.utils.color import Color
+from neoscore.utils.point import Point
+from neoscore.utils.rect import Rect
+from neoscore.utils.units import Inch, Unit
+
+_STREAM_RE = re.compile(rb"stream\n(.*)\nendstream", re.DOTALL)
+
+
+def _stream_content(body: bytes) -> bytes:
+    return zlib.decompress(_STREAM_RE.search(body).group(1))
+
+
+class TestPdfWriter(unittest.TestCase):
+    def setUp(self):
+        neoscore.setup()
+        self.pen = PenInterface(
+            Color(0, 0, 255, 128),
+            Unit(2),
+            PenPattern.DASH,
+            PenJoinStyle.ROUND,
+            PenCapStyle.FLAT,
+        )
+        self.brush = BrushInterface(Color("#ff0000"), BrushPattern.SOLID)
+        self.font = FontInterface("Bravura", Unit(12), 1, False)
+
+    def write(self, pages) -> _QtPdf:
+        output = io.BytesIO()
+        writer = PdfWriter(output)
+        for interfaces in pages:
+            writer.begin_page(Rect(Unit(10), Unit(20), Inch(2), Inch(3)))
+            writer.write_all(interfaces)
+            writer.end_page()
+        writer.close()
+        return _QtPdf(output.getvalue())
+
+    def page_content(self, pdf: _QtPdf, index: int) -> bytes:
+        page = pdf.objects[pdf.page_ids[index]]
+        content_id = int(re.search(rb"/Contents (\d+) 0 R", page).group(1))
+        return _stream_content(pdf.objects[content_id])
+
+    def text(self, text, pos, scale=1):
+        return TextInterface(pos, NO_PEN.interface, self.brush, text, self.font, scale)
+
+    def test_pages(self):
+        pdf = self.write([[], []])
+        assert len(pdf.page_ids) == 2
+        assert b"/MediaBox [0 0 144 216]" in pdf.objects[pdf.page_ids[0]]
+        content = self.page_content(pdf, 0)
+        assert content.startswith(b"0.24 0 0 -0.24 -2.4 220.8 cm")
+
+    def test_path(self):
+        path = PathInterface(
+            Point(Unit(5), Unit(6.5)),
+            self.pen,
+            self.brush,
+            [ResolvedMoveTo(Unit(0), Unit(0)), ResolvedLineTo(Unit(10), Unit(-1.25))],
+        )
+        pdf = self.write([[path]])
+        content = self.page_content(pdf, 0)
+        assert b"1 0 0 1 5 6.5 cm\n0 0 m\n10 -1.25 l\nB*\n" in content
+        assert b"0 0 1 RG\n2 w\n0 J\n1 j\n" in content
+        assert b"[8 4] 0 d" in content
+        assert b"1 0 0 rg" in content
+        graphics_state = re.search(rb"/(G\d+) gs", content).group(1)
+        resources = pdf.objects[3]
+        assert b"/%s << /CA 0.502 /ca 1 >>" % graphics_state in resources
+
+    def test_repeated_text_is_written_once(self):
+        pdf = self.write(
+            [
+                [
+                    self.text("abc", Point(Unit(1), Unit(2))),
+                    self.text("abc", Point(Unit(3), Unit(4)), scale=2),
+                    self.text("xyz", Point(Unit(5), Unit(6))),
+                ],
+                [self.text("abc", Point(Unit(1), Unit(2)))],
+            ]
+        )
+        forms = [
+            obj_id for obj_id, body in pdf.objects.items() if b"/Subtype /Form" in body
+        ]
+        assert len(forms) == 2
+        first_page = self.page_content(pdf, 0)
+        uses = re.findall(rb"/(F\d+) Do", first_page)
+        assert len(uses) == 3
+        assert uses[0] == uses[1] != uses[2]
+        assert b"2 0 0 2 0 0 cm" in first_page
+        assert re.findall(rb"/(F\d+) Do", self.page_content(pdf, 1)) == uses[:1]
+
+    def test_clipped_path(self):
+        path = PathInterface(
+            Point(Unit(0), Unit(0)),
+            self.pen,
+            self.brush,
+            [ResolvedLineTo(Unit(100), Unit(10))],
+            Unit(20),
+            Unit(30),
+        )
+        content = self.page_content(self.write([[path]]), 0)
+        # Clipping is offset by the clip start, padded by the pen width
+        assert b"1 0 0 1 -20 0 cm\n18 -2 34 14 re W n\n" in content
+
+    def test_text_regenerated_at_another_size_is_written_again(self):
+        stats = neoscore.cache_stats()["text_paths"]
+        self.addCleanup(
+            neoscore.configure_cache, "text_paths", stats.max_entries, stats.max_cost
+        )
+        neoscore.configure_cache("text_paths", max_entries=1)
+        large_font = FontInterface("Bravura", Unit(48), 1, False)
+        large = TextInterface(
+            Point(Unit(3), Unit(4)), NO_PEN.interface, self.brush, "evicted", large_font
+        )
+        pdf = self.write(
+            [
+                [
+                    self.text("evicted", Point(Unit(1), Unit(2))),
+                    self.text("other", Point(Unit(1), Unit(2))),
+                    large,
+                    self.text("other", Point(Unit(1), Unit(2))),
+                    self.text("evicted", Point(Unit(5), Unit(6))),
+                ]
+            ]
+        )
+        uses = re.findall(rb"/(F\d+) Do", self.page_content(pdf, 0))
+        assert len(set(uses)) == 3
+        assert uses[0] == uses[4] != uses[2]
+        assert uses[1] == uses[3]
+        assert b" 0 0 cm" not in self.page_content(pdf, 0)
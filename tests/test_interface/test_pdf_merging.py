@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+
+import pytest
+
+from neoscore.core import neoscore
+from neoscore.core.text import Text
+from neoscore.interface.pdf_merging import _QtPdf, merge_pdfs
+from neoscore.utils.units import Mm
+
+
+def _page_count(path):
+    with open(path, "rb") as pdf_file:
+        return len(_QtPdf(pdf_file.read()).page_ids)
+
+
+class TestPdfMerging(unittest.TestCase):
+    def setUp(self):
+        neoscore.setup()
+        self.output_dir = tempfile.mkdtemp()
+
+    def _render_pdf(self, name, page_count):
+        neoscore.reset_document()
+        for i in range(page_count):
+            Text((Mm(0), Mm(0)), str(i), parent=neoscore.document.pages[i])
+        path = os.path.join(self.output_dir, name)
+        neoscore.render_pdf(path)
+        return path
+
+    def test_render_pdf_page_count(self):
+        path = self._render_pdf("one.pdf", 1)
+        assert _page_count(path) == 1
+
+    def test_merge_pdfs(self):
+        paths = [self._render_pdf("a.pdf", 2), self._render_pdf("b.pdf", 3)]
+        merged_path = os.path.join(self.output_dir, "merged.pdf")
+        merge_pdfs(paths, merged_path)
+        with open(merged_path, "rb") as pdf_file:
+            merged = _QtPdf(pdf_file.read())
+        assert len(merged.page_ids) == 5
+        for page_id in merged.page_ids:
+            assert b"/Parent %d 0 R" % merged.pages_id in merged.objects[page_id]
+        assert merged.info_id is not None
+
+    def test_merge_pdfs_rejects_unsupported_files(self):
+        path = os.path.join(self.output_dir, "bad.pdf")
+        with open(path, "wb") as bad_file:
+            bad_file.write(b"%PDF-1.5\nnot a qt pdf\n%%EOF\n")
+        with pytest.raises(ValueError):
+            merge_pdfs([path], os.path.join(self.output_dir, "out.pdf"))
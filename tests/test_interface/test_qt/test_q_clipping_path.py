@@ -49,3 +49,20 @@ class TestQClippingPath(unittest.TestCase):
         assert result_rect.y() == painter_path.boundingRect().y()
         assert result_rect.width() == 30
         assert result_rect.height() == painter_path.boundingRect().height()
+
+    def test_update_geometry_pads_by_pen_width_by_default(self):
+        painter_path = QtGui.QPainterPath()
+        painter_path.lineTo(100, 200)
+        item = QClippingPath(painter_path, None, None)
+        item.setPen(QtGui.QPen(QtGui.QColor("#000000"), 3))
+        item.update_geometry()
+        assert item.clip_rect.width() == 106
+
+    def test_update_geometry_with_explicit_padding(self):
+        painter_path = QtGui.QPainterPath()
+        painter_path.lineTo(100, 200)
+        item = QClippingPath(painter_path, None, None, 1)
+        item.setPen(QtGui.QPen(QtGui.QColor("#000000"), 3))
+        item.update_geometry()
+        assert item.clip_rect.width() == 102
+        assert item.boundingRect().width() == 102
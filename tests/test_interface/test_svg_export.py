@@ -0,0 +1,166 @@
+import io
+import unittest
+from xml.etree import ElementTree
+
+from neoscore.core import neoscore
+from neoscore.core.brush_pattern import BrushPattern
+from neoscore.core.pen import NO_PEN
+from neoscore.core.pen_cap_style import PenCapStyle
+from neoscore.core.pen_join_style import PenJoinStyle
+from neoscore.core.pen_pattern import PenPattern
+from neoscore.interface.brush_interface import BrushInterface
+from neoscore.interface.font_interface import FontInterface
+from neoscore.interface.path_interface import (
+    PathInterface,
+    ResolvedCurveTo,
+    ResolvedLineTo,
+    ResolvedMoveTo,
+)
+from neoscore.interface.pen_interface import PenInterface
+from neoscore.interface.svg_export import SvgWriter
+from neoscore.interface.text_interface import TextInterface
+from neoscore.utils.color import Color
+from neoscore.utils.point import Point
+from neoscore.utils.rect import Rect
+from neoscore.utils.units import Unit
+
+_SVG = "{http://www.w3.org/2000/svg}"
+_HREF = "{http://www.w3.org/1999/xlink}href"
+
+
+class TestSvgWriter(unittest.TestCase):
+    def setUp(self):
+        neoscore.setup()
+        self.pen = PenInterface(
+            Color("#0000ff"),
+            Unit(2),
+            PenPattern.DASH,
+            PenJoinStyle.ROUND,
+            PenCapStyle.FLAT,
+        )
+        self.brush = BrushInterface(Color(255, 0, 0, 128), BrushPattern.SOLID)
+        self.font = FontInterface("Bravura", Unit(12), 1, False)
+
+    def write(self, interfaces) -> ElementTree.Element:
+        output = io.StringIO()
+        writer = SvgWriter(output, Rect(Unit(10), Unit(20), Unit(300), Unit(600)))
+        writer.write_all(interfaces)
+        writer.close()
+        return ElementTree.fromstring(output.getvalue())
+
+    def text(self, text, pos, scale=1, clip_start_x=None, clip_width=None):
+        return TextInterface(
+            pos,
+            NO_PEN.interface,
+            self.brush,
+            text,
+            self.font,
+            scale,
+            clip_start_x,
+            clip_width,
+        )
+
+    def test_document_size(self):
+        root = self.write([])
+        assert root.tag == _SVG + "svg"
+        # Document units are 1/300 inch
+        assert root.get("width") == "72pt"
+        assert root.get("height") == "144pt"
+        assert root.get("viewBox") == "10 20 300 600"
+
+    def test_path(self):
+        path = PathInterface(
+            Point(Unit(5), Unit(6.5)),
+            self.pen,
+            self.brush,
+            [
+                ResolvedMoveTo(Unit(0), Unit(0)),
+                ResolvedLineTo(Unit(10), Unit(-1.25)),
+                ResolvedCurveTo(Unit(1), Unit(2), Unit(3), Unit(4), Unit(5), Unit(6)),
+            ],
+        )
+        root = self.write([path])
+        element = root.find(_SVG + "path")
+        assert element.get("d") == "M0 0L10 -1.25C1 2 3 4 5 6"
+        assert element.get("transform") == "translate(5 6.5)"
+        assert element.get("stroke") == "#0000ff"
+        assert element.get("stroke-width") == "2"
+        assert element.get("stroke-dasharray") == "8 4"
+        assert element.get("stroke-linecap") == "butt"
+        assert element.get("stroke-linejoin") == "round"
+        assert element.get("fill") == "#ff0000"
+        assert element.get("fill-opacity") == "0.502"
+
+    def test_repeated_text_is_defined_once(self):
+        root = self.write(
+            [
+                self.text("abc", Point(Unit(1), Unit(2))),
+                self.text("abc", Point(Unit(3), Unit(4)), scale=2),
+                self.text("xyz", Point(Unit(5), Unit(6))),
+            ]
+        )
+        definitions = root.findall(f"{_SVG}defs/{_SVG}path")
+        assert len(definitions) == 2
+        uses = root.findall(_SVG + "use")
+        assert [use.get(_HREF) for use in uses] == ["#g0", "#g0", "#g1"]
+        assert uses[0].get("transform") == "translate(1 2)"
+        assert uses[1].get("transform") == "translate(3 4) scale(2)"
+        assert uses[0].get("stroke") == "none"
+
+    def test_clipped_text(self):
+        root = self.write(
+            [self.text("abc", Point(Unit(1), Unit(2)), clip_start_x=Unit(3))]
+        )
+        group = root.find(_SVG + "g")
+        assert group.get("transform") == "translate(1 2) translate(-3 0)"
+        clip_path = group.find(_SVG + "clipPath")
+        assert clip_path.find(_SVG + "rect") is not None
+        use = group.find(_SVG + "use")
+        assert use.get("clip-path") == f"url(#{clip_path.get('id')})"
+
+    def test_cosmetic_pen(self):
+        pen = PenInterface(
+            Color("#000000"),
+            Unit(0),
+            PenPattern.SOLID,
+            PenJoinStyle.BEVEL,
+            PenCapStyle.SQUARE,
+        )
+        path = PathInterface(
+            Point(Unit(0), Unit(0)),
+            pen,
+            BrushInterface(Color("#000000"), BrushPattern.NO_BRUSH),
+            [ResolvedLineTo(Unit(10), Unit(0))],
+        )
+        element = self.write([path]).find(_SVG + "path")
+        assert element.get("vector-effect") == "non-scaling-stroke"
+        assert element.get("stroke-dasharray") is None
+        assert element.get("fill") == "none"
+
+    def test_text_regenerated_at_another_size_is_defined_again(self):
+        stats = neoscore.cache_stats()["text_paths"]
+        self.addCleanup(
+            neoscore.configure_cache, "text_paths", stats.max_entries, stats.max_cost
+        )
+        neoscore.configure_cache("text_paths", max_entries=1)
+        large_font = FontInterface("Bravura", Unit(48), 1, False)
+        large = TextInterface(
+            Point(Unit(3), Unit(4)), NO_PEN.interface, self.brush, "evicted", large_font
+        )
+        root = self.write(
+            [
+                self.text("evicted", Point(Unit(1), Unit(2))),
+                self.text("other", Point(Unit(1), Unit(2))),
+                large,
+                self.text("other", Point(Unit(1), Unit(2))),
+                self.text("evicted", Point(Unit(5), Unit(6))),
+            ]
+        )
+        uses = root.findall(_SVG + "use")
+        assert [use.get(_HREF) for use in uses] == ["#g0", "#g1", "#g2", "#g1", "#g0"]
+        # Each outline is drawn relative to the size it was generated at
+        assert [use.get("transform") for use in uses[::2]] == [
+            "translate(1 2)",
+            "translate(3 4)",
+            "translate(5 6)",
+        ]
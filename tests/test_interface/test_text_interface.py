@@ -1,8 +1,9 @@
+import dataclasses
 import unittest
 
 from neoscore.core import neoscore
 from neoscore.core.brush_pattern import BrushPattern
-from neoscore.core.pen import NO_PEN
+from neoscore.core.pen import NO_PEN, Pen
 from neoscore.interface.brush_interface import BrushInterface
 from neoscore.interface.font_interface import FontInterface
 from neoscore.interface.text_interface import TextInterface
@@ -40,3 +41,70 @@ class TestTextInterface(unittest.TestCase):
         assert test_qt_object_1.path() == test_qt_object_2.path()
         assert test_qt_object_1.scale() == 1
         assert test_qt_object_2.scale() == 2
+
+    def test_render_with_previous_updates_qt_object_in_place(self):
+        font = FontInterface("Bravura", Unit(12), 1, False)
+        previous = TextInterface(
+            Point(Unit(5), Unit(6)), NO_PEN.interface, self.brush, "testing", font
+        )
+        previous.render()
+        qt_object = previous.qt_object
+        test_object = TextInterface(
+            Point(Unit(7), Unit(8)),
+            NO_PEN.interface,
+            self.brush,
+            "testing",
+            font,
+            scale=2,
+        )
+        test_object.render(previous)
+        assert test_object.qt_object is qt_object
+        assert previous.qt_object is None
+        assert qt_object.pos().x() == 7
+        assert qt_object.scale() == 2
+
+    def test_render_with_previous_matches_fresh_qt_object(self):
+        font = FontInterface("Bravura", Unit(12), 1, False)
+        previous = TextInterface(
+            Point(Unit(5), Unit(6)), NO_PEN.interface, self.brush, "testing", font
+        )
+        previous.render()
+        changes = [
+            {"text": "other text"},
+            {"font": FontInterface("Bravura", Unit(20), 1, False)},
+            {"pen": Pen(thickness=Unit(3)).interface},
+            {"clip_start_x": Unit(10), "clip_width": Unit(20)},
+        ]
+        for change in changes:
+            updated = dataclasses.replace(previous, **change)
+            updated.render(previous)
+            fresh = dataclasses.replace(previous, **change)
+            fresh.render()
+            assert updated.qt_object.boundingRect() == fresh.qt_object.boundingRect()
+            assert updated.qt_object.clip_rect == fresh.qt_object.clip_rect
+            assert updated.qt_object.pen() == fresh.qt_object.pen()
+            fresh.remove()
+            previous = updated
+
+    def test_outline(self):
+        small = TextInterface(
+            Point(Unit(5), Unit(6)),
+            NO_PEN.interface,
+            self.brush,
+            "outline test",
+            FontInterface("Bravura", Unit(12), 1, False),
+        )
+        large = TextInterface(
+            Point(Unit(5), Unit(6)),
+            NO_PEN.interface,
+            self.brush,
+            "outline test",
+            FontInterface("Bravura", Unit(24), 1, False),
+            scale=3,
+        )
+        small_outline = small.outline()
+        large_outline = large.outline()
+        assert large_outline.path == small_outline.path
+        assert small_outline.scale == 1
+        assert large_outline.scale == 6
+        assert large_outline.generation_font_size == small_outline.generation_font_size
@@ -0,0 +1,75 @@
+import unittest
+
+from PyQt5.QtGui import QPainterPath
+
+from neoscore.core import neoscore
+from neoscore.core.brush_pattern import BrushPattern
+from neoscore.core.pen_cap_style import PenCapStyle
+from neoscore.core.pen_join_style import PenJoinStyle
+from neoscore.core.pen_pattern import PenPattern
+from neoscore.interface.brush_interface import BrushInterface
+from neoscore.interface.path_interface import PathInterface, ResolvedLineTo
+from neoscore.interface.pen_interface import PenInterface
+from neoscore.interface.vector_export_common import (
+    CURVE_TO,
+    LINE_TO,
+    MOVE_TO,
+    clip_geometry,
+    format_number,
+    path_segments,
+)
+from neoscore.utils.color import Color
+from neoscore.utils.point import Point
+from neoscore.utils.units import Unit
+
+
+class TestVectorExportCommon(unittest.TestCase):
+    def setUp(self):
+        neoscore.setup()
+
+    def path(self, clip_start_x=None, clip_width=None):
+        return PathInterface(
+            Point(Unit(0), Unit(0)),
+            PenInterface(
+                Color("#000000"),
+                Unit(2),
+                PenPattern.SOLID,
+                PenJoinStyle.BEVEL,
+                PenCapStyle.SQUARE,
+            ),
+            BrushInterface(Color("#000000"), BrushPattern.SOLID),
+            [ResolvedLineTo(Unit(100), Unit(10))],
+            clip_start_x,
+            clip_width,
+        )
+
+    def test_format_number(self):
+        assert format_number(1.0) == "1"
+        assert format_number(-1.25) == "-1.25"
+        assert format_number(1 / 3) == "0.333"
+        assert format_number(-0.0001) == "0"
+
+    def test_path_segments(self):
+        qt_path = QPainterPath()
+        qt_path.moveTo(1, 2)
+        qt_path.lineTo(3, 4)
+        qt_path.cubicTo(5, 6, 7, 8, 9, 10)
+        assert list(path_segments(qt_path)) == [
+            (MOVE_TO, (1, 2)),
+            (LINE_TO, (3, 4)),
+            (CURVE_TO, (5, 6, 7, 8, 9, 10)),
+        ]
+
+    def test_clip_geometry_without_clipping(self):
+        path = self.path()
+        assert clip_geometry(path, PathInterface.create_qt_path(path.elements)) is None
+
+    def test_clip_geometry(self):
+        path = self.path(Unit(20), Unit(30))
+        offset, clip_rect = clip_geometry(
+            path, PathInterface.create_qt_path(path.elements)
+        )
+        assert offset == -20
+        # Padded by the pen width
+        assert (clip_rect.x(), clip_rect.y()) == (18, -2)
+        assert (clip_rect.width(), clip_rect.height()) == (34, 14)
@@ -0,0 +1,75 @@
+import json
+import os
+import tempfile
+import unittest
+
+from neoscore import constants
+from neoscore.utils import json_cache
+
+
+class TestJsonCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "data.json")
+        self._write({"a": [1, 2, {"b": "c"}]})
+        # Treat the temporary directory as the bundled resources
+        original_cached_dir = json_cache._CACHED_DIR
+        json_cache._CACHED_DIR = self.temp_dir.name
+        self.addCleanup(setattr, json_cache, "_CACHED_DIR", original_cached_dir)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, data, mtime_ns=None):
+        with open(self.path, "w") as json_file:
+            json.dump(data, json_file)
+        if mtime_ns is not None:
+            os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_load_writes_cache(self):
+        assert json_cache.load_json(self.path) == {"a": [1, 2, {"b": "c"}]}
+        assert os.path.exists(json_cache.cache_path(self.path))
+
+    def test_load_uses_cache(self):
+        json_cache.load_json(self.path)
+        with open(self.path, "r+") as json_file:
+            # Corrupt the JSON without changing its size or mtime
+            stat = os.stat(self.path)
+            json_file.write("#")
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert json_cache.load_json(self.path) == {"a": [1, 2, {"b": "c"}]}
+
+    def test_modified_file_invalidates_cache(self):
+        self._write([1], mtime_ns=1_000_000_000)
+        json_cache.load_json(self.path)
+        self._write([2], mtime_ns=2_000_000_000)
+        assert json_cache.load_json(self.path) == [2]
+
+    def test_corrupt_cache_is_ignored(self):
+        with open(json_cache.cache_path(self.path), "wb") as cache_file:
+            cache_file.write(b"not a cache")
+        assert json_cache.load_json(self.path) == {"a": [1, 2, {"b": "c"}]}
+
+    def test_invalid_json_raises(self):
+        with open(self.path, "w") as json_file:
+            json_file.write("{")
+        with self.assertRaises(json.JSONDecodeError):
+            json_cache.load_json(self.path)
+
+    def test_missing_file_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            json_cache.load_json(os.path.join(self.temp_dir.name, "missing.json"))
+
+    def test_files_outside_resources_are_not_cached(self):
+        other_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(other_dir.cleanup)
+        path = os.path.join(other_dir.name, "data.json")
+        with open(path, "w") as json_file:
+            json.dump([1, 2], json_file)
+        assert json_cache.load_json(path) == [1, 2]
+        assert os.listdir(other_dir.name) == ["data.json"]
+
+    def test_bundled_resources_are_cached(self):
+        json_cache._CACHED_DIR = constants.RESOURCES_DIR
+        path = constants.DEFAULT_MUSIC_FONT_METADATA_PATH
+        assert json_cache._is_cached_file(path)
@@ -0,0 +1,79 @@
+import unittest
+
+from neoscore.utils.lru_cache import LruCache
+
+
+class TestLruCache(unittest.TestCase):
+    def test_get_and_put(self):
+        cache = LruCache()
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert "a" in cache
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used_entries(self):
+        cache = LruCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.stats().evictions == 1
+
+    def test_evicts_by_cost(self):
+        cache = LruCache(max_cost=10, cost_func=len)
+        cache.put("a", "xxxx")
+        cache.put("b", "xxxx")
+        cache.put("c", "xxxx")
+        assert "a" not in cache
+        assert cache.stats().cost == 8
+
+    def test_skips_values_over_cost_budget(self):
+        cache = LruCache(max_cost=3, cost_func=len)
+        cache.put("a", "xx")
+        cache.put("b", "xxxx")
+        assert "a" in cache
+        assert "b" not in cache
+
+    def test_replacing_value_updates_cost(self):
+        cache = LruCache(cost_func=len)
+        cache.put("a", "xxxx")
+        cache.put("a", "x")
+        assert cache.stats().cost == 1
+        assert len(cache) == 1
+
+    def test_configure_evicts_immediately(self):
+        cache = LruCache()
+        for i in range(5):
+            cache.put(i, i)
+        cache.configure(2, None)
+        assert len(cache) == 2
+        assert 3 in cache and 4 in cache
+
+    def test_stats(self):
+        cache = LruCache(max_entries=1, max_cost=100)
+        cache.get("a")
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("a")
+        cache.put("b", 2)
+        stats = cache.stats()
+        assert stats.hits == 2
+        assert stats.misses == 1
+        assert stats.evictions == 1
+        assert stats.entries == 1
+        assert stats.max_entries == 1
+        assert stats.max_cost == 100
+        assert stats.hit_rate == 2 / 3
+        cache.reset_stats()
+        assert cache.stats().hits == 0
+
+    def test_clear(self):
+        cache = LruCache(cost_func=len)
+        cache.put("a", "xx")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats().cost == 0
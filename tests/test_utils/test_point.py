@@ -2,7 +2,7 @@ import unittest
 
 import pytest
 
-from neoscore.utils.point import Point
+from neoscore.utils.point import Point, PointAccumulator
 from neoscore.utils.units import Mm, Unit
 
 
@@ -51,3 +51,44 @@ class TestPoint(unittest.TestCase):
         assert isinstance(converted.x, Mm)
         assert isinstance(converted.y, Mm)
         assert original == converted
+
+
+class TestPointAccumulator(unittest.TestCase):
+    def test_to_point_without_changes_returns_start(self):
+        start = Point(Mm(1), Mm(2))
+        assert PointAccumulator(start).to_point() is start
+
+    def test_add_and_sub(self):
+        acc = PointAccumulator(Point(Mm(1), Unit(2)))
+        acc.add(Point(Unit(3), Mm(4)))
+        acc.sub(Point(Mm(1), Unit(1)))
+        result = acc.to_point()
+        assert result == Point(Mm(1), Unit(2)) + Point(Unit(3), Mm(4)) - Point(
+            Mm(1), Unit(1)
+        )
+        # Unit types are taken from the starting point
+        assert type(result.x) == Mm
+        assert type(result.y) == Unit
+
+    def test_to_point_is_reused_until_changed(self):
+        acc = PointAccumulator(Point(Mm(1), Mm(2)))
+        acc.add(Point(Mm(1), Mm(1)))
+        result = acc.to_point()
+        assert acc.to_point() is result
+        acc.add(Point(Mm(1), Mm(1)))
+        assert acc.to_point() == Point(Mm(3), Mm(4))
+
+    def test_copy_is_independent(self):
+        acc = PointAccumulator(Point(Mm(1), Mm(2)))
+        copy = acc.copy()
+        copy.add(Point(Mm(1), Mm(1)))
+        assert acc.to_point() == Point(Mm(1), Mm(2))
+        assert copy.to_point() == Point(Mm(2), Mm(3))
+
+    def test_difference(self):
+        acc = PointAccumulator(Point(Mm(5), Unit(6)))
+        other = PointAccumulator(Point(Unit(1), Mm(2)))
+        result = acc.difference(other)
+        assert result == Point(Mm(5), Unit(6)) - Point(Unit(1), Mm(2))
+        assert type(result.x) == Mm
+        assert type(result.y) == Unit
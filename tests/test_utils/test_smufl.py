@@ -59,3 +59,12 @@ def test_get_glyph_classes():
     }
     result_match = smufl.get_glyph_classes("accidentalFlat")
     assert result_match == expected_match
+
+
+def test_get_glyph_classes_for_glyph_in_no_class():
+    assert smufl.get_glyph_classes("nonexistent name") == set()
+
+
+def test_get_glyph_classes_returns_independent_sets():
+    smufl.get_glyph_classes("accidentalFlat").add("modified")
+    assert "modified" not in smufl.get_glyph_classes("accidentalFlat")